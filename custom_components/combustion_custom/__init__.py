@@ -1,18 +1,57 @@
-from datetime import timedelta
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import importlib
 import logging
 import asyncio
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
 from homeassistant import config_entries, core
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import ServiceCall, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
 
-from .meatnet import MeatNetManager
-from .const import DOMAIN, EVENT_REFRESH
+from .combustion_ble.session_export import FORMAT_CSV, FORMATS, sequence_range, write_session
+from .const import DOMAIN, EVENT_REFRESH, SERVICE_EXPORT, SERVICE_HISTORY, SERVICE_PROFILE
+from .profiler import PipelineProfiler
+from .recorder_statistics import StatisticsImporter
+
+if TYPE_CHECKING:
+    from .combustion_ble.probe_temperature_log import ProbeTemperatureLog
+    from .meatnet import MeatNetManager
 
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=5)
 PLATFORMS = ["sensor"]
 
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("duration", default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=PipelineProfiler.MAX_DURATION_SECONDS)
+        ),
+    }
+)
+
+HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required("serial_number"): vol.All(cv.string, vol.Upper),
+        vol.Optional("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("resolution", default=timedelta(minutes=1)): cv.time_period,
+    }
+)
+
+EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Optional("serial_number"): vol.All(cv.string, vol.Upper),
+        vol.Optional("format", default=FORMAT_CSV): vol.In(FORMATS),
+    }
+)
+
 globalMgr: MeatNetManager
 
 
@@ -27,7 +66,100 @@ async def async_setup(hass: core.HomeAssistant, config: dict) -> bool:
             async_dispatcher_send(hass, EVENT_REFRESH)
 
         # register scan interval for ArloHub
-        async_track_time_interval(hass, hub_refresh, SCAN_INTERVAL)
+        async_track_time_interval(hass, hub_refresh, SCAN_INTERVAL, cancel_on_shutdown=True)
+
+        importer = StatisticsImporter(hass)
+        async_track_time_interval(
+            hass, importer.async_run, StatisticsImporter.INTERVAL, cancel_on_shutdown=True
+        )
+
+        profiler = PipelineProfiler(hass)
+
+        async def profile(call: ServiceCall):
+            if profiler.running:
+                raise HomeAssistantError("A profiling run is already in progress")
+            report = await profiler.async_profile(call.data["duration"])
+            return report if call.return_response else None
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PROFILE,
+            profile,
+            schema=PROFILE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+        async def history(call: ServiceCall):
+            serial_number = call.data["serial_number"]
+            probe = _find_probe(hass, serial_number)
+            log = probe.temperature_log
+            if log is None:
+                return {"serial_number": serial_number, "session_id": None, "points": []}
+
+            end = _naive_local(call.data.get("end")) or datetime.now()
+            start = _naive_local(call.data.get("start")) or log.start_time or end
+            points = log.history_in_range(start, end, call.data["resolution"])
+            return {
+                "serial_number": serial_number,
+                "session_id": log.id,
+                "points": [
+                    {
+                        "time": time.astimezone().isoformat(),
+                        "seconds": point.samples * log.history.sample_period,
+                        "min": round(point.minimum, 2),
+                        "max": round(point.maximum, 2),
+                        "mean": round(point.mean, 2),
+                    }
+                    for time, point in points
+                ],
+            }
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_HISTORY,
+            history,
+            schema=HISTORY_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+        async def export(call: ServiceCall):
+            if "serial_number" in call.data:
+                probes = [_find_probe(hass, call.data["serial_number"])]
+            else:
+                mgr = hass.data.get(DOMAIN, {}).get("mgr")
+                probes = mgr.deviceManager.get_probes() if mgr else []
+            export_format = call.data["format"]
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            files = []
+            for probe in probes:
+                log = probe.temperature_log
+                # Take the range on the loop; the executor then only does point lookups.
+                if log is None or (bounds := sequence_range(log)) is None:
+                    continue
+                path = hass.config.path(
+                    f"combustion_export_{probe.serial_number_string}_{log.id:08X}_{stamp}"
+                    f".{export_format}"
+                )
+                records = await hass.async_add_executor_job(
+                    _write_export, log, path, export_format, *bounds
+                )
+                files.append(
+                    {
+                        "serial_number": probe.serial_number_string,
+                        "session_id": log.id,
+                        "file": path,
+                        "records": records,
+                    }
+                )
+            return {"files": files} if call.return_response else None
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_EXPORT,
+            export,
+            schema=EXPORT_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
     except Exception as e:
         _LOGGER.error("Error setting up Combustion Inc Custom component: %s", str(e))
         return False
@@ -35,10 +167,39 @@ async def async_setup(hass: core.HomeAssistant, config: dict) -> bool:
     return True
 
 
+def _find_probe(hass: core.HomeAssistant, serial_number: str):
+    mgr = hass.data.get(DOMAIN, {}).get("mgr")
+    try:
+        probe = mgr and mgr.deviceManager.find_probe_by_serial_number(int(serial_number, 16))
+    except ValueError:
+        probe = None
+    if not probe:
+        raise HomeAssistantError(f"Unknown probe {serial_number}")
+    return probe
+
+
+def _write_export(
+    log: ProbeTemperatureLog, path: str, export_format: str, first: int, last: int
+) -> int:
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        return write_session(log, file, export_format, first, last)
+
+
+def _naive_local(value: datetime | None) -> datetime | None:
+    """Probe logs keep naive local times (datetime.now()); convert service input to match."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
 async def async_setup_entry(hass: core.HomeAssistant, entry: config_entries.ConfigEntry) -> bool:
 
     try:
-        mgr = MeatNetManager(hass)
+        # The BLE stack is only needed once there is an entry; import it off the event loop.
+        meatnet = await hass.async_add_import_executor_job(
+            importlib.import_module, ".meatnet", __package__
+        )
+        mgr = meatnet.MeatNetManager(hass, entry.data)
         await mgr.async_start()
 
         global globalMgr
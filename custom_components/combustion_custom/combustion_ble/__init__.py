@@ -2,12 +2,18 @@
 
 """Top-level package for cobustion_ble."""
 
+from typing import TYPE_CHECKING
+
 from .ble_data import __all__ as all_ble
-from .ble_manager import BluetoothMode
-from .device_manager import DeviceManager
-from .devices.probe import VirtualTemperatures
+from .utilities.lazy_import import lazy_exports
 from .version import VERSION, VERSION_SHORT
 
+if TYPE_CHECKING:
+    from .ble_data import *  # noqa: F401,F403
+    from .ble_manager import BluetoothMode
+    from .device_manager import DeviceManager
+    from .devices.probe import VirtualTemperatures
+
 __all__ = [
     "VERSION",
     "VERSION_SHORT",
@@ -17,3 +23,15 @@ __all__ = [
     "VirtualTemperatures",
     *all_ble,
 ]
+
+# DeviceManager pulls in bleak and the whole device stack: import it when first used.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "BluetoothMode": ".ble_manager",
+        "DeviceManager": ".device_manager",
+        "VirtualTemperatures": ".devices.probe",
+        **{name: ".ble_data" for name in all_ble},
+    },
+)
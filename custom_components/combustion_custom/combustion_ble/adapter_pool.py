@@ -0,0 +1,282 @@
+"""Per-adapter sightings, connection placement and health for multi-adapter setups."""
+
+import time
+from typing import Optional
+
+from bleak.backends.device import BLEDevice
+
+
+class _Sighting:
+    __slots__ = ("rssi", "seen_at", "device", "connectable")
+
+    def __init__(self, rssi: int, seen_at: float, device: BLEDevice, connectable: bool) -> None:
+        self.rssi = rssi
+        self.seen_at = seen_at
+        self.device = device
+        self.connectable = connectable
+
+
+class _Adapter:
+    __slots__ = (
+        "name",
+        "managed",
+        "max_connections",
+        "connections",
+        "advertisements",
+        "last_advertisement",
+        "consecutive_failures",
+        "healthy",
+        "unhealthy_since",
+        "failovers",
+    )
+
+    def __init__(
+        self, name: str, max_connections: Optional[int], now: float, managed: bool = False
+    ) -> None:
+        self.name = name
+        self.managed = managed
+        self.max_connections = max_connections
+        self.connections: set[str] = set()
+        self.advertisements = 0
+        self.last_advertisement = now
+        self.consecutive_failures = 0
+        self.healthy = True
+        self.unhealthy_since: Optional[float] = None
+        self.failovers = 0
+
+    @property
+    def has_free_slot(self) -> bool:
+        return self.max_connections is None or len(self.connections) < self.max_connections
+
+
+class AdapterPool:
+    """Tracks which adapters (local HCI dongles or remote proxies) hear which devices.
+
+    Every advertisement is recorded against the adapter that delivered it. Copies of the same
+    payload arriving on several adapters within MERGE_WINDOW_SECONDS are merged: only the first
+    is reported as new, and the strongest recent RSSI across adapters is reported for it.
+
+    New connections are placed on the healthy adapter with the strongest recent signal that
+    still has a free slot; sightings more than FRESH_SECONDS older than the device's newest one
+    are ignored, so an adapter that stopped hearing the device drops out before it is declared
+    unhealthy. An adapter is unhealthy when it has been silent for STALE_SECONDS
+    while another adapter kept delivering, or after MAX_CONSECUTIVE_FAILURES connect failures
+    in a row; failure-based quarantine is lifted again after RECOVERY_SECONDS.
+
+    Only adapters registered with `add` (the ones we scan on ourselves) are health checked.
+    Sources that merely appear in advertisements belong to an external Bluetooth stack, which
+    forwards each device from whichever scanner it currently prefers, so their silence says
+    nothing about their health.
+    """
+
+    MERGE_WINDOW_SECONDS = 0.2
+    SIGHTING_TTL_SECONDS = 30.0
+    FRESH_SECONDS = 5.0
+    STALE_SECONDS = 30.0
+    MAX_CONSECUTIVE_FAILURES = 3
+    RECOVERY_SECONDS = 60.0
+
+    def __init__(self) -> None:
+        self._adapters: dict[str, _Adapter] = {}
+        # identifier -> adapter name -> latest sighting
+        self._sightings: dict[str, dict[str, _Sighting]] = {}
+        # identifier -> (payload, time) of the last advertisement reported as new
+        self._last_payload: dict[str, tuple[bytes, float]] = {}
+        # identifier -> adapter holding its connection (or connect attempt)
+        self._placements: dict[str, str] = {}
+
+        self.merged = 0
+        self.placements = 0
+        self.no_placement = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._adapters)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._adapters
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._adapters)
+
+    @property
+    def capacity(self) -> Optional[int]:
+        """Total connection slots, or None when any adapter is unbounded."""
+        total = 0
+        for adapter in self._adapters.values():
+            if adapter.max_connections is None:
+                return None
+            total += adapter.max_connections
+        return total
+
+    def add(
+        self, name: str, max_connections: Optional[int] = None, now: Optional[float] = None
+    ) -> None:
+        if name not in self._adapters:
+            now = time.monotonic() if now is None else now
+            self._adapters[name] = _Adapter(name, max_connections, now, managed=True)
+            return
+        adapter = self._adapters[name]
+        adapter.managed = True
+        if max_connections is not None:
+            adapter.max_connections = max_connections
+
+    def note_advertisement(
+        self,
+        name: str,
+        identifier: str,
+        rssi: int,
+        device: BLEDevice,
+        payload: bytes,
+        connectable: bool = True,
+        now: Optional[float] = None,
+    ) -> bool:
+        """Record an advertisement. Returns False if it duplicates one just reported."""
+        now = time.monotonic() if now is None else now
+        adapter = self._adapters.get(name)
+        if adapter is None:
+            adapter = self._adapters[name] = _Adapter(name, None, now)
+        adapter.advertisements += 1
+        adapter.last_advertisement = now
+
+        sightings = self._sightings.get(identifier)
+        if sightings is None:
+            sightings = self._sightings[identifier] = {}
+        sighting = sightings.get(name)
+        if sighting is None:
+            sightings[name] = _Sighting(rssi, now, device, connectable)
+        else:
+            sighting.rssi = rssi
+            sighting.seen_at = now
+            sighting.device = device
+            sighting.connectable = connectable
+
+        last = self._last_payload.get(identifier)
+        if last is not None and last[0] == payload and now - last[1] < self.MERGE_WINDOW_SECONDS:
+            self.merged += 1
+            return False
+        self._last_payload[identifier] = (payload, now)
+        return True
+
+    def best_rssi(self, identifier: str, now: Optional[float] = None) -> Optional[int]:
+        """Strongest RSSI heard for the device by any adapter within SIGHTING_TTL_SECONDS."""
+        now = time.monotonic() if now is None else now
+        best = None
+        for sighting in self._sightings.get(identifier, {}).values():
+            if now - sighting.seen_at <= self.SIGHTING_TTL_SECONDS and (
+                best is None or sighting.rssi > best
+            ):
+                best = sighting.rssi
+        return best
+
+    def place(
+        self, identifier: str, now: Optional[float] = None
+    ) -> Optional[tuple[str, BLEDevice]]:
+        """Reserve a slot on the best adapter for a connect attempt.
+
+        Returns (adapter name, the BLEDevice as seen by that adapter), or None if no healthy
+        adapter with a free slot has heard the device recently.
+        """
+        now = time.monotonic() if now is None else now
+        self.release(identifier)
+        sightings = self._sightings.get(identifier)
+        if not sightings:
+            self.no_placement += 1
+            return None
+        newest = max(sighting.seen_at for sighting in sightings.values())
+        best: Optional[tuple[int, str, _Sighting]] = None
+        for name, sighting in sightings.items():
+            adapter = self._adapters[name]
+            if (
+                not sighting.connectable
+                or now - sighting.seen_at > self.SIGHTING_TTL_SECONDS
+                or newest - sighting.seen_at > self.FRESH_SECONDS
+                or not adapter.healthy
+                or not adapter.has_free_slot
+            ):
+                continue
+            if best is None or sighting.rssi > best[0]:
+                best = (sighting.rssi, name, sighting)
+        if best is None:
+            self.no_placement += 1
+            return None
+
+        _, name, sighting = best
+        self._adapters[name].connections.add(identifier)
+        self._placements[identifier] = name
+        self.placements += 1
+        return name, sighting.device
+
+    def adapter_for(self, identifier: str) -> Optional[str]:
+        return self._placements.get(identifier)
+
+    def connections_on(self, name: str) -> list[str]:
+        adapter = self._adapters.get(name)
+        return list(adapter.connections) if adapter else []
+
+    def note_connected(self, identifier: str) -> None:
+        if (name := self._placements.get(identifier)) is not None:
+            self._adapters[name].consecutive_failures = 0
+
+    def note_connect_failed(self, identifier: str) -> None:
+        if (name := self._placements.get(identifier)) is not None:
+            self._adapters[name].consecutive_failures += 1
+        self.release(identifier)
+
+    def release(self, identifier: str) -> None:
+        if (name := self._placements.pop(identifier, None)) is not None:
+            self._adapters[name].connections.discard(identifier)
+
+    def forget_device(self, identifier: str) -> None:
+        self._sightings.pop(identifier, None)
+        self._last_payload.pop(identifier, None)
+
+    def clear_connections(self) -> None:
+        for adapter in self._adapters.values():
+            adapter.connections.clear()
+        self._placements.clear()
+
+    def check_health(self, now: Optional[float] = None) -> list[str]:
+        """Re-evaluate adapter health. Returns the adapters that just became unhealthy."""
+        now = time.monotonic() if now is None else now
+        managed = [adapter for adapter in self._adapters.values() if adapter.managed]
+        if not managed:
+            return []
+        # Silence is measured against the freshest adapter, so a quiet room blames nobody.
+        freshest = max(adapter.last_advertisement for adapter in managed)
+        failed = []
+        for adapter in managed:
+            if (
+                adapter.consecutive_failures >= self.MAX_CONSECUTIVE_FAILURES
+                and adapter.unhealthy_since is not None
+                and now - adapter.unhealthy_since >= self.RECOVERY_SECONDS
+            ):
+                # Let the next placement try it again.
+                adapter.consecutive_failures = 0
+            healthy = (
+                freshest - adapter.last_advertisement < self.STALE_SECONDS
+                and adapter.consecutive_failures < self.MAX_CONSECUTIVE_FAILURES
+            )
+            if adapter.healthy and not healthy:
+                adapter.unhealthy_since = now
+                adapter.failovers += 1
+                failed.append(adapter.name)
+            elif healthy:
+                adapter.unhealthy_since = None
+            adapter.healthy = healthy
+        return failed
+
+    def stats(self) -> dict[str, dict]:
+        now = time.monotonic()
+        return {
+            name: {
+                "healthy": adapter.healthy,
+                "connections": len(adapter.connections),
+                "max_connections": adapter.max_connections,
+                "advertisements": adapter.advertisements,
+                "seconds_since_advertisement": round(now - adapter.last_advertisement, 1),
+                "consecutive_failures": adapter.consecutive_failures,
+                "failovers": adapter.failovers,
+            }
+            for name, adapter in self._adapters.items()
+        }
@@ -0,0 +1,74 @@
+"""Coalesce advertisements over a short window and process them in batches."""
+
+import asyncio
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from .logger import LOGGER
+from .metrics import Metrics
+
+T = TypeVar("T")
+
+
+class AdvertisementBatcher(Generic[T]):
+    """Buffers advertisements and hands them to `process` in one loop callback per window.
+
+    Within a window only the newest item per key is kept. The first item of a window schedules
+    the flush `window_seconds` later. Reaching `max_pending` distinct keys flushes right away, so
+    the buffer stays bounded however busy the air is. Batch sizes and coalesced items are
+    recorded in Metrics.
+    """
+
+    DEFAULT_WINDOW_SECONDS = 0.075
+    DEFAULT_MAX_PENDING = 512
+
+    def __init__(
+        self,
+        process: Callable[[list[T]], None],
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self.process = process
+        self.window_seconds = window_seconds
+        self.max_pending = max_pending
+        self.loop = loop or asyncio.get_running_loop()
+        self.metrics = metrics or Metrics.shared
+        self._pending: dict[Hashable, T] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, key: Hashable, item: T) -> None:
+        pending = self._pending
+        if key in pending:
+            self.metrics.advertisements_coalesced.value += 1
+        pending[key] = item
+        if len(pending) >= self.max_pending:
+            self.metrics.advertisement_batch_overflows.value += 1
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(self.window_seconds, self.flush)
+
+    def flush(self) -> None:
+        """Process everything buffered so far."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch = list(self._pending.values())
+        self._pending = {}
+        self.metrics.advertisement_batch_size.observe(len(batch))
+        try:
+            self.process(batch)
+        except Exception:
+            LOGGER.exception("Error processing advertisement batch")
+
+    def cancel(self) -> None:
+        """Drop anything buffered without processing it."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending = {}
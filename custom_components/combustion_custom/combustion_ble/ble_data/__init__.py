@@ -1,16 +1,21 @@
 """Combustion Bluetooth Parsing."""
 
-from .advertising_data import AdvertisingData, CombustionProductType
-from .battery_status_virtual_sensors import BatteryStatus
-from .gauge_advertising_data import GaugeAdvertisingData
-from .mode_id import ProbeColor, ProbeID, ProbeMode
-from .prediction_status import (
-    PredictionMode,
-    PredictionState,
-    PredictionStatus,
-    PredictionType,
-)
-from .probe_temperatures import ProbeTemperatures
+from typing import TYPE_CHECKING
+
+from ..utilities.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .advertising_data import AdvertisingData, CombustionProductType
+    from .battery_status_virtual_sensors import BatteryStatus
+    from .gauge_advertising_data import GaugeAdvertisingData
+    from .mode_id import ProbeColor, ProbeID, ProbeMode
+    from .prediction_status import (
+        PredictionMode,
+        PredictionState,
+        PredictionStatus,
+        PredictionType,
+    )
+    from .probe_temperatures import ProbeTemperatures
 
 __all__ = [
     "AdvertisingData",
@@ -26,3 +31,23 @@ __all__ = [
     "PredictionType",
     "ProbeTemperatures",
 ]
+
+# Submodules are imported on first use so that importing the package stays cheap.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "AdvertisingData": ".advertising_data",
+        "CombustionProductType": ".advertising_data",
+        "BatteryStatus": ".battery_status_virtual_sensors",
+        "GaugeAdvertisingData": ".gauge_advertising_data",
+        "ProbeColor": ".mode_id",
+        "ProbeID": ".mode_id",
+        "ProbeMode": ".mode_id",
+        "PredictionMode": ".prediction_status",
+        "PredictionState": ".prediction_status",
+        "PredictionStatus": ".prediction_status",
+        "PredictionType": ".prediction_status",
+        "ProbeTemperatures": ".probe_temperatures",
+    },
+)
@@ -86,8 +86,8 @@ class FoodSafeData:
         self.selected_threshold_reference_temperature = selected_threshold_reference_temperature
         self.z_value = z_value
         self.reference_temperature = reference_temperature
-        d_value_at_rt = d_value_at_rt
-        target_log_reduction = target_log_reduction
+        self.d_value_at_rt = d_value_at_rt
+        self.target_log_reduction = target_log_reduction
 
     @classmethod
     def from_raw(cls, data: bytes):
@@ -6,6 +6,30 @@ from typing import NamedTuple, Optional
 
 from .advertising_data import CombustionProductType
 
+GAUGE_SERIAL_LENGTH = 10
+# Gauge status flag bits, shared by advertising, Gauge Status and Gauge log records.
+SENSOR_PRESENT_FLAG = 0x01
+SENSOR_OVERHEATING_FLAG = 0x02
+LOW_BATTERY_FLAG = 0x04
+
+
+def gauge_serial_from_raw(data: bytes) -> str:
+    """Serial number from its 10 bytes (ASCII-ish, may contain nulls)."""
+    serial = data.decode("ascii", errors="ignore").rstrip("\x00").strip()
+    # Keep a deterministic fallback for registry/ids
+    return serial or data.hex().upper()
+
+
+def gauge_temperature_from_raw(raw_field: int, sensor_present: bool) -> float | None:
+    """Celsius from the 13-bit packed Gauge temperature (0.1 C steps, -20 C offset).
+
+    Per spec the raw value is 0 when the sensor is not present; both read as None.
+    """
+    raw_temp = raw_field & 0x1FFF
+    if not sensor_present or raw_temp == 0:
+        return None
+    return (raw_temp * 0.1) - 20.0
+
 
 class GaugeAdvertisingData(NamedTuple):
     """Parsed data from a Gauge Manufacturer Specific Data payload.
@@ -39,29 +63,18 @@ class GaugeAdvertisingData(NamedTuple):
         if product_type != CombustionProductType.GAUGE:
             return None
 
-        # Serial number (10 bytes; ASCII-ish, may contain nulls)
-        serial_bytes = data[3:13]
-        serial = serial_bytes.decode("ascii", errors="ignore").rstrip("\x00").strip()
-        if not serial:
-            # Keep a deterministic fallback for registry/ids
-            serial = serial_bytes.hex().upper()
-
-        # Raw temperature (13-bit packed, 0.1°C steps; -20°C offset)
-        # Encoding per Gauge spec: Temperature = (raw * 0.1) - 20
-        # We assume little-endian packing for the 16-bit field and mask to 13 bits.
-        raw_temp_field = int.from_bytes(data[13:15], byteorder="little")
-        raw_temp = raw_temp_field & 0x1FFF
-        temperature_c = (raw_temp * 0.1) - 20.0
+        serial = gauge_serial_from_raw(data[3 : 3 + GAUGE_SERIAL_LENGTH])
 
         # Status flags
         flags = data[15]
-        sensor_present = bool(flags & 0x01)
-        sensor_overheating = bool(flags & 0x02)
-        low_battery = bool(flags & 0x04)
+        sensor_present = bool(flags & SENSOR_PRESENT_FLAG)
+        sensor_overheating = bool(flags & SENSOR_OVERHEATING_FLAG)
+        low_battery = bool(flags & LOW_BATTERY_FLAG)
 
-        # Per spec: if sensor is not present, raw temperature value will be 0.
-        if not sensor_present or raw_temp == 0:
-            temperature_c = None
+        # Raw temperature (13-bit packed, little-endian 16-bit field)
+        temperature_c = gauge_temperature_from_raw(
+            int.from_bytes(data[13:15], byteorder="little"), sensor_present
+        )
 
         # Alarm status fields (packed; keep raw status for now)
         # Encoding per Gauge spec:
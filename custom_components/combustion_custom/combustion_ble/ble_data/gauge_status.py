@@ -0,0 +1,51 @@
+"""Gauge Status, as carried by the MeatNet Gauge Status (0x60) message."""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from ..uart.session_info import SessionInformation
+from .gauge_advertising_data import (
+    LOW_BATTERY_FLAG,
+    SENSOR_OVERHEATING_FLAG,
+    SENSOR_PRESENT_FLAG,
+    gauge_temperature_from_raw,
+)
+
+
+class GaugeStatus(NamedTuple):
+    """Live Gauge reading plus the range of log records the Gauge holds for its session."""
+
+    session_information: SessionInformation
+    temperature_c: float | None
+    sensor_present: bool
+    sensor_overheating: bool
+    low_battery: bool
+    min_sequence_number: int
+    max_sequence_number: int
+    alarm_high_raw: int
+    alarm_low_raw: int
+
+    @staticmethod
+    def from_fields(
+        session_id: int,
+        sample_period: int,
+        raw_temperature: int,
+        flags: int,
+        min_sequence_number: int,
+        max_sequence_number: int,
+        alarm_high_raw: int,
+        alarm_low_raw: int,
+    ) -> "GaugeStatus":
+        sensor_present = bool(flags & SENSOR_PRESENT_FLAG)
+        return GaugeStatus(
+            session_information=SessionInformation(session_id, sample_period),
+            temperature_c=gauge_temperature_from_raw(raw_temperature, sensor_present),
+            sensor_present=sensor_present,
+            sensor_overheating=bool(flags & SENSOR_OVERHEATING_FLAG),
+            low_battery=bool(flags & LOW_BATTERY_FLAG),
+            min_sequence_number=min_sequence_number,
+            max_sequence_number=max_sequence_number,
+            alarm_high_raw=alarm_high_raw,
+            alarm_low_raw=alarm_low_raw,
+        )
@@ -1,5 +1,7 @@
+import asyncio
 import enum
-from typing import Optional
+import time
+from typing import Awaitable, Callable, Optional
 
 from bleak import (
     AdvertisementDataCallback,
@@ -10,11 +12,13 @@ from bleak import (
 )
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
-from bleak_retry_connector import establish_connection
 
+from .adapter_pool import AdapterPool
+from .advertisement_batcher import AdvertisementBatcher
 from .ble_data.advertising_data import AdvertisingData, CombustionProductType
 from .ble_data.gauge_advertising_data import GaugeAdvertisingData
 from .ble_data.probe_status import ProbeStatus
+from .connection_pool import ConnectionPool
 from .const import (
     BT_MANUFACTURER_ID,
     DEVICE_STATUS_CHARACTERISTIC,
@@ -25,8 +29,22 @@ from .const import (
     UART_RX_CHARACTERISTIC,
     UART_TX_CHARACTERISTIC,
 )
+from .device_info_cache import (
+    FIRMWARE_REVISION,
+    HARDWARE_REVISION,
+    MODEL_NUMBER,
+    SERIAL_NUMBER,
+    DeviceInfoCache,
+)
 from .exceptions import CombustionError
+from .link_session import LinkSession
 from .logger import LOGGER
+from .metrics import (
+    DECODE_ADVERTISING,
+    DECODE_GAUGE_ADVERTISING,
+    DECODE_PROBE_STATUS,
+    Metrics,
+)
 from .uart import Request, SessionInfoRequest
 from .uart.meatnet import NodeRequest
 from .utilities.asyncio_utils import ensure_future
@@ -39,6 +57,10 @@ class BleManagerDelegate:
     def did_fail_to_connect_to(self, identifier: str):
         pass
 
+    def did_reject_connect_to(self, identifier: str):
+        """A connect was not attempted, e.g. because no connection slot was free."""
+        self.did_fail_to_connect_to(identifier)
+
     def did_disconnect_from(self, identifier: str):
         pass
 
@@ -55,6 +77,21 @@ class BleManagerDelegate:
     ):
         pass
 
+    def update_device_with_repeated_probe_header(
+        self,
+        identifier: str,
+        serial_number: int,
+        mode_byte: int,
+        network_info_byte: int,
+        is_connectable: bool,
+        rssi: int,
+    ) -> bool:
+        """Handle a node's repeated probe advertisement from its header bytes alone.
+
+        Return True if the advertisement was fully handled and need not be decoded.
+        """
+        return False
+
     def update_device_with_status(self, identifier: str, status: ProbeStatus):
         pass
 
@@ -73,6 +110,14 @@ class BleManagerDelegate:
     def update_device_model_info(self, identifier: str, model_info: str):
         pass
 
+    def connection_priority(self, identifier: str) -> int:
+        """Priority used by the connection pool; higher values keep their slot."""
+        return 0
+
+    def did_evict_connection(self, identifier: str):
+        """The connection pool is about to drop this link to make room for a better one."""
+        pass
+
 
 class BluetoothMode(enum.Enum):
     """Mode for bluetooth device discovery."""
@@ -84,93 +129,170 @@ class BluetoothMode(enum.Enum):
     """Passive will allow you to interface this SDK with an externally-managed BleakScanner."""
 
 
-class PendingGattReads:
-    """Track pending GATT Read requests."""
-
-    def __init__(self) -> None:
-        self.pending_reads: dict[str, set[int]] = {}
-
-    def add(self, identifier: str, char: BleakGATTCharacteristic):
-        if identifier not in self.pending_reads:
-            self.pending_reads[identifier] = set[int]()
-        reads: set[int] = self.pending_reads.get(identifier, set[int]())
-        reads.add(char.handle)
-
-    def remove(self, identifier: str, char: BleakGATTCharacteristic | None):
-        if identifier not in self.pending_reads or char is None:
-            return
-        reads: set[int] = self.pending_reads.get(identifier, set[int]())
-        reads.discard(char.handle)
+BLEDeviceResolver = Callable[[str], Optional[BLEDevice]]
+# Returns a connected client for the BLEDevice, or None to fall back to establish_connection.
+ClientFactory = Callable[[BLEDevice, Callable[[BleakClient], None]], Awaitable[Optional[BleakClient]]]
 
-    def has(self, identifier: str, char: BleakGATTCharacteristic | None) -> bool:
-        if identifier not in self.pending_reads or char is None:
-            return False
-        reads: set[int] = self.pending_reads.get(identifier, set[int]())
-        return char.handle in reads
+# Device Information Service characteristics and the DeviceInfoCache field each one fills.
+DEVICE_INFO_FIELDS = {
+    FW_VERSION_CHARACTERISTIC: FIRMWARE_REVISION,
+    HW_VERSION_CHARACTERISTIC: HARDWARE_REVISION,
+    SERIAL_NUMBER_CHARACTERISTIC: SERIAL_NUMBER,
+    MODEL_NUMBER_CHARACTERISTIC: MODEL_NUMBER,
+}
 
 
 class BleManager:
     shared: "BleManager" = None  # type: ignore
 
+    # Connection slots assumed for each adapter this manager scans on itself.
+    ADAPTER_MAX_CONNECTIONS = 5
+    ADAPTER_HEALTH_CHECK_SECONDS = 5.0
+    # Offsets into the MSD (without vendor id) of a repeated probe advertisement.
+    MODE_ID_INDEX = 18
+    NETWORK_INFO_INDEX = 20
+
     def __init__(self):
-        self.clients: dict[str, BleakClient] = {}
+        self.sessions: dict[str, LinkSession] = {}
         self.ble_devices: dict[str, BLEDevice] = {}
         self.scanner: Optional[BleakScanner] = None
+        self.adapter_scanners: dict[str, BleakScanner] = {}
+        # Populated when advertisements carry their source (several local adapters, or the
+        # scanners/proxies of an external Bluetooth stack). Empty means single-adapter mode.
+        self.adapters = AdapterPool()
+        self._adapter_health_task: Optional[asyncio.Task] = None
         self.delegate: Optional[BleManagerDelegate] = None
-        self.device_status_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self.uart_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self.fw_revision_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self.hw_revision_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self.serial_number_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self.model_number_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self._pending_gatt_reads = PendingGattReads()
+        self.device_info_cache = DeviceInfoCache()
+        self.metrics = Metrics.shared
         self._pending_connections: set[str] = set()
         self.is_stopping = False
+        # Optional hook used to pick the BLEDevice for a connection. When the scanner is
+        # externally managed (e.g. Home Assistant's Bluetooth integration with remote proxies),
+        # this lets the owner route the connection through the best connectable scanner rather
+        # than whichever one delivered the last advertisement.
+        self.ble_device_resolver: Optional[BLEDeviceResolver] = None
+        # Optional hook that supplies connected clients in place of a real radio (simulation).
+        self.client_factory: Optional[ClientFactory] = None
+        self.connection_pool = ConnectionPool(priority=self._connection_priority)
+        # Set by set_advertisement_batching; None processes each advertisement as it arrives.
+        self.advertisement_batcher: Optional[AdvertisementBatcher] = None
 
     async def init_bluetooth(
-        self, mode: BluetoothMode = BluetoothMode.ACTIVE
+        self, mode: BluetoothMode = BluetoothMode.ACTIVE, adapters: Optional[list[str]] = None
     ) -> None | AdvertisementDataCallback:
-        """Initialize Bluetooth"""
+        """Initialize Bluetooth.
+
+        In active mode, `adapters` (e.g. ["hci0", "hci1"]) starts one scanner per adapter and
+        places connections across them. In passive mode the returned callback accepts an
+        optional `source` argument naming the scanner that heard the advertisement.
+        """
         if mode == BluetoothMode.ACTIVE:
-            await self.init_bluetooth_scanning()
+            await self.init_bluetooth_scanning(adapters)
             return None
         elif mode == BluetoothMode.PASSIVE:
             return self.detection_callback
 
         raise TypeError("Unsupported mode: %s", mode)
 
-    async def init_bluetooth_scanning(self):
-        if self.scanner:
+    async def init_bluetooth_scanning(self, adapters: Optional[list[str]] = None):
+        if self.scanner or self.adapter_scanners:
             raise CombustionError("Bluetooth has already been initialized.")
         if self.is_stopping:
             raise CombustionError("Cannot initialize bluetooth while it is stopping.")
 
-        LOGGER.debug("Initializing bluetooth with our own BleakScanner.")
-        self.scanner = BleakScanner(detection_callback=self.detection_callback)
-        await self.scanner.start()
+        if not adapters:
+            LOGGER.debug("Initializing bluetooth with our own BleakScanner.")
+            self.scanner = BleakScanner(detection_callback=self.detection_callback)
+            await self.scanner.start()
+            return
+
+        LOGGER.debug("Initializing bluetooth with BleakScanners on %s.", ", ".join(adapters))
+        for adapter in adapters:
+            self.adapters.add(adapter, self.ADAPTER_MAX_CONNECTIONS)
+            await self._start_adapter_scanner(adapter)
+        if (capacity := self.adapters.capacity) and capacity > self.connection_pool.max_slots:
+            self.connection_pool.resize(capacity)
+
+    async def _start_adapter_scanner(self, adapter: str) -> None:
+        def callback(device: BLEDevice, advertisement_data: AdvertisementData):
+            self.detection_callback(device, advertisement_data, True, adapter)
+
+        scanner = BleakScanner(detection_callback=callback, adapter=adapter)
+        self.adapter_scanners[adapter] = scanner
+        await scanner.start()
+
+    def _start_adapter_health_checks(self) -> None:
+        """Started by the first advertisement that names its source adapter."""
+        self._adapter_health_task = asyncio.get_running_loop().create_task(
+            self._check_adapter_health(), name="ble_manager[adapter_health]"
+        )
+
+    async def _check_adapter_health(self) -> None:
+        while True:
+            await asyncio.sleep(self.ADAPTER_HEALTH_CHECK_SECONDS)
+            for adapter in self.adapters.check_health():
+                try:
+                    await self._fail_over(adapter)
+                except Exception:
+                    LOGGER.exception("Error failing over adapter [%s]", adapter)
+
+    async def _fail_over(self, adapter: str) -> None:
+        """Drop the links on an unhealthy adapter so they reconnect elsewhere."""
+        identifiers = self.adapters.connections_on(adapter)
+        LOGGER.warning(
+            "Adapter [%s] is unhealthy; moving %d connection(s) to other adapters",
+            adapter,
+            len(identifiers),
+        )
+        for identifier in identifiers:
+            await self.disconnect(identifier)
+        if scanner := self.adapter_scanners.get(adapter):
+            # A wedged scanner is the usual culprit; restart it in place.
+            try:
+                await scanner.stop()
+                await scanner.start()
+            except Exception as ex:
+                LOGGER.debug("Restarting scanner on [%s] failed: %s", adapter, ex)
 
     async def stop_bluetooth(self):
         self.is_stopping = True
-        if self.scanner:
-            try:
-                await self.scanner.stop()
-            except Exception:
-                LOGGER.exception("Error stopping Bleak scanner")
-            if self.clients:
-                client_list = [c for c in self.clients]
-                for client in client_list:
-                    try:
-                        if self.clients[client].is_connected:
-                            await self.clients[client].disconnect()
-                    except Exception:
-                        LOGGER.exception("Error disconnecting client")
-        self.clients = {}
+        if self._adapter_health_task:
+            self._adapter_health_task.cancel()
+            self._adapter_health_task = None
+        scanners = [self.scanner] if self.scanner else []
+        scanners.extend(self.adapter_scanners.values())
+        if scanners:
+            for scanner in scanners:
+                try:
+                    await scanner.stop()
+                except Exception:
+                    LOGGER.exception("Error stopping Bleak scanner")
+            for session in list(self.sessions.values()):
+                try:
+                    if session.is_connected:
+                        await session.client.disconnect()
+                except Exception:
+                    LOGGER.exception("Error disconnecting client")
+        for session in self.sessions.values():
+            session.close()
+        if self.advertisement_batcher is not None:
+            self.advertisement_batcher.cancel()
+            self.advertisement_batcher = None
+        self.sessions = {}
         self._pending_connections = set()
-        self._pending_gatt_reads = PendingGattReads()
+        self.connection_pool.clear()
+        self.adapters.clear_connections()
         self.scanner = None
+        self.adapter_scanners = {}
         self.is_stopping = False
 
-    def detection_callback(self, device: BLEDevice, advertisement_data: AdvertisementData):
+    def detection_callback(
+        self,
+        device: BLEDevice,
+        advertisement_data: AdvertisementData,
+        connectable: bool = True,
+        source: Optional[str] = None,
+    ):
         if BT_MANUFACTURER_ID not in advertisement_data.manufacturer_data:
             return
 
@@ -178,30 +300,79 @@ class BleManager:
         self.ble_devices[device.address] = device
 
         msd_payload = advertisement_data.manufacturer_data[BT_MANUFACTURER_ID]
+        rssi = advertisement_data.rssi
+        if source is not None:
+            if self._adapter_health_task is None and not self.is_stopping:
+                self._start_adapter_health_checks()
+            if not self.adapters.note_advertisement(
+                source, device.address, rssi, device, msd_payload, connectable
+            ):
+                # Same advertisement already delivered through another adapter.
+                return
+            rssi = self.adapters.best_rssi(device.address)
 
         # Peek product type byte (offset 2 in full MSD, but Bleak omits vendor id).
         # Full MSD format: [vendor_id(2)][product_type(1)]...
         if len(msd_payload) < 1:
             return
 
+        self.metrics.note_advertisement(device.address, msd_payload[0])
+        if self.advertisement_batcher is not None:
+            # Product type and serial, so a node's copies of different probes stay apart.
+            self.advertisement_batcher.add(
+                (device.address, msd_payload[:5]), (device, msd_payload, connectable, rssi)
+            )
+            return
+        self._process_advertisement(device, msd_payload, connectable, rssi)
+
+    def _process_advertisements(self, batch: list[tuple[BLEDevice, bytes, bool, int]]) -> None:
+        for device, msd_payload, connectable, rssi in batch:
+            try:
+                self._process_advertisement(device, msd_payload, connectable, rssi)
+            except Exception:
+                LOGGER.exception("Error processing advertisement from [%s]", device.address)
+
+    def _process_advertisement(
+        self, device: BLEDevice, msd_payload: bytes, connectable: bool, rssi: int
+    ) -> None:
         product_type_byte = msd_payload[0]
+        if (
+            product_type_byte == CombustionProductType.MEAT_NET_NODE.value
+            and len(msd_payload) > self.NETWORK_INFO_INDEX
+            and self.delegate
+            and self.delegate.update_device_with_repeated_probe_header(
+                identifier=device.address,
+                serial_number=int.from_bytes(msd_payload[1:5], "little"),
+                mode_byte=msd_payload[self.MODE_ID_INDEX],
+                network_info_byte=msd_payload[self.NETWORK_INFO_INDEX],
+                is_connectable=connectable,
+                rssi=rssi,
+            )
+        ):
+            # Every node repeats every probe; copies the probe would reject skip the decode.
+            self.metrics.repeated_advertisements_dropped.value += 1
+            return
+
+        started = time.perf_counter_ns()
         if product_type_byte == CombustionProductType.GAUGE.value:
             gauge_adv = GaugeAdvertisingData.from_bleak_data(msd_payload)
+            self.metrics.note_decode(DECODE_GAUGE_ADVERTISING, started)
             if gauge_adv and self.delegate:
                 self.delegate.update_device_with_gauge_advertising(
                     advertising=gauge_adv,
-                    is_connectable=True,  # TODO: support non-connectable devices
-                    rssi=advertisement_data.rssi,
+                    is_connectable=connectable,
+                    rssi=rssi,
                     identifier=device.address,
                 )
             return
 
         advertising_data = AdvertisingData.from_bleak_data(msd_payload)
+        self.metrics.note_decode(DECODE_ADVERTISING, started)
         if advertising_data and self.delegate:
             self.delegate.update_device_with_advertising(
                 advertising=advertising_data,
-                is_connectable=True,  # TODO: support non-connectable devices
-                rssi=advertisement_data.rssi,
+                is_connectable=connectable,
+                rssi=rssi,
                 identifier=device.address,
             )
 
@@ -211,231 +382,258 @@ class BleManager:
         if identifier in self._pending_connections:
             return
 
-        if identifier in self.clients:
-            client = self.clients[identifier]
-            if client.is_connected:
-                self.delegate.did_connect_to(identifier)
-                return
+        if (session := self.sessions.get(identifier)) and session.is_connected:
+            self.delegate.did_connect_to(identifier)
+            return
 
-        ble_device = self.ble_devices.get(identifier)
+        ble_device = self._resolve_ble_device(identifier)
         if not ble_device:
             LOGGER.warning("No BLEDevice found for identifier [%s]", identifier)
             self.delegate.did_fail_to_connect_to(identifier)
             return
 
+        # Place on an adapter before reserving a pool slot: reserving may evict another link,
+        # which must only happen once this connection is known to have somewhere to go.
+        # With a resolver the external Bluetooth stack picks the connectable path (and accounts
+        # for its scanners' slots), so its BLEDevice is used as is.
+        adapter = None
+        if self.adapters and not self.ble_device_resolver:
+            if placement := self.adapters.place(identifier):
+                adapter, ble_device = placement
+            elif self.adapters.capacity is not None:
+                # Every adapter's slot count is known and none can take this device.
+                LOGGER.debug("No adapter can take a connection to [%s]", identifier)
+                self.metrics.connection_rejections.value += 1
+                self.delegate.did_reject_connect_to(identifier)
+                return
+            # Otherwise an external Bluetooth stack manages the slots; let it pick the path.
+
+        granted, victim = self.connection_pool.reserve(identifier)
+        if not granted:
+            LOGGER.debug(
+                "No free connection slot for [%s] (%s)", identifier, self.connection_pool.stats()
+            )
+            self.adapters.release(identifier)
+            self.metrics.connection_rejections.value += 1
+            self.delegate.did_reject_connect_to(identifier)
+            return
+
+        if victim:
+            LOGGER.debug("Evicting [%s] to make room for [%s]", victim, identifier)
+            self.delegate.did_evict_connection(victim)
+            await self.disconnect(victim)
+
         successful = False
         self._pending_connections.add(identifier)
+        self.metrics.connection_attempts.value += 1
+        started = time.monotonic()
         try:
-            client = await establish_connection(
-                BleakClient,
-                ble_device,
-                ble_device.name or identifier,
-                disconnected_callback=self.disconnected_callback(identifier),
-            )
-            self.clients[identifier] = client
+            client = None
+            if self.client_factory:
+                client = await self.client_factory(
+                    ble_device, self.disconnected_callback(identifier)
+                )
+            if client is None:
+                # Imported on first connect so that loading the integration does not pay for it.
+                from bleak_retry_connector import (
+                    BleakClientWithServiceCache,
+                    establish_connection,
+                )
+
+                # The service-cache client lets reconnects skip GATT service discovery where the
+                # backend supports it.
+                client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    ble_device,
+                    ble_device.name or identifier,
+                    disconnected_callback=self.disconnected_callback(identifier),
+                )
+            self.sessions[identifier] = LinkSession(identifier, client, adapter)
             successful = True
         except Exception as ex:
             LOGGER.debug("Failed to connect to [%s]: %s", identifier, ex)
+            self.metrics.connection_failures.value += 1
+            self.connection_pool.release(identifier)
+            self.adapters.note_connect_failed(identifier)
             self.delegate.did_fail_to_connect_to(identifier)
         finally:
             self._pending_connections.discard(identifier)
 
         if successful:
+            self.metrics.note_connected(time.monotonic() - started)
+            self.adapters.note_connected(identifier)
+            self.connection_pool.mark_connected(identifier)
             self.delegate.did_connect_to(identifier)
-            self.handle_discovered_services(identifier, client)
+            self.handle_discovered_services(identifier, self.sessions[identifier])
+
+    def _connection_priority(self, identifier: str) -> int:
+        return self.delegate.connection_priority(identifier) if self.delegate else 0
+
+    def set_advertisement_batching(
+        self,
+        window_seconds: Optional[float],
+        max_pending: int = AdvertisementBatcher.DEFAULT_MAX_PENDING,
+    ) -> None:
+        """Coalesce advertisements for `window_seconds` and process them in batches.
+
+        Must be called from the event loop; stop_bluetooth turns batching off again. A falsy
+        window processes what is buffered and goes back to handling each advertisement as it
+        arrives.
+        """
+        if self.advertisement_batcher is not None:
+            self.advertisement_batcher.flush()
+            self.advertisement_batcher = None
+        if window_seconds:
+            self.advertisement_batcher = AdvertisementBatcher(
+                self._process_advertisements, window_seconds, max_pending, metrics=self.metrics
+            )
+
+    def set_max_connections(self, max_connections: int) -> None:
+        """Set how many concurrent connections (including in-flight connects) may be held."""
+        self.connection_pool.resize(max_connections)
+
+    def _resolve_ble_device(self, identifier: str) -> Optional[BLEDevice]:
+        if self.ble_device_resolver:
+            if ble_device := self.ble_device_resolver(identifier):
+                return ble_device
+        return self.ble_devices.get(identifier)
 
     def disconnected_callback(self, identifier: str):
         def cb(client: BleakClient):
+            self.connection_pool.release(identifier)
+            self.adapters.release(identifier)
             if self.delegate:
                 self.delegate.did_disconnect_from(identifier)
-            if identifier in self.clients:
-                del self.clients[identifier]
-            if identifier in self.uart_characteristics:
-                del self.uart_characteristics[identifier]
-            if identifier in self.device_status_characteristics:
-                del self.device_status_characteristics[identifier]
-            if identifier in self.fw_revision_characteristics:
-                del self.fw_revision_characteristics[identifier]
-            if identifier in self.hw_revision_characteristics:
-                del self.hw_revision_characteristics[identifier]
-            if identifier in self.serial_number_characteristics:
-                del self.serial_number_characteristics[identifier]
-            if identifier in self.model_number_characteristics:
-                del self.model_number_characteristics[identifier]
+            if session := self.sessions.pop(identifier, None):
+                self.metrics.note_disconnected(identifier, time.monotonic() - session.connected_at)
+                session.close()
 
         return cb
 
     async def disconnect(self, identifier: str):
-        if identifier in self.clients:
-            client = self.clients[identifier]
-            if client.is_connected:
-                try:
-                    await client.disconnect()
-                except BleakError as be:
-                    LOGGER.error("Error disconnecting from [%s]: %s", identifier, be)
-                # Additional cleanup handled by disconnected_callback
-
-    async def send_request(
-        self, identifier: str, request: Request | NodeRequest
-    ):  # todo this does not need to be async. we can ensure_future instead
-        connection_peripheral = self.get_connected_peripheral(identifier)
-        if not connection_peripheral:
+        if (session := self.sessions.get(identifier)) and session.is_connected:
+            try:
+                await session.client.disconnect()
+            except BleakError as be:
+                LOGGER.error("Error disconnecting from [%s]: %s", identifier, be)
+            # Additional cleanup handled by disconnected_callback
+
+    async def send_request(self, identifier: str, request: Request | NodeRequest):
+        """Queue a request on the link's write queue. Writes are serialized and coalesced."""
+        session = self._connected_session(identifier)
+        if not session:
             return
 
-        uart_char = self.uart_characteristics.get(identifier)
-        client = self.clients.get(identifier)
-        try:
-            if client and client.is_connected and uart_char:
-                await client.write_gatt_char(uart_char, request.data, response=False)
-        except BleakError as be:
-            LOGGER.error("Error sending request to [%s]: %s", identifier, be)
+        self.connection_pool.touch(identifier)
+        if queue := session.write_queue:
+            if queue.enqueue(request.data, key=request.dedupe_key):
+                self.metrics.note_request_sent(identifier, request.data[4])
+
+    def write_queue_stats(self) -> dict[str, dict]:
+        """Queue depth, coalescing and write latency per connected link."""
+        return {
+            identifier: queue.stats()
+            for identifier, session in self.sessions.items()
+            if (queue := session.write_queue)
+        }
+
+    def link_stats(self) -> dict[str, dict]:
+        """Traffic counters for each connected link."""
+        return {identifier: session.stats() for identifier, session in self.sessions.items()}
 
     async def read_firmware_revision(self, identifier: str) -> None:
-        connection_peripheral = self.get_connected_peripheral(identifier)
-        if connection_peripheral:
-            uart_char = self.fw_revision_characteristics.get(identifier)
-            client = self.clients.get(identifier)
-            if self._pending_gatt_reads.has(identifier, uart_char):
-                LOGGER.debug(
-                    "Discarding concurent request to read_firmware_revision for [%s]", identifier
-                )
-                return
-            try:
-                if client and client.is_connected and uart_char and self.delegate:
-                    self._pending_gatt_reads.add(identifier, uart_char)
-                    data = await client.read_gatt_char(uart_char, use_cached=True)
-                    fw_version = data.decode(encoding="utf-8")
-                    self.delegate.update_device_fw_version(identifier, fw_version)
-            except BleakError as be:
-                LOGGER.error("Error reading firmware version from [%s]: %s", identifier, be)
-            finally:
-                self._pending_gatt_reads.remove(identifier, uart_char)
+        await self._read_device_info(identifier, FIRMWARE_REVISION)
 
     async def read_hardware_revision(self, identifier: str) -> None:
-        connection_peripheral = self.get_connected_peripheral(identifier)
-        if connection_peripheral:
-            uart_char = self.hw_revision_characteristics.get(identifier)
-            client = self.clients.get(identifier)
-            if self._pending_gatt_reads.has(identifier, uart_char):
-                LOGGER.debug(
-                    "Discarding concurent request to read_hardware_revision for [%s]", identifier
-                )
-                return
-            try:
-                if client and client.is_connected and uart_char and self.delegate:
-                    self._pending_gatt_reads.add(identifier, uart_char)
-                    data = await client.read_gatt_char(uart_char, use_cached=True)
-                    hw_revision = data.decode(encoding="utf-8")
-                    self.delegate.update_device_hw_revision(identifier, hw_revision)
-            except BleakError as be:
-                LOGGER.debug("Error reading hardware version from [%s]: %s", identifier, be)
-            finally:
-                self._pending_gatt_reads.remove(identifier, uart_char)
+        await self._read_device_info(identifier, HARDWARE_REVISION)
 
     async def read_serial_number(self, identifier: str) -> None:
-        connection_peripheral = self.get_connected_peripheral(identifier)
-        if connection_peripheral:
-            uart_char = self.serial_number_characteristics.get(identifier)
-            client = self.clients.get(identifier)
-            if self._pending_gatt_reads.has(identifier, uart_char):
-                LOGGER.debug(
-                    "Discarding concurent request to read_serial_number for [%s]", identifier
-                )
-                return
-            try:
-                if client and client.is_connected and uart_char and self.delegate:
-                    self._pending_gatt_reads.add(identifier, uart_char)
-                    data = await client.read_gatt_char(uart_char, use_cached=True)
-                    serial_number = data.decode(encoding="utf-8")
-                    self.delegate.update_device_serial_number(identifier, serial_number)
-            except BleakError as be:
-                LOGGER.debug("Error reading serial number from [%s]: %s", identifier, be)
-            finally:
-                self._pending_gatt_reads.remove(identifier, uart_char)
+        await self._read_device_info(identifier, SERIAL_NUMBER)
 
     async def read_model_number(self, identifier: str) -> None:
-        connection_peripheral = self.get_connected_peripheral(identifier)
-        if connection_peripheral:
-            uart_char = self.model_number_characteristics.get(identifier)
-            client = self.clients.get(identifier)
-            if self._pending_gatt_reads.has(identifier, uart_char):
-                LOGGER.debug(
-                    "Discarding concurent request to read_model_number for [%s]", identifier
-                )
-                return
-            try:
-                if client and client.is_connected and uart_char and self.delegate:
-                    self._pending_gatt_reads.add(identifier, uart_char)
-                    data = await client.read_gatt_char(uart_char, use_cached=True)
-                    model_number = data.decode(encoding="utf-8")
-                    self.delegate.update_device_model_info(identifier, model_number)
-            except BleakError as be:
-                LOGGER.debug("Error reading model number from [%s]: %s", identifier, be)
-            finally:
-                self._pending_gatt_reads.remove(identifier, uart_char)
+        await self._read_device_info(identifier, MODEL_NUMBER)
 
-    def get_connected_peripheral(self, identifier: str) -> BleakClient | None:
-        connected_clients = [
-            self.clients[c]
-            for c in self.clients
-            if self.clients[c].address == identifier and self.clients[c].is_connected
-        ]
-        if not connected_clients:
+    async def _read_device_info(self, identifier: str, field: str) -> None:
+        """Read a Device Information string, preferring the cache over a GATT read."""
+        session = self._connected_session(identifier)
+        if not session or not self.delegate:
+            return
+
+        if (cached := self.device_info_cache.get(identifier, field)) is not None:
+            self._update_device_info(identifier, field, cached)
+            return
+
+        char = session.info_characteristics.get(field)
+        if char is None:
+            return
+        if char.handle in session.pending_reads:
+            LOGGER.debug("Discarding concurent request to read %s for [%s]", field, identifier)
+            return
+        session.pending_reads.add(char.handle)
+        try:
+            data = await session.client.read_gatt_char(char, use_cached=True)
+            value = data.decode(encoding="utf-8")
+            self.device_info_cache.set(identifier, field, value)
+            self._update_device_info(identifier, field, value)
+        except BleakError as be:
+            LOGGER.debug("Error reading %s from [%s]: %s", field, identifier, be)
+        finally:
+            session.pending_reads.discard(char.handle)
+
+    def _update_device_info(self, identifier: str, field: str, value: str) -> None:
+        if not self.delegate:
+            return
+        if field == FIRMWARE_REVISION:
+            self.delegate.update_device_fw_version(identifier, value)
+        elif field == HARDWARE_REVISION:
+            self.delegate.update_device_hw_revision(identifier, value)
+        elif field == SERIAL_NUMBER:
+            self.delegate.update_device_serial_number(identifier, value)
+        elif field == MODEL_NUMBER:
+            self.delegate.update_device_model_info(identifier, value)
+
+    def _connected_session(self, identifier: str) -> Optional[LinkSession]:
+        session = self.sessions.get(identifier)
+        if session is None or not session.is_connected:
             return None
+        return session
 
-        return connected_clients[0]
+    def get_connected_peripheral(self, identifier: str) -> BleakClient | None:
+        session = self._connected_session(identifier)
+        return session.client if session else None
 
     def handle_uart_data(self, identifier: str, data: bytes):
         if self.delegate:
             self.delegate.handle_uart_data(identifier, data)
 
-    def handle_discovered_services(self, identifier: str, client: BleakClient):
+    def handle_discovered_services(self, identifier: str, session: LinkSession):
         def uart_tx_notify_callback(char: BleakGATTCharacteristic, data: bytearray):
+            self.connection_pool.touch(identifier)
             if char.uuid == UART_TX_CHARACTERISTIC:
+                session.note_uart_rx(len(data))
                 self.handle_uart_data(identifier, bytes(data))
             elif char.uuid == DEVICE_STATUS_CHARACTERISTIC:
+                session.note_status_rx()
+                started = time.perf_counter_ns()
                 probe_status = ProbeStatus.from_data(data)
+                self.metrics.note_decode(DECODE_PROBE_STATUS, started)
                 if probe_status and self.delegate:
                     self.delegate.update_device_with_status(identifier, probe_status)
             else:
                 LOGGER.debug("uart_tx_notify_callback ignoring unknown char [%s]", char.uuid)
 
-        for service in client.services:
+        for service in session.client.services:
             for characteristic in service.characteristics:
                 if characteristic.uuid == UART_RX_CHARACTERISTIC:
-                    self.uart_characteristics[identifier] = characteristic
+                    session.uart_characteristic = characteristic
                 elif characteristic.uuid == DEVICE_STATUS_CHARACTERISTIC:
-                    self.device_status_characteristics[identifier] = characteristic
-                elif (
-                    characteristic.uuid == FW_VERSION_CHARACTERISTIC
-                    or characteristic.uuid == HW_VERSION_CHARACTERISTIC
-                    or characteristic.uuid == SERIAL_NUMBER_CHARACTERISTIC
-                    or characteristic.uuid == MODEL_NUMBER_CHARACTERISTIC
-                ):
-                    if characteristic.uuid == FW_VERSION_CHARACTERISTIC:
-                        self.fw_revision_characteristics[identifier] = characteristic
-                        ensure_future(
-                            self.read_firmware_revision(identifier),
-                            name="ble_manager[read_firmware_revision]",
-                        )
-                    elif characteristic.uuid == HW_VERSION_CHARACTERISTIC:
-                        self.hw_revision_characteristics[identifier] = characteristic
-                        ensure_future(
-                            self.read_hardware_revision(identifier),
-                            name="ble_manager[read_hardware_revision]",
-                        )
-                    elif characteristic.uuid == SERIAL_NUMBER_CHARACTERISTIC:
-                        self.serial_number_characteristics[identifier] = characteristic
-                        ensure_future(
-                            self.read_serial_number(identifier),
-                            name="ble_manager[read_serial_number]",
-                        )
-                    elif characteristic.uuid == MODEL_NUMBER_CHARACTERISTIC:
-                        self.model_number_characteristics[identifier] = characteristic
-                        ensure_future(
-                            self.read_model_number(identifier),
-                            name="ble_manager[read_model_number]",
-                        )
+                    session.device_status_characteristic = characteristic
+                elif (field := DEVICE_INFO_FIELDS.get(characteristic.uuid)) is not None:
+                    session.info_characteristics[field] = characteristic
+                    ensure_future(
+                        self._read_device_info(identifier, field),
+                        name=f"ble_manager[read_{field}]",
+                    )
                 elif characteristic.uuid == UART_TX_CHARACTERISTIC:
                     if characteristic.descriptors:
                         client = self.get_connected_peripheral(identifier)
@@ -444,7 +642,7 @@ class BleManager:
                                 client.start_notify(characteristic, uart_tx_notify_callback),
                                 name="ble_manager[start_notify:uart_tx]",
                             )
-                            status_char = self.device_status_characteristics.get(identifier)
+                            status_char = session.device_status_characteristic
                             if status_char:
                                 ensure_future(
                                     client.start_notify(status_char, uart_tx_notify_callback),
@@ -0,0 +1,139 @@
+"""Per-device connect failure tracking, backoff and circuit breaking."""
+
+import random
+import time
+from typing import Optional
+
+
+class ConnectHealth:
+    """Connect attempt history for a single device.
+
+    Each consecutive failure doubles the backoff (with jitter) up to MAX_BACKOFF_SECONDS. After
+    CIRCUIT_BREAKER_THRESHOLD consecutive failures the circuit opens and no further attempts are
+    allowed until new evidence arrives (see `note_evidence`) or CIRCUIT_RESET_SECONDS elapse, at
+    which point a single half-open attempt is allowed.
+    """
+
+    BASE_BACKOFF_SECONDS = 5.0
+    MAX_BACKOFF_SECONDS = 300.0
+    JITTER = 0.25
+    CIRCUIT_BREAKER_THRESHOLD = 5
+    CIRCUIT_RESET_SECONDS = 30 * 60.0
+    # Weight of the newest attempt in the exponentially-weighted failure rate.
+    FAILURE_RATE_ALPHA = 0.2
+
+    __slots__ = (
+        "attempts",
+        "successes",
+        "failures",
+        "rejections",
+        "consecutive_failures",
+        "failure_rate",
+        "backoff_until",
+        "circuit_opened_at",
+        "last_failure",
+        "last_success",
+        "last_connectable",
+    )
+
+    def __init__(self) -> None:
+        self.attempts = 0
+        self.successes = 0
+        self.failures = 0
+        self.rejections = 0
+        self.consecutive_failures = 0
+        self.failure_rate = 0.0
+        self.backoff_until = 0.0
+        self.circuit_opened_at: Optional[float] = None
+        self.last_failure: Optional[float] = None
+        self.last_success: Optional[float] = None
+        self.last_connectable: Optional[bool] = None
+
+    @property
+    def circuit_open(self) -> bool:
+        return self.circuit_opened_at is not None
+
+    def allows_attempt(self, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        if self.circuit_opened_at is not None:
+            if now - self.circuit_opened_at < self.CIRCUIT_RESET_SECONDS:
+                return False
+            # Half-open: allow one attempt; a failure re-opens the circuit immediately.
+            self.circuit_opened_at = None
+            return True
+        return now >= self.backoff_until
+
+    def note_success(self, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self.attempts += 1
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.failure_rate *= 1.0 - self.FAILURE_RATE_ALPHA
+        self.backoff_until = 0.0
+        self.circuit_opened_at = None
+        self.last_success = now
+
+    def note_failure(self, now: Optional[float] = None) -> float:
+        """Record a failed connect. Returns the backoff applied, in seconds."""
+        now = time.monotonic() if now is None else now
+        self.attempts += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.failure_rate += self.FAILURE_RATE_ALPHA * (1.0 - self.failure_rate)
+        self.last_failure = now
+
+        if self.consecutive_failures >= self.CIRCUIT_BREAKER_THRESHOLD:
+            self.circuit_opened_at = now
+
+        delay = self.backoff_seconds(self.consecutive_failures)
+        self.backoff_until = now + delay
+        return delay
+
+    def note_rejected(self, now: Optional[float] = None) -> float:
+        """Record an attempt that never reached the radio (e.g. no free connection slot).
+
+        Backs off like a first failure but does not count towards the circuit breaker.
+        """
+        now = time.monotonic() if now is None else now
+        self.rejections += 1
+        delay = self.backoff_seconds(1)
+        self.backoff_until = max(self.backoff_until, now + delay)
+        return delay
+
+    def note_evidence(self) -> None:
+        """Something changed that makes a connect worth trying again."""
+        if self.circuit_opened_at is not None:
+            self.circuit_opened_at = None
+            # Keep consecutive_failures so one more failure re-opens the circuit.
+            self.consecutive_failures = self.CIRCUIT_BREAKER_THRESHOLD - 1
+        self.backoff_until = 0.0
+
+    def note_connectable(self, connectable: bool) -> None:
+        if connectable and self.last_connectable is False:
+            self.note_evidence()
+        self.last_connectable = connectable
+
+    @classmethod
+    def backoff_seconds(cls, consecutive_failures: int) -> float:
+        exponent = max(0, consecutive_failures - 1)
+        delay = min(cls.MAX_BACKOFF_SECONDS, cls.BASE_BACKOFF_SECONDS * (2**exponent))
+        return delay * random.uniform(1.0 - cls.JITTER, 1.0 + cls.JITTER)
+
+    def as_dict(self, now: Optional[float] = None) -> dict:
+        now = time.monotonic() if now is None else now
+        return {
+            "attempts": self.attempts,
+            "successes": self.successes,
+            "failures": self.failures,
+            "rejections": self.rejections,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_rate": round(self.failure_rate, 3),
+            "circuit_open": self.circuit_open,
+            "backoff_remaining": round(max(0.0, self.backoff_until - now), 1),
+            "seconds_since_failure": (
+                round(now - self.last_failure, 1) if self.last_failure is not None else None
+            ),
+            "seconds_since_success": (
+                round(now - self.last_success, 1) if self.last_success is not None else None
+            ),
+        }
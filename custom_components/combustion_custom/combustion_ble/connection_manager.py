@@ -1,7 +1,9 @@
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
+import random
 from typing import TYPE_CHECKING, Optional
 
+from .connect_health import ConnectHealth
 from .devices.device import Device
 from .logger import LOGGER
 from .utilities.asyncio_utils import ensure_future
@@ -13,62 +15,77 @@ if TYPE_CHECKING:
 
 
 class ConnectionManager:
+    # Delay before connecting to a newly-advertising probe, to let MeatNet routes show up first.
+    PROBE_CONNECT_DELAY_SECONDS = 3.0
+    PROBE_CONNECT_DELAY_JITTER = 0.5
+
     def __init__(self, device_manager: "DeviceManager"):
         self.meat_net_enabled = False
         self.dfu_mode_enabled = False
         self.connection_timers: dict[str, asyncio.Task] = {}
         self.last_status_update: dict[str, datetime] = {}
         self.PROBE_STATUS_STALE_TIMEOUT = 10.0
-        # Cooldown windows to avoid hammering the BLE stack on repeated failures.
-        self._probe_connect_backoff_until: dict[str, datetime] = {}
-        self._node_connect_backoff_until: dict[str, datetime] = {}
-        self.CONNECT_FAILURE_BACKOFF_SECONDS = 5.0
+        # Per-device exponential backoff / circuit breaker, to avoid hammering the BLE stack
+        # with connects to devices that keep refusing them.
+        self._connect_health: dict[str, ConnectHealth] = {}
         self.device_manager = device_manager
 
-    def _in_backoff(self, backoff_map: dict[str, datetime], key: str) -> bool:
-        until = backoff_map.get(key)
-        return bool(until and datetime.now() < until)
+    @staticmethod
+    def _health_key(device: Device) -> str:
+        serial = getattr(device, "serial_number_string", None)
+        if isinstance(serial, str):
+            return serial
+        return device.ble_identifier or device.unique_identifier
 
-    def note_connect_failed(self, device: Device) -> None:
-        until = datetime.now() + timedelta(seconds=self.CONNECT_FAILURE_BACKOFF_SECONDS)
-
-        if hasattr(device, "serial_number_string"):
-            serial = getattr(device, "serial_number_string")
-            if isinstance(serial, str):
-                self._probe_connect_backoff_until[serial] = until
-                LOGGER.debug(
-                    "Backoff probe connect (%s) for %ss",
-                    serial,
-                    self.CONNECT_FAILURE_BACKOFF_SECONDS,
-                )
-                return
+    def _health_for(self, device: Device) -> ConnectHealth:
+        key = self._health_key(device)
+        health = self._connect_health.get(key)
+        if health is None:
+            health = self._connect_health[key] = ConnectHealth()
+        return health
+
+    def _connect_allowed(self, device: Device) -> bool:
+        health = self._connect_health.get(self._health_key(device))
+        return health is None or health.allows_attempt()
 
-        # Fallback: use BLE identifier / unique identifier for nodes
-        key = device.ble_identifier or device.unique_identifier
-        self._node_connect_backoff_until[key] = until
+    def note_connect_failed(self, device: Device) -> None:
+        health = self._health_for(device)
+        delay = health.note_failure()
         LOGGER.debug(
-            "Backoff node connect (%s) for %ss",
-            key,
-            self.CONNECT_FAILURE_BACKOFF_SECONDS,
+            "Backoff connect (%s) for %.1fs after %d consecutive failures%s",
+            self._health_key(device),
+            delay,
+            health.consecutive_failures,
+            "; circuit open" if health.circuit_open else "",
         )
 
+    def note_connect_rejected(self, device: Device) -> None:
+        delay = self._health_for(device).note_rejected()
+        LOGGER.debug("Connect (%s) deferred for %.1fs", self._health_key(device), delay)
+
     def note_connect_succeeded(self, device: Device) -> None:
-        if hasattr(device, "serial_number_string"):
-            serial = getattr(device, "serial_number_string")
-            if isinstance(serial, str) and serial in self._probe_connect_backoff_until:
-                del self._probe_connect_backoff_until[serial]
-                return
+        self._health_for(device).note_success()
 
-        key = device.ble_identifier or device.unique_identifier
-        if key in self._node_connect_backoff_until:
-            del self._node_connect_backoff_until[key]
+    def note_advertising(self, device: Device, was_stale: bool = False) -> None:
+        """Feed advertising-side evidence that a refused device may now accept a connection."""
+        health = self._connect_health.get(self._health_key(device))
+        if health is None:
+            return
+        if was_stale:
+            # The device dropped off the air and came back (e.g. power cycled).
+            health.note_evidence()
+        health.note_connectable(device.is_connectable)
+
+    def connection_diagnostics(self) -> dict[str, dict]:
+        """Connect statistics per device, keyed by probe serial or node BLE identifier."""
+        return {key: health.as_dict() for key, health in self._connect_health.items()}
 
     def received_probe_advertising(self, probe: Optional["Probe"]):
         if probe is None:
             return
 
         # Avoid repeated connect storms if the probe (or the host) is currently refusing connects.
-        if self._in_backoff(self._probe_connect_backoff_until, probe.serial_number_string):
+        if not self._connect_allowed(probe):
             return
 
         probe_status_stale = True
@@ -98,7 +115,13 @@ class ConnectionManager:
             del self.connection_timers[probe.serial_number_string]
 
     async def connect_probe_after_delay(self, probe: "Probe"):
-        await asyncio.sleep(3)
+        # Jitter spreads out connects when many probes start advertising at once.
+        await asyncio.sleep(
+            self.PROBE_CONNECT_DELAY_SECONDS
+            * random.uniform(
+                1.0 - self.PROBE_CONNECT_DELAY_JITTER, 1.0 + self.PROBE_CONNECT_DELAY_JITTER
+            )
+        )
         updated_probe = self.get_probe_with_serial(probe.serial_number_string)
         if updated_probe:
             await updated_probe.connect()
@@ -106,11 +129,19 @@ class ConnectionManager:
 
     def received_probe_advertising_from_node(self, probe: Optional["Probe"], node: "MeatNetNode"):
         if self.meat_net_enabled:
-            node_key = node.ble_identifier or node.unique_identifier
-            if self._in_backoff(self._node_connect_backoff_until, node_key):
+            if not self._connect_allowed(node):
                 return
             ensure_future(node.connect(), "probe.connect[meatnet]")
 
+    def received_gauge_advertising(self, gauge: "MeatNetNode"):
+        """Hold a connection to each Gauge so its status and logs arrive over UART."""
+        if (
+            self.meat_net_enabled
+            and gauge.connection_state == Device.ConnectionState.DISCONNECTED
+            and self._connect_allowed(gauge)
+        ):
+            ensure_future(gauge.connect(), "gauge.connect[meatnet]")
+
     def received_status_for(self, probe: "Probe", direct_connection: bool):
         self.last_status_update[probe.serial_number_string] = datetime.now()
 
@@ -0,0 +1,137 @@
+"""Bounded pool of BLE connection slots."""
+
+import enum
+import time
+from typing import Callable, Optional
+
+
+class ConnectionPriority(enum.IntEnum):
+    """Base priority classes. Higher values keep their slot over lower ones."""
+
+    REDUNDANT_PROBE = 0
+    """Direct Probe link for a Probe that is already reachable through a connected Node."""
+
+    PROBE = 100
+    """Direct Probe link."""
+
+    NODE = 1000
+    """MeatNet Node / Gauge link. The number of Probes it covers is added on top."""
+
+
+PriorityFunction = Callable[[str], int]
+
+
+class _Slot:
+    __slots__ = ("identifier", "acquired_at", "last_activity", "connected")
+
+    def __init__(self, identifier: str, now: float) -> None:
+        self.identifier = identifier
+        self.acquired_at = now
+        self.last_activity = now
+        self.connected = False
+
+
+class ConnectionPool:
+    """Slot accounting for concurrent BLE connections.
+
+    Adapters can only hold a handful of links. Every connect attempt (pending or established)
+    occupies a slot; when the pool is full a new attempt may evict an established link with a
+    lower priority, or an idle one of equal priority. Otherwise the attempt is rejected.
+    """
+
+    DEFAULT_MAX_SLOTS = 3
+    IDLE_TIMEOUT_SECONDS = 30.0
+
+    def __init__(
+        self, max_slots: int = DEFAULT_MAX_SLOTS, priority: Optional[PriorityFunction] = None
+    ) -> None:
+        self.max_slots = max(1, max_slots)
+        self.priority: PriorityFunction = priority or (lambda identifier: 0)
+        self._slots: dict[str, _Slot] = {}
+
+        self.acquisitions = 0
+        self.rejections = 0
+        self.evictions = 0
+        self.peak_in_use = 0
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self._slots
+
+    @property
+    def in_use(self) -> int:
+        return len(self._slots)
+
+    @property
+    def utilization(self) -> float:
+        return len(self._slots) / self.max_slots
+
+    def reserve(self, identifier: str) -> tuple[bool, Optional[str]]:
+        """Reserve a slot for a connect attempt.
+
+        Returns (granted, victim). When `victim` is set its slot has been handed over and the
+        caller is responsible for disconnecting it.
+        """
+        if identifier in self._slots:
+            return True, None
+
+        now = time.monotonic()
+        victim: Optional[str] = None
+        if len(self._slots) >= self.max_slots:
+            victim = self._choose_victim(self.priority(identifier), now)
+            if victim is None:
+                self.rejections += 1
+                return False, None
+            del self._slots[victim]
+            self.evictions += 1
+
+        self._slots[identifier] = _Slot(identifier, now)
+        self.acquisitions += 1
+        self.peak_in_use = max(self.peak_in_use, len(self._slots))
+        return True, victim
+
+    def mark_connected(self, identifier: str) -> None:
+        if slot := self._slots.get(identifier):
+            slot.connected = True
+            slot.last_activity = time.monotonic()
+
+    def touch(self, identifier: str) -> None:
+        """Record traffic on a link so it is not considered idle."""
+        if slot := self._slots.get(identifier):
+            slot.last_activity = time.monotonic()
+
+    def release(self, identifier: str) -> None:
+        self._slots.pop(identifier, None)
+
+    def resize(self, max_slots: int) -> None:
+        """Change the slot count. Existing links above the new limit are kept until released."""
+        self.max_slots = max(1, max_slots)
+
+    def clear(self) -> None:
+        self._slots.clear()
+
+    def stats(self) -> dict[str, float | int]:
+        return {
+            "max_slots": self.max_slots,
+            "in_use": len(self._slots),
+            "connected": sum(1 for slot in self._slots.values() if slot.connected),
+            "pending": sum(1 for slot in self._slots.values() if not slot.connected),
+            "utilization": self.utilization,
+            "peak_in_use": self.peak_in_use,
+            "acquisitions": self.acquisitions,
+            "rejections": self.rejections,
+            "evictions": self.evictions,
+        }
+
+    def _choose_victim(self, requested_priority: int, now: float) -> Optional[str]:
+        best: Optional[tuple[int, float, str]] = None
+        for identifier, slot in self._slots.items():
+            # Never tear down a connect that is still in flight.
+            if not slot.connected:
+                continue
+            priority = self.priority(identifier)
+            idle = (now - slot.last_activity) > self.IDLE_TIMEOUT_SECONDS
+            if priority < requested_priority or (idle and priority <= requested_priority):
+                candidate = (priority, slot.last_activity, identifier)
+                if best is None or candidate < best:
+                    best = candidate
+        return best[2] if best else None
@@ -0,0 +1,67 @@
+"""Device Information Service values cached by BLE address."""
+
+import time
+from typing import Any, Callable, Optional
+
+FIRMWARE_REVISION = "firmware_revision"
+HARDWARE_REVISION = "hardware_revision"
+SERIAL_NUMBER = "serial_number"
+MODEL_NUMBER = "model_number"
+
+# Per-field store times, keyed by field name.
+_UPDATED = "updated"
+
+
+class DeviceInfoCache:
+    """Firmware/hardware revision, serial and model number per BLE address.
+
+    These values do not change between connections, so once read they are served from here
+    instead of issuing a GATT read on every reconnect. Entries older than MAX_AGE_SECONDS are
+    ignored so a firmware upgrade is eventually picked up. The owner is responsible for
+    persistence: `load()` restores a previous `as_dict()` snapshot and `on_change` fires
+    whenever a value is stored, including a re-read that confirms an unchanged value.
+    """
+
+    MAX_AGE_SECONDS = 7 * 24 * 60 * 60.0
+
+    def __init__(self) -> None:
+        self._entries: dict[str, dict[str, Any]] = {}
+        self.on_change: Optional[Callable[[], None]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, identifier: str, field: str) -> Optional[str]:
+        entry = self._entries.get(identifier)
+        if entry is None or field not in entry:
+            self.misses += 1
+            return None
+        if time.time() - entry[_UPDATED].get(field, 0.0) > self.MAX_AGE_SECONDS:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[field]
+
+    def set(self, identifier: str, field: str, value: str) -> None:
+        entry = self._entries.setdefault(identifier, {_UPDATED: {}})
+        # Stored even when unchanged: the read re-validates the value and restarts its age.
+        entry[field] = value
+        entry[_UPDATED][field] = time.time()
+        if self.on_change:
+            self.on_change()
+
+    def forget(self, identifier: str) -> None:
+        if self._entries.pop(identifier, None) is not None and self.on_change:
+            self.on_change()
+
+    def load(self, data: dict[str, dict[str, Any]]) -> None:
+        self._entries = {}
+        for identifier, entry in data.items():
+            if not isinstance(entry, dict) or not isinstance(entry.get(_UPDATED), dict):
+                continue
+            self._entries[identifier] = {**entry, _UPDATED: dict(entry[_UPDATED])}
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        return {
+            identifier: {**entry, _UPDATED: dict(entry[_UPDATED])}
+            for identifier, entry in self._entries.items()
+        }
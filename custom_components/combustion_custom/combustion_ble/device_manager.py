@@ -1,7 +1,8 @@
 """Device Manager."""
 
 import asyncio
-from typing import Callable, Optional
+import time
+from typing import TYPE_CHECKING, Callable, Optional
 
 from bleak import AdvertisementDataCallback
 
@@ -11,15 +12,20 @@ from .ble_data.advertising_data import (
 )
 from .ble_data.gauge_advertising_data import GaugeAdvertisingData
 from .ble_data.hop_count import HopCount
+from .ble_data.mode_id import ModeId, ProbeMode
 from .ble_data.probe_status import ProbeStatus
 from .ble_manager import BleManager, BleManagerDelegate, BluetoothMode
 from .connection_manager import ConnectionManager
+from .connection_pool import ConnectionPriority
 from .devices.device import Device
 from .devices.meat_net_node import MeatNetNode
 from .devices.probe import Probe
 from .exceptions import DFUNotImplementedError
+from .log_backfill import LogBackfill, LogBatch
 from .logger import LOGGER
 from .message_handlers import MessageHandlers
+from .metrics import DECODE_NODE_UART, DECODE_PROBE_UART, Metrics
+from .rssi_tracker import RssiTracker
 from .uart import (
     LogRequest,
     LogResponse,
@@ -35,9 +41,12 @@ from .uart import (
     responses_from_data,
 )
 from .uart.meatnet import (
+    NodeGaugeStatusRequest,
     NodeProbeStatusRequest,
     NodeReadFirmwareRevisionRequest,
     NodeReadFirmwareRevisionResponse,
+    NodeReadGaugeLogsRequest,
+    NodeReadGaugeLogsResponse,
     NodeReadHardwareRevisionRequest,
     NodeReadHardwareRevisionResponse,
     NodeReadLogsRequest,
@@ -51,8 +60,14 @@ from .uart.meatnet import (
     NodeSetPredictionResponse,
     NodeUARTMessage,
 )
+from .utilities.asyncio_utils import ensure_future
+from .utilities.monitor import RemoveListener
+
+if TYPE_CHECKING:
+    from .simulation import SimulatedFleet, SimulatedProbe
 
 DeviceListener = Callable[[list[Device], list[Device]], None]
+DeviceKindListener = Callable[[Device], None]
 
 
 class DeviceManager(BleManagerDelegate):
@@ -98,37 +113,73 @@ class DeviceManager(BleManagerDelegate):
         self.connection_manager = ConnectionManager(self)
         self.message_handlers = MessageHandlers()
         self.device_listeners: list[DeviceListener] = []
+        self.device_kind_listeners: list[DeviceKindListener] = []
+        self.rssi_tracker: RssiTracker[str] = RssiTracker()
+        self._remove_rssi_listeners: dict[str, RemoveListener] = {}
+        self.metrics = Metrics.shared
+        self.simulated_fleet: Optional["SimulatedFleet"] = None
+        self.log_backfill = LogBackfill(self._merge_log_batch, self.metrics)
+        # Default target (C) for probes' local cook-time estimates; None leaves them off.
+        self.local_prediction_target: Optional[float] = None
         DeviceManager.shared = self
         BleManager.shared.delegate = self
-        self.timer_task: asyncio.Task | None = asyncio.create_task(self._start_timers())
+        # Started with the first device: there is nothing to time out before then.
+        self.timer_task: asyncio.Task | None = None
+        self._stopped = False
 
     async def init_bluetooth(
-        self, mode: BluetoothMode = BluetoothMode.ACTIVE
+        self, mode: BluetoothMode = BluetoothMode.ACTIVE, adapters: Optional[list[str]] = None
     ) -> Optional[AdvertisementDataCallback]:
-        """Initialize bluetooth operations."""
-        return await BleManager.shared.init_bluetooth(mode=mode)
+        """Initialize bluetooth operations.
+
+        Pass several `adapters` (e.g. ["hci0", "hci1"]) in active mode to scan on all of them
+        and spread connections across them.
+        """
+        return await BleManager.shared.init_bluetooth(mode=mode, adapters=adapters)
+
+    def add_device_listener(
+        self, listener: DeviceListener, kind_listener: DeviceKindListener | None = None
+    ) -> RemoveListener:
+        """Add a device listener to be notified when devices are added or removed.
 
-    def add_device_listener(self, listener: DeviceListener) -> None:
-        """Add a device listener to be notified when devices are added or removed."""
+        If `kind_listener` is provided, it is notified when an existing device changes kind
+        (e.g. a MeatNet Node reveals itself to be a Gauge).
+        """
         self.device_listeners.append(listener)
+        if kind_listener:
+            self.device_kind_listeners.append(kind_listener)
+
+        def remove():
+            """Remove the listener(s)"""
+            if listener in self.device_listeners:
+                self.device_listeners.remove(listener)
+            if kind_listener and kind_listener in self.device_kind_listeners:
+                self.device_kind_listeners.remove(kind_listener)
+
+        return remove
 
     def clear_device_listeners(self) -> None:
         """Remove all device listeners."""
         self.device_listeners = []
+        self.device_kind_listeners = []
 
     async def async_stop(self):
         """Stop all asynchronous tasks and BLE scanning. Must be called prior to terminating your application."""
+        self._stopped = True
         if self.timer_task:
             self.timer_task.cancel()
             self.timer_task = None
 
+        await self.stop_simulation()
+        self.log_backfill.cancel()
+
         # Attempt to disconnect from all devices.
         for key in self.devices:
             try:
                 device = self.devices[key]
                 await device.disconnect()
                 if isinstance(device, Probe):
-                    device.stop_session_request_timer()
+                    device.stop_timers()
                     self.connection_manager.clear_handlers_for_probe(
                         device, msg="device_manager::async_stop"
                     )
@@ -146,6 +197,7 @@ class DeviceManager(BleManagerDelegate):
         while True:
             self._update_device_stale_status()
             self.message_handlers.check_for_timeout()
+            self.metrics.sample_rates()
             await asyncio.sleep(1)
 
     def _update_device_stale_status(self):
@@ -153,9 +205,39 @@ class DeviceManager(BleManagerDelegate):
         for key, device in self.devices.items():
             device._update_device_stale()
 
-    def add_simulated_probe(self):
-        # Placeholder for adding a simulated probe
-        pass
+    def add_simulated_probe(self) -> "SimulatedProbe":
+        """Add a simulated Probe, starting an empty simulated fleet if none is running."""
+        if self.simulated_fleet is None:
+            self.start_simulation(probes=0, nodes=0)
+        return self.simulated_fleet.add_probe()
+
+    def start_simulation(self, **options) -> "SimulatedFleet":
+        """Start a simulated fleet of probes, nodes and gauges. See SimulatedFleet for options."""
+        # Only needed for development and tests; keep it out of the production import.
+        from .simulation import SimulatedFleet
+
+        if self.simulated_fleet is not None:
+            raise RuntimeError("A simulation is already running.")
+        self.simulated_fleet = SimulatedFleet(BleManager.shared, **options)
+        self.simulated_fleet.start()
+        return self.simulated_fleet
+
+    async def stop_simulation(self) -> None:
+        if self.simulated_fleet is not None:
+            fleet, self.simulated_fleet = self.simulated_fleet, None
+            await fleet.stop()
+
+    def set_max_connections(self, max_connections: int):
+        """Limit the number of concurrent BLE connections the adapter is asked to hold."""
+        BleManager.shared.set_max_connections(max_connections)
+
+    def set_advertisement_batching(self, window_seconds: Optional[float]):
+        """Coalesce advertisements over `window_seconds` before processing; 0 or None disables."""
+        BleManager.shared.set_advertisement_batching(window_seconds)
+
+    def set_local_prediction_target(self, target_celsius: Optional[float]):
+        """Default core target for Probe.local_prediction; 0 or None disables the estimate."""
+        self.local_prediction_target = target_celsius or None
 
     def enable_meatnet(self):
         self.connection_manager.meat_net_enabled = True
@@ -165,12 +247,36 @@ class DeviceManager(BleManagerDelegate):
 
     def _add_device(self, device: Device):
         self.devices[device.unique_identifier] = device
+        if self.timer_task is None and not self._stopped:
+            self.timer_task = asyncio.create_task(self._start_timers())
+        self._track_rssi(device)
         for listener in self.device_listeners:
             listener([device], [])
 
+    def _track_rssi(self, device: Device):
+        key = device.unique_identifier
+        self.rssi_tracker.update(key, device.rssi)
+
+        def rssi_updated(rssi: int):
+            self.rssi_tracker.update(key, rssi)
+
+        self._remove_rssi_listeners[key] = device.add_rssi_listener(rssi_updated)
+
+    def _device_kind_changed(self, device: Device):
+        for listener in self.device_kind_listeners:
+            listener(device)
+
     def _clear_device(self, device: Device):
         if device.unique_identifier in self.devices:
             del self.devices[device.unique_identifier]
+            if remove_rssi_listener := self._remove_rssi_listeners.pop(
+                device.unique_identifier, None
+            ):
+                remove_rssi_listener()
+            self.rssi_tracker.remove(device.unique_identifier)
+            if device.ble_identifier:
+                self.metrics.forget_device(device.ble_identifier)
+                BleManager.shared.adapters.forget_device(device.ble_identifier)
             for listener in self.device_listeners:
                 listener([], [device])
 
@@ -193,8 +299,21 @@ class DeviceManager(BleManagerDelegate):
         return list(self.devices.values())
 
     def get_nearest_device(self) -> Optional[Device]:
-        nearest = max(self.get_devices(), key=lambda device: device.rssi, default=None)
-        return nearest
+        if best := self.rssi_tracker.best:
+            return self.devices.get(best[0])
+        return None
+
+    def get_best_rssi(self) -> Optional[int]:
+        """Strongest RSSI across all known devices, maintained incrementally."""
+        return self.rssi_tracker.best_rssi
+
+    def get_top_rssi_devices(self) -> list[tuple[Device, int]]:
+        """Strongest devices (up to RssiTracker.top_k), strongest first."""
+        return [
+            (self.devices[key], rssi)
+            for key, rssi in self.rssi_tracker.top()
+            if key in self.devices
+        ]
 
     def _get_best_node_for_probe(self, serial_number: int) -> MeatNetNode | None:
         """Gets the best Node for communicating with a Probe."""
@@ -225,6 +344,16 @@ class DeviceManager(BleManagerDelegate):
 
         return None
 
+    def find_gauge_by_serial_number(self, serial_number: str) -> MeatNetNode | None:
+        return next(
+            (
+                device
+                for device in self.devices.values()
+                if isinstance(device, MeatNetNode) and device.gauge_serial == serial_number
+            ),
+            None,
+        )
+
     async def _connect_to_device(self, device: Device):
         if device.ble_identifier:
             # If this device has a BLE identifier (advertisements are directly detected rather than through MeatNet), attempt to connect to it.
@@ -237,12 +366,24 @@ class DeviceManager(BleManagerDelegate):
             # attempt to disconnect from it.
             await BleManager.shared.disconnect(device.ble_identifier)
 
+    async def request_gauge_logs(
+        self, identifier: str, gauge: MeatNetNode, min_sequence: int, max_sequence: int
+    ):
+        """Ask the node at `identifier` (the Gauge itself or one repeating it) for Gauge logs."""
+        request = NodeReadGaugeLogsRequest(
+            serial_number=gauge.gauge_serial, min_sequence=min_sequence, max_sequence=max_sequence
+        )
+        await BleManager.shared.send_request(identifier=identifier, request=request)
+
     async def request_logs_from(self, device: Device, min_sequence: int, max_sequence: int):
         if isinstance(device, Probe):
             target_device = self._get_best_route_to_probe(device.serial_number)
             if isinstance(target_device, Probe) and target_device.ble_identifier:
                 # Request logs directly from Probe
                 request = LogRequest(min_sequence=min_sequence, max_sequence=max_sequence - 1)
+                self.log_backfill.expect(
+                    target_device.ble_identifier, max_sequence - min_sequence, from_node=False
+                )
                 await BleManager.shared.send_request(target_device.ble_identifier, request)
             elif isinstance(target_device, MeatNetNode) and target_device.ble_identifier:
                 # If the best route is through a Node, send it that way.
@@ -251,6 +392,9 @@ class DeviceManager(BleManagerDelegate):
                     min_sequence=min_sequence,
                     max_sequence=max_sequence,
                 )
+                self.log_backfill.expect(
+                    target_device.ble_identifier, max_sequence - min_sequence + 1, from_node=True
+                )
                 await BleManager.shared.send_request(
                     identifier=target_device.ble_identifier, request=node_request
                 )
@@ -369,11 +513,34 @@ class DeviceManager(BleManagerDelegate):
             device._update_connection_state(Device.ConnectionState.FAILED)
             self.connection_manager.note_connect_failed(device)
 
+    def did_reject_connect_to(self, identifier):
+        device = self.find_device_by_ble_identifier(identifier)
+        if device:
+            device._update_connection_state(Device.ConnectionState.FAILED)
+            self.connection_manager.note_connect_rejected(device)
+
+    def connection_priority(self, identifier: str) -> int:
+        device = self.find_device_by_ble_identifier(identifier)
+        if isinstance(device, MeatNetNode):
+            # Nodes covering more probes are worth more than any direct probe link.
+            return ConnectionPriority.NODE + len(device.probes)
+        if isinstance(device, Probe):
+            if self._get_best_node_for_probe(device.serial_number):
+                return ConnectionPriority.REDUNDANT_PROBE
+            return ConnectionPriority.PROBE
+        return 0
+
+    def did_evict_connection(self, identifier: str):
+        if device := self.find_device_by_ble_identifier(identifier):
+            # Stop the device from immediately reconnecting once the evicted link drops.
+            device.maintaining_connection = False
+
     def did_disconnect_from(self, identifier: str):
         device = self.find_device_by_ble_identifier(identifier)
         if device:
             device._update_connection_state(Device.ConnectionState.DISCONNECTED)
             self.message_handlers.clear_handlers_for_device(identifier)
+        self.log_backfill.forget(identifier)
 
     def update_device_hw_revision(self, identifier: str, revision: str):
         if device := self.find_device_by_ble_identifier(identifier):
@@ -411,9 +578,13 @@ class DeviceManager(BleManagerDelegate):
     ):
         """Determines which Device to create/update based on received AdvertisingData."""
         if advertising.type == CombustionProductType.PROBE:
+            existing = self.devices.get(str(advertising.serial_number))
+            was_stale = bool(existing and existing.stale)
             probe = self.update_probe_with_advertising(
                 advertising, is_connectable, rssi, identifier
             )
+            if probe:
+                self.connection_manager.note_advertising(probe, was_stale)
             self.connection_manager.received_probe_advertising(probe)
         elif advertising.type == CombustionProductType.MEAT_NET_NODE:
             if not self.connection_manager.meat_net_enabled:
@@ -423,7 +594,9 @@ class DeviceManager(BleManagerDelegate):
             meatnet_node = None
             new_node = False
             if (meatnet_node := self.devices.get(identifier)) and isinstance(meatnet_node, MeatNetNode):
+                was_stale = meatnet_node.stale
                 meatnet_node.update_with_advertising(advertising, is_connectable, rssi)
+                self.connection_manager.note_advertising(meatnet_node, was_stale)
 
             else:
                 # Create node and add to device list
@@ -445,6 +618,40 @@ class DeviceManager(BleManagerDelegate):
                         probe, meatnet_node
                     )
 
+    def update_device_with_repeated_probe_header(
+        self,
+        identifier: str,
+        serial_number: int,
+        mode_byte: int,
+        network_info_byte: int,
+        is_connectable: bool,
+        rssi: int,
+    ) -> bool:
+        """Handle a node's copy of a probe advertisement without decoding it, if possible.
+
+        Only copies from known nodes about known probes that the probe's mode/hop arbitration
+        would reject are handled here; everything else goes through the full decode.
+        """
+        if not self.connection_manager.meat_net_enabled:
+            return True
+        meatnet_node = self.devices.get(identifier)
+        if not isinstance(meatnet_node, MeatNetNode):
+            return False
+        probe = self.devices.get(str(serial_number))
+        if not isinstance(probe, Probe):
+            return False
+        hop_count = HopCount.from_network_info_byte(network_info_byte)
+        mode = ProbeMode(mode_byte & ModeId.PROBE_MODE_MASK)
+        if probe.would_update_with_repeated_advertising(mode, hop_count):
+            return False
+
+        was_stale = meatnet_node.stale
+        meatnet_node.update_with_repeated_advertising(is_connectable, rssi)
+        self.connection_manager.note_advertising(meatnet_node, was_stale)
+        probe.update_with_repeated_advertising(hop_count)
+        meatnet_node.update_networked_probe(probe)
+        return True
+
     def update_device_with_gauge_advertising(
         self, advertising: GaugeAdvertisingData, is_connectable: bool, rssi: int, identifier: str
     ):
@@ -458,13 +665,19 @@ class DeviceManager(BleManagerDelegate):
 
         node = self.devices.get(identifier)
         if node and isinstance(node, MeatNetNode):
+            was_gauge = node.is_gauge
             node.update_with_gauge_advertising(advertising, is_connectable, rssi)
+            if not was_gauge:
+                # A node that was first seen via repeated-probe advertising is actually a Gauge.
+                self._device_kind_changed(node)
+            self.connection_manager.received_gauge_advertising(node)
             return
 
         # Create a node record from Gauge advertising; repeated-probe advertising will fill in probes later.
         node = MeatNetNode(None, self, is_connectable, rssi, identifier)
         node.update_with_gauge_advertising(advertising, is_connectable, rssi)
         self._add_device(node)
+        self.connection_manager.received_gauge_advertising(node)
 
     def update_probe_with_advertising(
         self,
@@ -494,6 +707,17 @@ class DeviceManager(BleManagerDelegate):
         if (probe := self.find_device_by_ble_identifier(identifier)) and isinstance(probe, Probe):
             probe._process_log_response(log_response)
 
+    def _merge_log_batch(self, identifier: str, batch: LogBatch):
+        if batch.serial_numbers is None:
+            if (probe := self.find_device_by_ble_identifier(identifier)) and isinstance(
+                probe, Probe
+            ):
+                probe._merge_log_batch(batch)
+            return
+        for serial_number in set(batch.serial_numbers):
+            if probe := self.find_probe_by_serial_number(serial_number):
+                probe._merge_log_batch(batch, serial_number)
+
     def update_device_with_session_information(
         self, identifier: str, session_information: SessionInformation
     ):
@@ -503,19 +727,46 @@ class DeviceManager(BleManagerDelegate):
     def handle_uart_data(self, identifier: str, data: bytes):
         """Processes data received over UART, which could be Responses and/or Requests depending on the source."""
         if device := self.find_device_by_ble_identifier(identifier):
+            if self.log_backfill and identifier in self.log_backfill:
+                # Bulk log catch-up; those frames are decoded in batches off the loop.
+                if not (data := self.log_backfill.divert(identifier, data)):
+                    return
+            metrics = self.metrics
             if isinstance(device, Probe):
                 # If this was a Probe, treat all the data as responses
+                started = time.perf_counter_ns()
                 responses = responses_from_data(data)
+                metrics.note_decode(DECODE_PROBE_UART, started)
+                metrics.note_uart_data(len(data), len(responses))
+                offset = 0
                 for response in responses:
+                    metrics.note_response(identifier, data[offset + 4])
+                    offset += response.payload_length + Response.HEADER_LENGTH
                     self.handle_probe_uart_response(identifier, response)
+                if offset < len(data):
+                    metrics.note_undecoded(data[offset:], Response.HEADER_LENGTH, 6)
             elif isinstance(device, MeatNetNode):
                 # If this was a Node, the data could be Responses and/or Requests
+                started = time.perf_counter_ns()
                 messages = NodeUARTMessage.from_data(data)
+                metrics.note_decode(DECODE_NODE_UART, started)
+                metrics.note_uart_data(len(data), len(messages))
+                offset = 0
                 for message in messages:
                     if isinstance(message, NodeRequest):
+                        offset += message.payload_length + NodeRequest.HEADER_LENGTH
                         self.handle_node_uart_request(identifier, message)
                     elif isinstance(message, NodeResponse):
+                        metrics.note_response(
+                            identifier, data[offset + 4] & ~NodeResponse.RESPONSE_TYPE_FLAG
+                        )
+                        offset += message.payload_length + NodeResponse.HEADER_LENGTH
                         self.handle_node_uart_response(identifier, message)
+                if offset < len(data):
+                    if len(data) > offset + 4 and data[offset + 4] & NodeResponse.RESPONSE_TYPE_FLAG:
+                        metrics.note_undecoded(data[offset:], NodeResponse.HEADER_LENGTH, 14)
+                    else:
+                        metrics.note_undecoded(data[offset:], NodeRequest.HEADER_LENGTH, 9)
 
     def handle_probe_uart_response(self, identifier: str, response: Response):
         """Probe direct message handling"""
@@ -547,6 +798,17 @@ class DeviceManager(BleManagerDelegate):
             ):
                 if probe := self.find_probe_by_serial_number(request.serial_number):
                     node.update_networked_probe(probe)
+        elif isinstance(request, NodeGaugeStatusRequest):
+            gauge = self.find_gauge_by_serial_number(request.serial_number)
+            if gauge is None:
+                # Gauges are only known once their own advertising has been seen.
+                return
+            gauge.update_with_gauge_status(request.gauge_status, request.hop_count)
+            if missing := gauge.next_gauge_log_request():
+                ensure_future(
+                    self.request_gauge_logs(identifier, gauge, missing[0], missing[1]),
+                    name="request_gauge_logs",
+                )
         # elif isinstance(request, NodeSyncThermometerListRequest):
         #     if (node := self.find_device_by_ble_identifier(identifier)) and isinstance(
         #         node, MeatNetNode
@@ -580,3 +842,11 @@ class DeviceManager(BleManagerDelegate):
             probe = self.find_probe_by_serial_number(serial_number=response.probe_serial_number)
             if probe:
                 probe._process_log_response(log_response=response)
+        elif isinstance(response, NodeReadGaugeLogsResponse):
+            if response.success and (
+                gauge := self.find_gauge_by_serial_number(response.gauge_serial_number)
+            ):
+                gauge.add_gauge_log_record(
+                    response.sequence_number,
+                    response.raw_temperature if response.sensor_present else 0,
+                )
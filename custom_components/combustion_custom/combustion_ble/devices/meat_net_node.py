@@ -1,10 +1,14 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from datetime import datetime
+import time
 
 from ..ble_data.advertising_data import AdvertisingData
 from ..ble_data.gauge_advertising_data import GaugeAdvertisingData
+from ..ble_data.gauge_status import GaugeStatus
+from ..ble_data.hop_count import HopCount
 from ..devices.device import Device
 from ..dfu_manager import DFUDeviceType
+from ..gauge_log import GaugeTemperatureLog
 
 if TYPE_CHECKING:
     from ..device_manager import DeviceManager
@@ -12,6 +16,9 @@ if TYPE_CHECKING:
 
 
 class MeatNetNode(Device):
+    # A Gauge log request counts as lost once no record has arrived for this long.
+    GAUGE_LOG_RETRY_SECONDS = 10.0
+
     def __init__(
         self,
         advertising: AdvertisingData | None,
@@ -38,6 +45,13 @@ class MeatNetNode(Device):
         self.gauge_low_battery: bool | None = None
         self.gauge_alarm_high_raw: int | None = None
         self.gauge_alarm_low_raw: int | None = None
+        # From Gauge Status over UART
+        self.gauge_hop_count: HopCount | None = None
+        self.gauge_min_sequence_number: int | None = None
+        self.gauge_max_sequence_number: int | None = None
+        self._gauge_logs: list[GaugeTemperatureLog] = []
+        self._gauge_log_request: Optional[tuple[int, int]] = None
+        self._gauge_log_requested_at = 0.0
 
         if advertising is not None:
             self.update_with_advertising(advertising, is_connectable, rssi)
@@ -46,9 +60,18 @@ class MeatNetNode(Device):
             self.is_connectable = is_connectable
             self.last_update_time = datetime.now()
 
+    @property
+    def is_gauge(self) -> bool:
+        """True once Gauge-specific advertising has been seen from this node."""
+        return bool(self.gauge_serial)
+
     def update_with_advertising(
         self, advertising: AdvertisingData, is_connectable: bool, rssi: int
     ):
+        self.update_with_repeated_advertising(is_connectable, rssi)
+
+    def update_with_repeated_advertising(self, is_connectable: bool, rssi: int):
+        """Refresh link details for an advertisement whose probe payload was not decoded."""
         self._rssi.update(rssi)
         self.is_connectable = is_connectable
         self.last_update_time = datetime.now()
@@ -69,6 +92,62 @@ class MeatNetNode(Device):
         self.gauge_alarm_high_raw = advertising.alarm_high_raw
         self.gauge_alarm_low_raw = advertising.alarm_low_raw
 
+    def update_with_gauge_status(self, status: GaugeStatus, hop_count: HopCount):
+        """Update this Gauge from a Gauge Status message, sent by itself or a repeating node."""
+        self.last_update_time = datetime.now()
+        self.gauge_hop_count = hop_count
+        self.gauge_temperature_c = status.temperature_c
+        self.gauge_sensor_present = status.sensor_present
+        self.gauge_sensor_overheating = status.sensor_overheating
+        self.gauge_low_battery = status.low_battery
+        self.gauge_alarm_high_raw = status.alarm_high_raw
+        self.gauge_alarm_low_raw = status.alarm_low_raw
+        self.gauge_min_sequence_number = status.min_sequence_number
+        self.gauge_max_sequence_number = status.max_sequence_number
+        if self.gauge_log is None or self.gauge_log.id != status.session_information.session_id:
+            self._gauge_logs.append(
+                GaugeTemperatureLog(status.session_information, status.min_sequence_number)
+            )
+            self._gauge_log_request = None
+
+    @property
+    def gauge_log(self) -> Optional[GaugeTemperatureLog]:
+        """The Gauge log for the current session."""
+        return self._gauge_logs[-1] if self._gauge_logs else None
+
+    def add_gauge_log_record(self, sequence_number: int, raw_temperature: int) -> None:
+        if (log := self.gauge_log) is not None and log.add(sequence_number, raw_temperature):
+            # Progress on the outstanding request keeps it from being sent again.
+            self._gauge_log_requested_at = time.monotonic()
+
+    def next_gauge_log_request(self) -> Optional[tuple[int, int]]:
+        """The missing log range to ask the Gauge for, or None if it is already on its way.
+
+        While a request is streaming in, only records past its end are asked for. A request
+        that stops making progress for GAUGE_LOG_RETRY_SECONDS is sent again.
+        """
+        log = self.gauge_log
+        if log is None or self.gauge_max_sequence_number is None:
+            return None
+        missing = log.missing_range(
+            self.gauge_min_sequence_number or 0, self.gauge_max_sequence_number
+        )
+        if missing is None:
+            return None
+        lower, upper = missing
+        now = time.monotonic()
+        outstanding = self._gauge_log_request
+        if outstanding and now - self._gauge_log_requested_at < self.GAUGE_LOG_RETRY_SECONDS:
+            if lower >= outstanding[0]:
+                lower = max(lower, outstanding[1] + 1)
+            if lower > upper:
+                return None
+            self._gauge_log_request = (min(lower, outstanding[0]), upper)
+        else:
+            self._gauge_log_request = (lower, upper)
+            self._gauge_log_requested_at = now
+        return lower, upper
+
     def update_networked_probe(self, probe: "Probe"):
         if probe is not None:
             self.probes[probe.serial_number] = probe
@@ -6,14 +6,18 @@ from typing import TYPE_CHECKING, Coroutine, Optional
 
 from ..ble_data import AdvertisingData, CombustionProductType
 from ..ble_data.battery_status_virtual_sensors import BatteryStatus
+from ..ble_data.food_safe_data import FoodSafeData
 from ..ble_data.hop_count import HopCount
 from ..ble_data.mode_id import ProbeColor, ProbeID, ProbeMode
+from ..ble_data.prediction_mode import PredictionMode
 from ..ble_data.probe_status import ProbeStatus
 from ..ble_data.probe_temperatures import ProbeTemperatures
 from ..ble_data.virtual_sensors import VirtualSensors
 from ..devices.device import Device
+from ..food_safety import FoodSafeStatus, FoodSafetyCalculator
 from ..instant_read_filter import InstantReadFilter
 from ..logged_probe_data_count import LoggedProbeDataPoint
+from ..prediction.local_predictor import LocalPrediction, LocalPredictor
 from ..prediction.prediction_info import PredictionInfo
 from ..prediction.prediction_manager import PredictionManager
 from ..probe_temperature_log import ProbeTemperatureLog
@@ -24,6 +28,7 @@ from ..utilities.monitor import Monitorable, RemoveListener, UpdateListener
 
 if TYPE_CHECKING:
     from ..device_manager import DeviceManager
+    from ..log_backfill import LogBatch
 
 
 DEADBAND_RANGE_IN_CELSIUS = 0.05
@@ -132,6 +137,10 @@ class Probe(Device):
         self._last_normal_mode: Optional[datetime] = None
         self._last_normal_mode_hop_count: Optional[HopCount] = None
         self._prediction_manager = PredictionManager()
+        self._local_predictor = LocalPredictor()
+        self._food_safety = FoodSafetyCalculator()
+        # Target for the local estimate; overrides the probe's set point and the manager default.
+        self.local_prediction_target: Optional[float] = None
         self._instant_read_filter = InstantReadFilter()
         self._session_request_task: Optional[asyncio.Task] = None
 
@@ -204,11 +213,59 @@ class Probe(Device):
         """Prediction information."""
         return self._prediction_info.value
 
+    @property
+    def local_prediction(self) -> Optional[LocalPrediction]:
+        """Time to target estimated on the host from the core temperature history.
+
+        Works from advertising alone. The target is `local_prediction_target`, else the set
+        point of an active prediction on the probe, else the DeviceManager default.
+        """
+        target = self.local_prediction_target
+        if target is None:
+            info = self._prediction_info.value
+            if info and info.prediction_mode != PredictionMode.NONE:
+                target = info.prediction_set_point_temperature
+            else:
+                target = self.device_manager.local_prediction_target
+        if target is None:
+            return None
+        return self._local_predictor.estimate(target)
+
+    @property
+    def food_safe_data(self) -> Optional[FoodSafeData]:
+        """Food safe settings last reported by the probe."""
+        return self._food_safety.food_safe_data
+
+    @property
+    def food_safe_status(self) -> Optional[FoodSafeStatus]:
+        """Log reduction integrated on the host over this session's logged core temperatures."""
+        return self._food_safety.status
+
+    @property
+    def temperature_log(self) -> Optional[ProbeTemperatureLog]:
+        """The log of the current session."""
+        return self._get_current_temperature_log()
+
     def add_prediction_info_listener(
-        self, listener: UpdateListener[Optional[PredictionInfo]]
+        self, listener: UpdateListener[Optional[PredictionInfo]], high_rate: bool = False
     ) -> RemoveListener:
-        """Add a listener for prediction info changes."""
-        return self._prediction_info.add_update_listener(listener)
+        """Add a listener for prediction info changes.
+
+        Near the end of a cook the countdown is republished once per second; a `high_rate`
+        listener makes it republish every PredictionManager.LINEARIZATION_UPDATE_RATE_MS.
+        """
+        remove = self._prediction_info.add_update_listener(listener)
+        if not high_rate:
+            return remove
+
+        prediction_manager = self._prediction_manager
+        prediction_manager.high_rate_listeners += 1
+
+        def remove_high_rate():
+            remove()
+            prediction_manager.high_rate_listeners -= 1
+
+        return remove_high_rate
 
     async def _session_request_timer(self):
         while True:
@@ -223,6 +280,13 @@ class Probe(Device):
         if self._session_request_task and not self._session_request_task.done():
             self._session_request_task.cancel()
 
+    def stop_timers(self):
+        """Cancel the session, prediction and log timers this probe started."""
+        self.stop_session_request_timer()
+        self._prediction_manager.stop()
+        for log in self._temperature_logs:
+            log.stop()
+
     def _publish_prediction_info(self, prediction_info: PredictionInfo):
         self._prediction_info.update(prediction_info)
 
@@ -314,6 +378,27 @@ class Probe(Device):
                     )
                     # last_update_time already updated above
 
+    def would_update_with_repeated_advertising(
+        self, mode: ProbeMode, hop_count: HopCount
+    ) -> bool:
+        """Whether a node's copy of this probe's advertising would change any probe data.
+
+        Mirrors the checks in update_with_advertising, so a copy answering False only needs
+        update_with_repeated_advertising.
+        """
+        if self.connection_state == self.ConnectionState.CONNECTED:
+            return False
+        if mode == ProbeMode.NORMAL:
+            return self._should_update_normal_mode(hop_count)
+        if mode == ProbeMode.INSTANT_READ:
+            return self._should_update_instant_read(hop_count)
+        return False
+
+    def update_with_repeated_advertising(self, hop_count: HopCount):
+        """Keep the probe fresh from a repeated advertisement that was not decoded."""
+        self.last_update_time = datetime.now()
+        self._hop_count = hop_count
+
     def _update_id_color_battery(
         self, probe_id: ProbeID, probe_color: ProbeColor, probe_battery_status: BatteryStatus
     ):
@@ -332,6 +417,7 @@ class Probe(Device):
         ambient = virtual_sensors.virtual_ambient.temperature_from(temperatures)
 
         self._virtual_temperatures.update(VirtualTemperatures(core, surface, ambient))
+        self._local_predictor.add(core)
 
         self._check_overheating()
 
@@ -404,6 +490,8 @@ class Probe(Device):
                     device_status.battery_status_virtual_sensors.virtual_sensors,
                 )
 
+                if device_status.food_safe_data is not None:
+                    self._food_safety.food_safe_data = device_status.food_safe_data
                 self._add_data_to_log(LoggedProbeDataPoint.from_device_status(device_status))
 
                 self._last_normal_mode = datetime.now()
@@ -515,9 +603,37 @@ class Probe(Device):
         if current:
             current.append_data_point(data_point=data_point)
         elif self._session_information:
+            current = ProbeTemperatureLog(self._session_information)
+            current.append_data_point(data_point=data_point)
+            self._temperature_logs.append(current)
+        else:
+            return
+        if data_point.sequence_num is not None and data_point.virtual_core is not None:
+            self._food_safety_for(current).add(
+                data_point.sequence_num,
+                data_point.virtual_core.temperature_from(data_point.temperatures),
+            )
+
+    def _food_safety_for(self, log: ProbeTemperatureLog) -> FoodSafetyCalculator:
+        """The food safety calculator, restarted if `log` belongs to a new session."""
+        calculator = self._food_safety
+        if calculator.session_id != log.id:
+            calculator.reset(log.id, log.session_information.sample_period)
+        return calculator
+
+    def _merge_log_batch(self, batch: "LogBatch", serial_number: Optional[int] = None) -> None:
+        """Merge records decoded in bulk (see LogBackfill) into the current session log."""
+        log = self._get_current_temperature_log()
+        if log is None:
+            if not self._session_information:
+                return
             log = ProbeTemperatureLog(self._session_information)
-            log.append_data_point(data_point=data_point)
             self._temperature_logs.append(log)
+        log.insert_batch(batch, serial_number)
+        calculator = self._food_safety_for(log)
+        for row in batch.rows(serial_number):
+            calculator.add(batch.sequence_numbers[row], batch.core_temperature(row))
+        self._update_log_percent()
 
     def _process_log_response(self, log_response: LogResponse | NodeReadLogsResponse):
         # Process log response
@@ -0,0 +1,178 @@
+"""Pathogen log reduction integrated over a probe's core temperature log."""
+
+import math
+from typing import Iterable, Optional
+
+from .ble_data.food_safe_data import FoodSafeData, FoodSafeMode
+from .ble_data.food_safe_state import FoodSafeState
+
+# Caps 10 ** exponent so extreme readings or a tiny Z value cannot overflow.
+_MAX_EXPONENT = 100.0
+
+
+class FoodSafeStatus:
+    """Food safety computed on the host from the logged core temperatures."""
+
+    __slots__ = ("state", "log_reduction", "seconds_above_threshold", "sequence_number")
+
+    def __init__(
+        self,
+        state: FoodSafeState,
+        log_reduction: float,
+        seconds_above_threshold: float,
+        sequence_number: Optional[int],
+    ):
+        self.state = state
+        self.log_reduction = log_reduction
+        self.seconds_above_threshold = seconds_above_threshold
+        self.sequence_number = sequence_number
+
+    def __repr__(self) -> str:
+        return (
+            f"FoodSafeStatus(state={self.state.name}, log_reduction={self.log_reduction:.2f}, "
+            f"seconds_above_threshold={self.seconds_above_threshold}, "
+            f"sequence_number={self.sequence_number})"
+        )
+
+
+class FoodSafetyCalculator:
+    """Integrates lethality over core temperatures keyed by log sequence number.
+
+    Above the threshold temperature a sample kills at `10 ** ((T - Tref) / z) / D` log
+    reductions per second, with D (seconds), z and Tref from FoodSafeData. Each pair of adjacent
+    sequence numbers contributes one trapezoid of `sample_period` seconds, so a sample only
+    touches its two neighbours and can arrive in any order: backfilled history lands in the
+    gaps at O(1) per sample. Gaps that are never filled add nothing, which errs on the safe
+    side. Changing the parameters re-integrates the samples already seen.
+    """
+
+    __slots__ = (
+        "session_id",
+        "sample_period",
+        "_food_safe_data",
+        "_temperatures",
+        "_rates",
+        "_log_reduction",
+        "_seconds_above",
+        "_max_temperature",
+        "_newest",
+    )
+
+    def __init__(
+        self,
+        food_safe_data: Optional[FoodSafeData] = None,
+        session_id: Optional[int] = None,
+        sample_period_ms: int = 5000,
+    ):
+        self._food_safe_data = food_safe_data
+        self.reset(session_id, sample_period_ms)
+
+    def reset(self, session_id: Optional[int], sample_period_ms: int) -> None:
+        """Start over for a new logging session."""
+        self.session_id = session_id
+        self.sample_period = sample_period_ms / 1000.0
+        self._temperatures: dict[int, float] = {}
+        self._rates: dict[int, float] = {}
+        self._log_reduction = 0.0
+        self._seconds_above = 0.0
+        self._max_temperature: Optional[float] = None
+        self._newest: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._temperatures)
+
+    @property
+    def food_safe_data(self) -> Optional[FoodSafeData]:
+        return self._food_safe_data
+
+    @food_safe_data.setter
+    def food_safe_data(self, food_safe_data: Optional[FoodSafeData]) -> None:
+        if _parameters(food_safe_data) == _parameters(self._food_safe_data):
+            self._food_safe_data = food_safe_data
+            return
+        self._food_safe_data = food_safe_data
+        temperatures = self._temperatures
+        self.reset(self.session_id, int(self.sample_period * 1000))
+        self.add_many(temperatures.items())
+
+    @property
+    def log_reduction(self) -> float:
+        return self._log_reduction
+
+    @property
+    def seconds_above_threshold(self) -> float:
+        return self._seconds_above
+
+    def rate(self, temperature: float) -> float:
+        """Log reductions per second at `temperature`."""
+        data = self._food_safe_data
+        if (
+            data is None
+            or temperature < data.selected_threshold_reference_temperature
+            or data.d_value_at_rt <= 0.0
+            or data.z_value <= 0.0
+        ):
+            return 0.0
+        exponent = min((temperature - data.reference_temperature) / data.z_value, _MAX_EXPONENT)
+        return math.pow(10.0, exponent) / data.d_value_at_rt
+
+    def add(self, sequence_number: int, temperature: float) -> None:
+        """Add the core temperature logged at `sequence_number`; repeats are ignored."""
+        temperatures = self._temperatures
+        if sequence_number in temperatures:
+            return
+        temperatures[sequence_number] = temperature
+        rates = self._rates
+        rate = rates[sequence_number] = self.rate(temperature)
+        data = self._food_safe_data
+        threshold = data.selected_threshold_reference_temperature if data else math.inf
+        half_period = self.sample_period * 0.5
+        for neighbour in (sequence_number - 1, sequence_number + 1):
+            neighbour_rate = rates.get(neighbour)
+            if neighbour_rate is None:
+                continue
+            self._log_reduction += (rate + neighbour_rate) * half_period
+            if temperature >= threshold and temperatures[neighbour] >= threshold:
+                self._seconds_above += self.sample_period
+
+        if self._max_temperature is None or temperature > self._max_temperature:
+            self._max_temperature = temperature
+        if self._newest is None or sequence_number > self._newest:
+            self._newest = sequence_number
+
+    def add_many(self, samples: Iterable[tuple[int, float]]) -> None:
+        for sequence_number, temperature in samples:
+            self.add(sequence_number, temperature)
+
+    @property
+    def status(self) -> Optional[FoodSafeStatus]:
+        """Current food safety, or None until the probe has reported FoodSafeData."""
+        data = self._food_safe_data
+        if data is None:
+            return None
+        if data.food_safe_mode == FoodSafeMode.SIMPLIFIED:
+            safe = (
+                self._max_temperature is not None
+                and self._max_temperature >= data.selected_threshold_reference_temperature
+            )
+        else:
+            safe = data.target_log_reduction > 0.0 and (
+                self._log_reduction >= data.target_log_reduction
+            )
+        return FoodSafeStatus(
+            FoodSafeState.SAFE if safe else FoodSafeState.NOT_SAFE,
+            self._log_reduction,
+            self._seconds_above,
+            self._newest,
+        )
+
+
+def _parameters(data: Optional[FoodSafeData]) -> Optional[tuple]:
+    if data is None:
+        return None
+    return (
+        data.selected_threshold_reference_temperature,
+        data.z_value,
+        data.reference_temperature,
+        data.d_value_at_rt,
+    )
@@ -0,0 +1,112 @@
+"""Compact per-session store for Gauge log records."""
+
+from array import array
+from typing import Iterator, Optional
+
+from .ble_data.gauge_advertising_data import gauge_temperature_from_raw
+from .uart import SessionInformation
+
+# Raw Gauge temperatures are 13 bits, so this never collides with a reading.
+_MISSING = 0xFFFF
+
+
+class GaugeTemperatureLog:
+    """One Gauge session's readings, two bytes per record.
+
+    Records are kept as the raw 13-bit temperature in an `array('H')` indexed from
+    `first_sequence`, so a day of 5 s samples is about 35 kB. Slots not received yet hold a
+    sentinel; records may arrive in any order. Pass the Gauge's reported minimum sequence number
+    as `first_sequence` so that a newest-first backfill only ever extends the array at the end;
+    a record older than `first_sequence` rebuilds the array in front of it.
+    """
+
+    __slots__ = ("session_information", "first_sequence", "_raw", "_count", "_contiguous")
+
+    def __init__(
+        self, session_information: SessionInformation, first_sequence: Optional[int] = None
+    ):
+        self.session_information = session_information
+        self.first_sequence = first_sequence
+        self._raw = array("H")
+        self._count = 0
+        # Every sequence from first_sequence up to here (exclusive) has been received.
+        self._contiguous = 0
+
+    @property
+    def id(self) -> int:
+        return self.session_information.session_id
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, sequence_number: int) -> bool:
+        index = self._index(sequence_number)
+        return index is not None and self._raw[index] != _MISSING
+
+    def _index(self, sequence_number: int) -> Optional[int]:
+        if self.first_sequence is None:
+            return None
+        index = sequence_number - self.first_sequence
+        return index if 0 <= index < len(self._raw) else None
+
+    def add(self, sequence_number: int, raw_temperature: int) -> bool:
+        """Store one record; returns False if it was already there."""
+        raw = self._raw
+        if self.first_sequence is None:
+            self.first_sequence = sequence_number
+        elif sequence_number < self.first_sequence:
+            grow = self.first_sequence - sequence_number
+            self._raw = raw = array("H", [_MISSING]) * grow + raw
+            self.first_sequence = sequence_number
+            self._contiguous = 0
+        index = sequence_number - self.first_sequence
+        if index >= len(raw):
+            raw.extend(array("H", [_MISSING]) * (index + 1 - len(raw)))
+        if raw[index] != _MISSING:
+            return False
+        raw[index] = raw_temperature & 0x1FFF
+        self._count += 1
+        contiguous = self._contiguous
+        while contiguous < len(raw) and raw[contiguous] != _MISSING:
+            contiguous += 1
+        self._contiguous = contiguous
+        return True
+
+    def temperature(self, sequence_number: int) -> Optional[float]:
+        index = self._index(sequence_number)
+        if index is None or self._raw[index] == _MISSING:
+            return None
+        return gauge_temperature_from_raw(self._raw[index], True)
+
+    def readings(self) -> Iterator[tuple[int, Optional[float]]]:
+        """(sequence number, Celsius) for every received record, oldest first."""
+        first = self.first_sequence
+        for index, raw in enumerate(self._raw):
+            if raw != _MISSING:
+                yield first + index, gauge_temperature_from_raw(raw, True)
+
+    def missing_range(self, min_sequence: int, max_sequence: int) -> Optional[tuple[int, int]]:
+        """Lowest and highest sequence numbers in [min, max] not received yet, or None."""
+        if min_sequence > max_sequence:
+            return None
+        first = self.first_sequence
+        if first is None:
+            return min_sequence, max_sequence
+        raw = self._raw
+        end = first + len(raw)
+
+        def missing(sequence: int) -> bool:
+            return not first <= sequence < end or raw[sequence - first] == _MISSING
+
+        lower = min_sequence
+        if lower >= first:
+            # Skip the prefix known to be complete.
+            lower = max(lower, first + self._contiguous)
+        while lower <= max_sequence and not missing(lower):
+            lower += 1
+        if lower > max_sequence:
+            return None
+        upper = max_sequence
+        while not missing(upper):
+            upper -= 1
+        return lower, upper
@@ -0,0 +1,184 @@
+"""Multi-resolution min/max/mean aggregates over one logging session."""
+
+import math
+from array import array
+from typing import NamedTuple, Optional, Sequence
+
+
+class HistoryPoint(NamedTuple):
+    """Aggregate of the samples from `sequence_number` over `samples` sequence numbers."""
+
+    sequence_number: int
+    samples: int
+    minimum: float
+    maximum: float
+    mean: float
+
+
+class _Level:
+    __slots__ = ("bucket_samples", "minimum", "maximum", "total", "count")
+
+    def __init__(self, bucket_samples: int):
+        self.bucket_samples = bucket_samples
+        self.minimum = array("d")
+        self.maximum = array("d")
+        self.total = array("d")
+        self.count = array("I")
+
+    def add(self, sequence_number: int, value: float) -> None:
+        index = sequence_number // self.bucket_samples
+        count = self.count
+        if index >= len(count):
+            grow = index + 1 - len(count)
+            self.minimum.extend(array("d", [math.inf]) * grow)
+            self.maximum.extend(array("d", [-math.inf]) * grow)
+            self.total.extend(array("d", [0.0]) * grow)
+            count.extend(array("I", [0]) * grow)
+        if value < self.minimum[index]:
+            self.minimum[index] = value
+        if value > self.maximum[index]:
+            self.maximum[index] = value
+        self.total[index] += value
+        count[index] += 1
+
+
+class HistoryPyramid:
+    """Raw samples plus min/max/mean buckets at several sizes, updated as samples arrive.
+
+    Samples are keyed by log sequence number and may arrive in any order; each one touches one
+    bucket per level. A range query reads the coarsest level no coarser than the requested
+    resolution, so its cost follows the number of points returned rather than the samples
+    they cover.
+    """
+
+    __slots__ = ("sample_period", "_raw", "_levels", "_count")
+
+    BUCKET_SECONDS: Sequence[int] = (60, 300, 1800)
+
+    def __init__(self, sample_period_ms: int, bucket_seconds: Sequence[int] = BUCKET_SECONDS):
+        self.sample_period = max(sample_period_ms, 1) / 1000.0
+        self._raw = array("d")
+        sizes = sorted({max(1, round(seconds / self.sample_period)) for seconds in bucket_seconds})
+        self._levels = [_Level(size) for size in sizes if size > 1]
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def bucket_samples(self) -> list[int]:
+        return [level.bucket_samples for level in self._levels]
+
+    @property
+    def last_sequence_number(self) -> Optional[int]:
+        """Highest sequence number added so far."""
+        return len(self._raw) - 1 if self._raw else None
+
+    def add(self, sequence_number: int, value: float) -> bool:
+        """Add one sample; returns False (and changes nothing) if it was already there."""
+        if sequence_number < 0 or value is None or value != value:
+            return False
+        raw = self._raw
+        if sequence_number >= len(raw):
+            raw.extend(array("d", [math.nan]) * (sequence_number + 1 - len(raw)))
+        elif raw[sequence_number] == raw[sequence_number]:
+            return False
+        raw[sequence_number] = value
+        self._count += 1
+        for level in self._levels:
+            level.add(sequence_number, value)
+        return True
+
+    def query(
+        self, first_sequence: int, last_sequence: int, resolution_seconds: float = 0.0
+    ) -> list[HistoryPoint]:
+        """Points covering [first, last] at roughly `resolution_seconds` each, oldest first.
+
+        Points never split a bucket, so the range is widened to whole buckets and a point may
+        cover more than the requested resolution when it is not a multiple of a bucket size.
+        Empty buckets are left out.
+        """
+        first_sequence = max(first_sequence, 0)
+        last_sequence = min(last_sequence, len(self._raw) - 1)
+        if first_sequence > last_sequence:
+            return []
+        resolution = max(1, int(resolution_seconds / self.sample_period))
+
+        level = None
+        for candidate in self._levels:
+            if candidate.bucket_samples > resolution:
+                break
+            level = candidate
+        if level is None:
+            return self._query_raw(first_sequence, last_sequence, resolution)
+
+        size = level.bucket_samples
+        group = max(1, resolution // size)
+        first_bucket = first_sequence // size // group * group
+        last_bucket = last_sequence // size
+        minimum, maximum, total, count = level.minimum, level.maximum, level.total, level.count
+        points = []
+        for start in range(first_bucket, min(last_bucket + 1, len(count)), group):
+            end = min(start + group, len(count))
+            samples = sum(count[start:end])
+            if samples:
+                points.append(
+                    HistoryPoint(
+                        start * size,
+                        (end - start) * size,
+                        min(minimum[start:end]),
+                        max(maximum[start:end]),
+                        sum(total[start:end]) / samples,
+                    )
+                )
+        return points
+
+    def aggregate(self, first_sequence: int, last_sequence: int) -> Optional[HistoryPoint]:
+        """Exact min/max/mean over [first, last], or None if no sample falls in it.
+
+        The range is covered with the largest whole buckets that fit and raw samples at the
+        ragged ends, so the cost depends on the bucket sizes rather than the range length.
+        """
+        first_sequence = max(first_sequence, 0)
+        last = min(last_sequence, len(self._raw) - 1)
+        raw = self._raw
+        minimum, maximum, total, count = math.inf, -math.inf, 0.0, 0
+        position = first_sequence
+        while position <= last:
+            for level in reversed(self._levels):
+                size = level.bucket_samples
+                if position % size == 0 and position + size - 1 <= last:
+                    index = position // size
+                    if level.count[index]:
+                        minimum = min(minimum, level.minimum[index])
+                        maximum = max(maximum, level.maximum[index])
+                        total += level.total[index]
+                        count += level.count[index]
+                    position += size
+                    break
+            else:
+                value = raw[position]
+                if value == value:
+                    minimum = min(minimum, value)
+                    maximum = max(maximum, value)
+                    total += value
+                    count += 1
+                position += 1
+        if not count:
+            return None
+        return HistoryPoint(
+            first_sequence, last_sequence - first_sequence + 1, minimum, maximum, total / count
+        )
+
+    def _query_raw(self, first: int, last: int, group: int) -> list[HistoryPoint]:
+        raw = self._raw
+        points = []
+        for start in range(first // group * group, last + 1, group):
+            values = [value for value in raw[start : start + group] if value == value]
+            if values:
+                points.append(
+                    HistoryPoint(
+                        start, group, min(values), max(values), sum(values) / len(values)
+                    )
+                )
+        return points
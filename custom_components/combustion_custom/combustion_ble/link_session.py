@@ -0,0 +1,94 @@
+"""State for a single established BLE connection."""
+
+import time
+from typing import Optional
+
+from bleak import BleakClient, BleakGATTCharacteristic
+
+from .write_queue import LinkWriteQueue
+
+
+class LinkSession:
+    """Everything BleManager knows about one connected peripheral.
+
+    Created once the connection is established and dropped as a unit when it goes away, so
+    there is a single lookup per identifier and a single place to tear a link down.
+    """
+
+    __slots__ = (
+        "identifier",
+        "client",
+        "adapter",
+        "uart_characteristic",
+        "device_status_characteristic",
+        "info_characteristics",
+        "pending_reads",
+        "_write_queue",
+        "connected_at",
+        "last_rx",
+        "uart_notifications",
+        "uart_bytes",
+        "status_notifications",
+    )
+
+    def __init__(
+        self, identifier: str, client: BleakClient, adapter: Optional[str] = None
+    ) -> None:
+        self.identifier = identifier
+        self.client = client
+        # Adapter the link was placed on, when connections are spread over several.
+        self.adapter = adapter
+        self.uart_characteristic: Optional[BleakGATTCharacteristic] = None
+        self.device_status_characteristic: Optional[BleakGATTCharacteristic] = None
+        # Device Information characteristics by DeviceInfoCache field name.
+        self.info_characteristics: dict[str, BleakGATTCharacteristic] = {}
+        # Handles of GATT reads in flight, to discard concurrent duplicates.
+        self.pending_reads: set[int] = set()
+        self._write_queue: Optional[LinkWriteQueue] = None
+
+        self.connected_at = time.monotonic()
+        self.last_rx: Optional[float] = None
+        self.uart_notifications = 0
+        self.uart_bytes = 0
+        self.status_notifications = 0
+
+    @property
+    def is_connected(self) -> bool:
+        return self.client.is_connected
+
+    @property
+    def write_queue(self) -> Optional[LinkWriteQueue]:
+        """The UART write queue, created on first use once the RX characteristic is known."""
+        if self._write_queue is None and self.uart_characteristic is not None:
+            self._write_queue = LinkWriteQueue(
+                self.identifier, self.client, self.uart_characteristic
+            )
+        return self._write_queue
+
+    def note_uart_rx(self, size: int) -> None:
+        self.uart_notifications += 1
+        self.uart_bytes += size
+        self.last_rx = time.monotonic()
+
+    def note_status_rx(self) -> None:
+        self.status_notifications += 1
+        self.last_rx = time.monotonic()
+
+    def close(self) -> None:
+        if self._write_queue is not None:
+            self._write_queue.close()
+            self._write_queue = None
+        self.pending_reads.clear()
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            "adapter": self.adapter,
+            "connected_seconds": round(now - self.connected_at, 1),
+            "seconds_since_rx": round(now - self.last_rx, 1) if self.last_rx is not None else None,
+            "uart_notifications": self.uart_notifications,
+            "uart_bytes": self.uart_bytes,
+            "status_notifications": self.status_notifications,
+            "pending_reads": len(self.pending_reads),
+            "write_queue": self._write_queue.stats() if self._write_queue else None,
+        }
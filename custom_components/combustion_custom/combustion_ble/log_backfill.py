@@ -0,0 +1,276 @@
+"""Bulk log catch-up: log frames are batched and decoded off the event loop."""
+
+from array import array
+import asyncio
+import time
+from typing import Callable, Iterator, Optional
+
+from .ble_data.prediction_log import PredictionLog
+from .ble_data.probe_temperatures import ProbeTemperatures
+from .logged_probe_data_count import LoggedProbeDataPoint
+from .logger import LOGGER
+from .metrics import Metrics
+from .uart.message_type import MessageType
+from .uart.meatnet.node_message_type import NodeMessageType
+from .uart.meatnet.node_request import NodeRequest
+from .uart.meatnet.node_response import NodeResponse
+from .uart.response import Response
+from .utilities.crc16ccitt import crc16ccitt
+
+_SYNC_BYTES = b"\xca\xfe"
+# Probe responses: [sync(2)][crc(2)][type][success][length]
+_PROBE_LENGTH_INDEX = 6
+_PROBE_SUCCESS_INDEX = 5
+# Node responses: [sync(2)][crc(2)][type][request id(4)][response id(4)][success][length]
+_NODE_RESPONSE_LENGTH_INDEX = 14
+_NODE_RESPONSE_SUCCESS_INDEX = 13
+_NODE_REQUEST_LENGTH_INDEX = 9
+_NODE_LOG_TYPE = NodeMessageType.LOG.value | NodeResponse.RESPONSE_TYPE_FLAG
+
+TEMPERATURES_PER_RECORD = 8
+
+
+class LogBatch:
+    """Log records decoded from a run of frames, stored column by column.
+
+    Row `i` is spread over `sequence_numbers[i]`, `temperatures[8 * i : 8 * i + 8]`,
+    `prediction_logs[i]` and, for frames relayed by a node, `serial_numbers[i]`.
+    """
+
+    __slots__ = (
+        "serial_numbers",
+        "sequence_numbers",
+        "temperatures",
+        "prediction_logs",
+        "crc_failures",
+    )
+
+    def __init__(self, from_node: bool) -> None:
+        self.serial_numbers: Optional[array] = array("L") if from_node else None
+        self.sequence_numbers = array("L")
+        self.temperatures = array("d")
+        self.prediction_logs: list[PredictionLog] = []
+        self.crc_failures = 0
+
+    def __len__(self) -> int:
+        return len(self.sequence_numbers)
+
+    def rows(self, serial_number: Optional[int] = None) -> Iterator[int]:
+        """Row indexes, limited to one probe for node batches when `serial_number` is given."""
+        if serial_number is None or self.serial_numbers is None:
+            return iter(range(len(self.sequence_numbers)))
+        serial_numbers = self.serial_numbers
+        return (row for row in range(len(serial_numbers)) if serial_numbers[row] == serial_number)
+
+    def core_temperature(self, row: int) -> float:
+        """The reading of the thermistor the probe selected as virtual core."""
+        core = self.prediction_logs[row].virtual_sensors.virtual_core
+        return self.temperatures[row * TEMPERATURES_PER_RECORD + core.value]
+
+    def data_point(self, row: int) -> LoggedProbeDataPoint:
+        start = row * TEMPERATURES_PER_RECORD
+        prediction_log = self.prediction_logs[row]
+        virtual_sensors = prediction_log.virtual_sensors
+        return LoggedProbeDataPoint(
+            sequence_num=self.sequence_numbers[row],
+            temperatures=ProbeTemperatures(
+                list(self.temperatures[start : start + TEMPERATURES_PER_RECORD])
+            ),
+            virtual_core=virtual_sensors.virtual_core,
+            virtual_surface=virtual_sensors.virtual_surface,
+            virtual_ambient=virtual_sensors.virtual_ambient,
+            prediction_state=prediction_log.prediction_state,
+            prediction_mode=prediction_log.prediction_mode,
+            prediction_type=prediction_log.prediction_type,
+            prediction_set_point_temperature=prediction_log.prediction_set_point_temperature,
+            prediction_value_seconds=prediction_log.prediction_value_seconds,
+            estimated_core_temperature=prediction_log.estimated_core_temperature,
+        )
+
+
+def decode_log_frames(frames: list[bytes], from_node: bool) -> LogBatch:
+    """Decode complete Log response frames into a LogBatch. Safe to run in a worker thread."""
+    batch = LogBatch(from_node)
+    if from_node:
+        header_length = NodeResponse.HEADER_LENGTH
+        length_index = _NODE_RESPONSE_LENGTH_INDEX
+        success_index = _NODE_RESPONSE_SUCCESS_INDEX
+        minimum_length = 28
+    else:
+        header_length = Response.HEADER_LENGTH
+        length_index = _PROBE_LENGTH_INDEX
+        success_index = _PROBE_SUCCESS_INDEX
+        minimum_length = 24
+
+    for frame in frames:
+        payload_length = frame[length_index]
+        if int.from_bytes(frame[2:4], "little") != crc16ccitt(
+            frame[4 : header_length + payload_length]
+        ):
+            batch.crc_failures += 1
+            continue
+        if payload_length < minimum_length or not frame[success_index]:
+            continue
+        offset = header_length
+        if from_node:
+            batch.serial_numbers.append(int.from_bytes(frame[offset : offset + 4], "little"))
+            offset += 4
+        batch.sequence_numbers.append(int.from_bytes(frame[offset : offset + 4], "little"))
+        temperatures = ProbeTemperatures.from_raw_data(frame[offset + 4 : offset + 17])
+        batch.temperatures.extend(temperatures.values)
+        batch.prediction_logs.append(PredictionLog.from_raw(frame[offset + 17 : offset + 24]))
+    return batch
+
+
+class _Link:
+    __slots__ = ("from_node", "remaining", "frames", "flush_handle")
+
+    def __init__(self, from_node: bool) -> None:
+        self.from_node = from_node
+        self.remaining = 0
+        self.frames: list[bytes] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
+
+class LogBackfill:
+    """Diverts Log responses on links with a large outstanding log request.
+
+    `expect` is told about every log request. Once a request for at least BULK_THRESHOLD records
+    is outstanding on a link, `divert` pulls that link's Log response frames out of incoming UART
+    data before the normal per-frame decode. Frames are decoded BATCH_FRAMES at a time (or after
+    FLUSH_SECONDS without a full batch) in the default executor, and each LogBatch is handed to
+    `on_batch` back on the event loop. The link goes back to normal decoding once the requested
+    records have arrived or it disconnects.
+    """
+
+    BULK_THRESHOLD = 200
+    BATCH_FRAMES = 256
+    FLUSH_SECONDS = 0.25
+
+    def __init__(
+        self,
+        on_batch: Callable[[str, LogBatch], None],
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self.on_batch = on_batch
+        self.metrics = metrics or Metrics.shared
+        self._links: dict[str, _Link] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self._links
+
+    def __bool__(self) -> bool:
+        return bool(self._links)
+
+    def expect(self, identifier: str, records: int, from_node: bool) -> None:
+        """Note a log request for `records` records sent over the link `identifier`."""
+        link = self._links.get(identifier)
+        if link is None:
+            if records < self.BULK_THRESHOLD:
+                return
+            link = self._links[identifier] = _Link(from_node)
+        # Probes re-request the whole missing range until it is filled; do not double count.
+        link.remaining = max(link.remaining, records)
+
+    def divert(self, identifier: str, data: bytes) -> bytes:
+        """Take the Log response frames out of `data`; returns whatever is left to decode."""
+        link = self._links.get(identifier)
+        if link is None:
+            return data
+
+        from_node = link.from_node
+        log_type = _NODE_LOG_TYPE if from_node else MessageType.LOG
+        size = len(data)
+        rest = bytearray()
+        offset = 0
+        diverted = 0
+        while size - offset > 4 and data[offset : offset + 2] == _SYNC_BYTES:
+            message_type = data[offset + 4]
+            if not from_node:
+                header_length, length_index = Response.HEADER_LENGTH, _PROBE_LENGTH_INDEX
+            elif message_type & NodeResponse.RESPONSE_TYPE_FLAG:
+                header_length = NodeResponse.HEADER_LENGTH
+                length_index = _NODE_RESPONSE_LENGTH_INDEX
+            else:
+                header_length, length_index = NodeRequest.HEADER_LENGTH, _NODE_REQUEST_LENGTH_INDEX
+            if size - offset <= length_index:
+                break
+            end = offset + header_length + data[offset + length_index]
+            if end > size:
+                break
+            if message_type == log_type:
+                link.frames.append(bytes(data[offset:end]))
+                diverted += 1
+            else:
+                rest += data[offset:end]
+            offset = end
+        if not diverted:
+            return data
+        rest += data[offset:]
+
+        metrics = self.metrics
+        metrics.log_backfill_frames.value += diverted
+        metrics.uart_bytes.value += size - len(rest)
+        metrics.uart_frames.value += diverted
+        if not rest:
+            metrics.uart_notifications.value += 1
+
+        link.remaining -= diverted
+        if link.remaining <= 0:
+            self._submit(identifier, link)
+            del self._links[identifier]
+        elif len(link.frames) >= self.BATCH_FRAMES:
+            self._submit(identifier, link)
+        elif link.flush_handle is None:
+            link.flush_handle = asyncio.get_running_loop().call_later(
+                self.FLUSH_SECONDS, self._flush, identifier
+            )
+        return bytes(rest)
+
+    def forget(self, identifier: str) -> None:
+        """Decode what the link has delivered so far and stop diverting its frames."""
+        if (link := self._links.pop(identifier, None)) is not None:
+            self._submit(identifier, link)
+
+    def cancel(self) -> None:
+        for link in self._links.values():
+            if link.flush_handle is not None:
+                link.flush_handle.cancel()
+        self._links.clear()
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    def _flush(self, identifier: str) -> None:
+        if (link := self._links.get(identifier)) is not None:
+            link.flush_handle = None
+            self._submit(identifier, link)
+
+    def _submit(self, identifier: str, link: _Link) -> None:
+        if link.flush_handle is not None:
+            link.flush_handle.cancel()
+            link.flush_handle = None
+        if not link.frames:
+            return
+        frames, link.frames = link.frames, []
+        task = asyncio.get_running_loop().create_task(
+            self._decode(identifier, frames, link.from_node), name="log_backfill[decode]"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _decode(self, identifier: str, frames: list[bytes], from_node: bool) -> None:
+        # Measured around the executor hop, so it includes time queued behind other jobs.
+        started = time.perf_counter()
+        batch = await asyncio.get_running_loop().run_in_executor(
+            None, decode_log_frames, frames, from_node
+        )
+        metrics = self.metrics
+        metrics.log_backfill_batch_size.observe(len(frames))
+        metrics.log_backfill_decode_time.observe((time.perf_counter() - started) * 1000.0)
+        metrics.crc_failures.value += batch.crc_failures
+        try:
+            self.on_batch(identifier, batch)
+        except Exception:
+            LOGGER.exception("Error merging %d log records from [%s]", len(batch), identifier)
@@ -0,0 +1,56 @@
+"""Hourly core temperature statistics from a probe session log."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from .probe_temperature_log import ProbeTemperatureLog
+
+HOUR = timedelta(hours=1)
+
+
+class HourlyStatistic(NamedTuple):
+    """Core temperature over the hour starting at `start` (UTC)."""
+
+    start: datetime
+    mean: float
+    minimum: float
+    maximum: float
+
+
+def _to_utc(local: datetime) -> datetime:
+    # Logs keep naive local times (datetime.now()).
+    return local.astimezone(timezone.utc)
+
+
+def _to_local(utc: datetime) -> datetime:
+    return utc.astimezone().replace(tzinfo=None)
+
+
+def hourly_statistics(
+    log: ProbeTemperatureLog, first: int, last: int
+) -> tuple[list[HourlyStatistic], Optional[int]]:
+    """Statistics for every finished hour holding records in [first, last].
+
+    An hour is finished once the log holds a record from after its end. Also returns the first
+    sequence number of the unfinished hour when the range reaches into it, so the caller can
+    revisit it later; otherwise None.
+    """
+    newest = log.history.last_sequence_number
+    first_time = log.time_of(first)
+    if newest is None or first_time is None:
+        return [], None
+
+    statistics = []
+    hour = _to_utc(first_time).replace(minute=0, second=0, microsecond=0)
+    while True:
+        bounds = log.sequence_range_between(_to_local(hour), _to_local(hour + HOUR))
+        if bounds is None or bounds[0] > last:
+            return statistics, None
+        if bounds[1] >= newest:
+            return statistics, max(bounds[0], first)
+        point = log.history.aggregate(*bounds)
+        if point is not None:
+            statistics.append(HourlyStatistic(hour, point.mean, point.minimum, point.maximum))
+        hour += HOUR
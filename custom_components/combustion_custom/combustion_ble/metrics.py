@@ -0,0 +1,291 @@
+"""Low-overhead counters and histograms for the BLE, decode and UART pipeline."""
+
+from bisect import bisect_left
+from collections import deque
+import time
+from typing import Optional
+
+from .utilities.crc16ccitt import crc16ccitt
+
+# Histogram bucket upper bounds. Values above the last bound land in an overflow bucket.
+DECODE_TIME_BUCKETS_US = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 10000)
+CONNECT_TIME_BUCKETS_S = (0.5, 1, 2, 5, 10, 20, 30, 60)
+CONNECTED_DURATION_BUCKETS_S = (10, 60, 300, 900, 3600, 4 * 3600, 12 * 3600)
+RTT_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500)
+BATCH_DECODE_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Packet types timed by `Metrics.decode_time`.
+DECODE_ADVERTISING = "advertising"
+DECODE_GAUGE_ADVERTISING = "gauge_advertising"
+DECODE_PROBE_STATUS = "probe_status"
+DECODE_PROBE_UART = "probe_uart"
+DECODE_NODE_UART = "node_uart"
+
+_SYNC_BYTES = b"\xca\xfe"
+
+
+class Counter:
+    """Monotonic counter with a rate over the trailing RATE_WINDOW_SECONDS of `sample()` calls.
+
+    Sampling is driven by one periodic timer (see `Metrics.sample_rates`); `rate()` only reads,
+    so any number of consumers see the same value.
+    """
+
+    __slots__ = ("value", "_samples")
+
+    RATE_WINDOW_SECONDS = 10.0
+
+    def __init__(self) -> None:
+        self.value = 0
+        self._samples: deque[tuple[float, int]] = deque([(time.monotonic(), 0)])
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+    def sample(self, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        samples = self._samples
+        samples.append((now, self.value))
+        # Keep the newest sample that is at least a full window old as the window start.
+        while len(samples) > 2 and now - samples[1][0] >= self.RATE_WINDOW_SECONDS:
+            samples.popleft()
+
+    def rate(self) -> float:
+        """Events per second over the sampled window (0 until there are two samples)."""
+        (start, first), (end, last) = self._samples[0], self._samples[-1]
+        return (last - first) / (end - start) if end > start else 0.0
+
+
+class Histogram:
+    """Fixed-bucket histogram. Buckets are allocated up front; `observe` never allocates."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: tuple) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th quantile (None if in the overflow bucket)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return self.bounds[index] if index < len(self.bounds) else None
+        return None
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 3),
+            "max": round(self.max, 3),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(zip([*map(str, self.bounds), "inf"], self.counts)),
+        }
+
+
+class Metrics:
+    """Library-wide metrics registry.
+
+    Hot-path counters and histograms are plain attributes created once, so recording a sample is
+    an attribute lookup and an integer add. Per-device and per-product-type counters are created
+    the first time that key is seen and reused afterwards.
+    """
+
+    shared: "Metrics" = None  # type: ignore
+
+    def __init__(self) -> None:
+        self.advertisements = Counter()
+        self.advertisements_by_device: dict[str, Counter] = {}
+        self.advertisements_by_product_type: dict[int, Counter] = {}
+        # Node copies of probe advertisements handled from the header without a decode.
+        self.repeated_advertisements_dropped = Counter()
+        # Populated only when advertisement batching is enabled.
+        self.advertisement_batch_size = Histogram(BATCH_SIZE_BUCKETS)
+        self.advertisements_coalesced = Counter()
+        self.advertisement_batch_overflows = Counter()
+
+        self.decode_time: dict[str, Histogram] = {
+            packet_type: Histogram(DECODE_TIME_BUCKETS_US)
+            for packet_type in (
+                DECODE_ADVERTISING,
+                DECODE_GAUGE_ADVERTISING,
+                DECODE_PROBE_STATUS,
+                DECODE_PROBE_UART,
+                DECODE_NODE_UART,
+            )
+        }
+
+        self.uart_notifications = Counter()
+        self.uart_bytes = Counter()
+        self.uart_frames = Counter()
+        self.crc_failures = Counter()
+        self.partial_frames = Counter()
+        self.dropped_frames = Counter()
+
+        self.connection_attempts = Counter()
+        self.connection_failures = Counter()
+        self.connection_rejections = Counter()
+        self.disconnections = Counter()
+        self.connect_time = Histogram(CONNECT_TIME_BUCKETS_S)
+        self.connected_duration = Histogram(CONNECTED_DURATION_BUCKETS_S)
+
+        # Log frames decoded in bulk off the event loop (see LogBackfill).
+        self.log_backfill_frames = Counter()
+        self.log_backfill_batch_size = Histogram(BATCH_SIZE_BUCKETS)
+        self.log_backfill_decode_time = Histogram(BATCH_DECODE_BUCKETS_MS)
+
+        self.requests_sent = Counter()
+        self.request_rtt = Histogram(RTT_BUCKETS_MS)
+        # Send time of the newest unanswered request per link and message type.
+        self._outstanding: dict[str, dict[int, float]] = {}
+
+        self.started = time.monotonic()
+
+    def note_advertisement(self, identifier: str, product_type: int) -> None:
+        self.advertisements.value += 1
+        counter = self.advertisements_by_device.get(identifier)
+        if counter is None:
+            counter = self.advertisements_by_device[identifier] = Counter()
+        counter.value += 1
+        counter = self.advertisements_by_product_type.get(product_type)
+        if counter is None:
+            counter = self.advertisements_by_product_type[product_type] = Counter()
+        counter.value += 1
+
+    def note_decode(self, packet_type: str, started_ns: int) -> None:
+        """Record a decode that began at `started_ns` (from time.perf_counter_ns())."""
+        self.decode_time[packet_type].observe((time.perf_counter_ns() - started_ns) / 1000.0)
+
+    def note_uart_data(self, size: int, frames: int) -> None:
+        self.uart_notifications.value += 1
+        self.uart_bytes.value += size
+        self.uart_frames.value += frames
+
+    def note_undecoded(self, data: bytes, header_length: int, length_index: int) -> None:
+        """Classify the bytes left over after a UART buffer stopped decoding.
+
+        Only runs on the failure path, so re-checking the CRC here costs nothing in the
+        common case.
+        """
+        if len(data) < header_length or len(data) < header_length + data[length_index]:
+            self.partial_frames.value += 1
+        elif data[:2] != _SYNC_BYTES:
+            self.dropped_frames.value += 1
+        elif int.from_bytes(data[2:4], byteorder="little") != crc16ccitt(
+            data[4 : header_length + data[length_index]]
+        ):
+            self.crc_failures.value += 1
+        else:
+            # Well-formed frame of a type we do not decode.
+            self.dropped_frames.value += 1
+
+    def note_request_sent(self, identifier: str, message_type: int) -> None:
+        self.requests_sent.value += 1
+        outstanding = self._outstanding.get(identifier)
+        if outstanding is None:
+            outstanding = self._outstanding[identifier] = {}
+        outstanding[message_type] = time.monotonic()
+
+    def note_response(self, identifier: str, message_type: int) -> None:
+        outstanding = self._outstanding.get(identifier)
+        if outstanding and (sent := outstanding.pop(message_type, None)) is not None:
+            self.request_rtt.observe((time.monotonic() - sent) * 1000.0)
+
+    def note_connected(self, connect_seconds: float) -> None:
+        self.connect_time.observe(connect_seconds)
+
+    def note_disconnected(self, identifier: str, connected_seconds: float) -> None:
+        self.disconnections.value += 1
+        self.connected_duration.observe(connected_seconds)
+        self._outstanding.pop(identifier, None)
+
+    def forget_device(self, identifier: str) -> None:
+        self.advertisements_by_device.pop(identifier, None)
+        self._outstanding.pop(identifier, None)
+
+    def sample_rates(self, now: Optional[float] = None) -> None:
+        """Sample every counter that reports a rate. Call this from a single periodic timer."""
+        now = time.monotonic() if now is None else now
+        self.advertisements.sample(now)
+        self.uart_bytes.sample(now)
+        for counter in self.advertisements_by_device.values():
+            counter.sample(now)
+        for counter in self.advertisements_by_product_type.values():
+            counter.sample(now)
+
+    def snapshot(self) -> dict:
+        """Everything, as plain data. Rates are per second over Counter.RATE_WINDOW_SECONDS."""
+        now = time.monotonic()
+        return {
+            "uptime_seconds": round(now - self.started, 1),
+            "advertisements": {
+                "total": self.advertisements.value,
+                "per_second": round(self.advertisements.rate(), 2),
+                "per_second_by_device": {
+                    identifier: round(counter.rate(), 2)
+                    for identifier, counter in self.advertisements_by_device.items()
+                },
+                "per_second_by_product_type": {
+                    product_type: round(counter.rate(), 2)
+                    for product_type, counter in self.advertisements_by_product_type.items()
+                },
+                "repeated_dropped": self.repeated_advertisements_dropped.value,
+                "batch_size": self.advertisement_batch_size.as_dict(),
+                "coalesced": self.advertisements_coalesced.value,
+                "batch_overflows": self.advertisement_batch_overflows.value,
+            },
+            "decode_time_us": {
+                packet_type: histogram.as_dict()
+                for packet_type, histogram in self.decode_time.items()
+            },
+            "uart": {
+                "notifications": self.uart_notifications.value,
+                "bytes": self.uart_bytes.value,
+                "frames": self.uart_frames.value,
+                "bytes_per_second": round(self.uart_bytes.rate(), 1),
+                "crc_failures": self.crc_failures.value,
+                "partial_frames": self.partial_frames.value,
+                "dropped_frames": self.dropped_frames.value,
+            },
+            "log_backfill": {
+                "frames": self.log_backfill_frames.value,
+                "batch_size": self.log_backfill_batch_size.as_dict(),
+                "decode_ms": self.log_backfill_decode_time.as_dict(),
+            },
+            "connections": {
+                "attempts": self.connection_attempts.value,
+                "failures": self.connection_failures.value,
+                "rejections": self.connection_rejections.value,
+                "disconnections": self.disconnections.value,
+                "connect_time_s": self.connect_time.as_dict(),
+                "connected_duration_s": self.connected_duration.as_dict(),
+            },
+            "requests": {
+                "sent": self.requests_sent.value,
+                "rtt_ms": self.request_rtt.as_dict(),
+            },
+        }
+
+
+# Instantiate the Metrics singleton
+Metrics.shared = Metrics()
@@ -0,0 +1,210 @@
+"""Host-side cook-time estimate from the core temperature trajectory."""
+
+import math
+import time
+from typing import Optional
+
+
+class LocalPrediction:
+    """Time to target estimated on the host, with a 0..1 confidence."""
+
+    __slots__ = ("seconds_remaining", "confidence", "target_temperature", "plateau_temperature")
+
+    def __init__(
+        self,
+        seconds_remaining: int,
+        confidence: float,
+        target_temperature: float,
+        plateau_temperature: float,
+    ):
+        self.seconds_remaining = seconds_remaining
+        self.confidence = confidence
+        self.target_temperature = target_temperature
+        self.plateau_temperature = plateau_temperature
+
+    def __repr__(self) -> str:
+        return (
+            f"LocalPrediction(seconds_remaining={self.seconds_remaining}, "
+            f"confidence={self.confidence:.2f}, target={self.target_temperature}, "
+            f"plateau={self.plateau_temperature:.1f})"
+        )
+
+
+class LocalPredictor:
+    """Fits Newtonian heating to core temperatures by recursive least squares.
+
+    The core is modelled as approaching a plateau `A` at rate `k`, so over a fixed step `h`
+    the change is linear in the temperature: `T[n+1] - T[n] = c + d * T[n]`, with
+    `d = exp(-k * h) - 1` and `c = -d * A`. Samples arrive at any rate and are resampled onto
+    STEP_SECONDS by linear interpolation; each grid point is one RLS update of the 2x2 fit, with
+    FORGETTING so that the fit follows a changing oven. Everything is O(1) per sample.
+
+    `estimate` solves the fitted curve for the time to a target, and derives the confidence
+    from the spread of that time under the fit's own parameter covariance.
+    """
+
+    __slots__ = (
+        "_last_time",
+        "_last_temperature",
+        "_grid_time",
+        "_grid_temperature",
+        "_theta_c",
+        "_theta_d",
+        "_p00",
+        "_p01",
+        "_p11",
+        "_residual_variance",
+        "_steps",
+        "_current_temperature",
+    )
+
+    STEP_SECONDS = 15.0
+    FORGETTING = 0.995
+    # Grid steps before an estimate is offered (5 minutes at the default step).
+    MIN_STEPS = 20
+    # A gap this long (probe out of range, removed from the food) starts a new fit.
+    RESET_GAP_SECONDS = 600.0
+    INITIAL_COVARIANCE = 1.0e4
+    # Temperatures are centred here so the fit stays well conditioned.
+    CENTRE = 50.0
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._last_time: Optional[float] = None
+        self._last_temperature = 0.0
+        self._grid_time = 0.0
+        self._grid_temperature = 0.0
+        self._theta_c = 0.0
+        self._theta_d = 0.0
+        self._p00 = self.INITIAL_COVARIANCE
+        self._p01 = 0.0
+        self._p11 = self.INITIAL_COVARIANCE
+        self._residual_variance = 0.0
+        self._steps = 0
+        self._current_temperature: Optional[float] = None
+
+    @property
+    def steps(self) -> int:
+        """Grid steps fitted since the last reset."""
+        return self._steps
+
+    def add(self, temperature: float, timestamp: Optional[float] = None) -> None:
+        """Add a core temperature reading taken at `timestamp` (time.monotonic() seconds)."""
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        last_time = self._last_time
+        if last_time is not None and timestamp - last_time > self.RESET_GAP_SECONDS:
+            self.reset()
+            last_time = None
+        self._current_temperature = temperature
+        if last_time is None:
+            self._last_time = self._grid_time = timestamp
+            self._last_temperature = self._grid_temperature = temperature
+            return
+        if timestamp <= last_time:
+            return
+
+        step = self.STEP_SECONDS
+        next_grid = self._grid_time + step
+        while next_grid <= timestamp:
+            fraction = (next_grid - last_time) / (timestamp - last_time)
+            grid_temperature = self._last_temperature + fraction * (
+                temperature - self._last_temperature
+            )
+            self._update(self._grid_temperature, grid_temperature)
+            self._grid_time = next_grid
+            self._grid_temperature = grid_temperature
+            next_grid += step
+        self._last_time = timestamp
+        self._last_temperature = temperature
+
+    def _update(self, previous: float, current: float) -> None:
+        # Regressors [1, x] with x the centred previous temperature; target the step change.
+        x = previous - self.CENTRE
+        y = current - previous
+        p00, p01, p11 = self._p00, self._p01, self._p11
+        px0 = p00 + p01 * x
+        px1 = p01 + p11 * x
+        spread = px0 + x * px1
+        denominator = self.FORGETTING + spread
+        error = y - (self._theta_c + self._theta_d * x)
+        # A priori errors have variance sigma^2 * (1 + phi' P phi); track sigma^2.
+        self._residual_variance += (1.0 - self.FORGETTING) * (
+            error * error / (1.0 + spread) - self._residual_variance
+        )
+        gain0 = px0 / denominator
+        gain1 = px1 / denominator
+        self._theta_c += gain0 * error
+        self._theta_d += gain1 * error
+        # Forgetting inflates P in directions the data no longer excites (a core holding
+        # steady); stop inflating once it is back at its initial size so it cannot wind up.
+        p00 -= gain0 * px0
+        p01 -= gain0 * px1
+        p11 -= gain1 * px1
+        inverse_forgetting = 1.0
+        if p00 + p11 < self.INITIAL_COVARIANCE:
+            inverse_forgetting /= self.FORGETTING
+        self._p00 = p00 * inverse_forgetting
+        self._p01 = p01 * inverse_forgetting
+        self._p11 = p11 * inverse_forgetting
+        self._steps += 1
+
+    def _time_to(self, c: float, d: float, current: float, target: float) -> Optional[float]:
+        if not -1.0 < d < 0.0:
+            return None
+        plateau = self.CENTRE - c / d
+        if plateau <= target:
+            return None
+        rate = -math.log1p(d) / self.STEP_SECONDS
+        return math.log((plateau - current) / (plateau - target)) / rate
+
+    def estimate(self, target: float) -> Optional[LocalPrediction]:
+        """Seconds until the core reaches `target`, or None while there is no usable fit."""
+        current = self._current_temperature
+        if current is None or self._steps < self.MIN_STEPS:
+            return None
+        c, d = self._theta_c, self._theta_d
+        if not -1.0 < d < 0.0:
+            return None
+        plateau = self.CENTRE - c / d
+        if current >= target:
+            return LocalPrediction(0, 1.0, target, plateau)
+        seconds = self._time_to(c, d, current, target)
+        if seconds is None:
+            return None
+
+        # Delta method: spread of the time to target under the parameter covariance.
+        variance = self._residual_variance
+        sigma_c = math.sqrt(max(self._p00 * variance, 0.0))
+        sigma_d = math.sqrt(max(self._p11 * variance, 0.0))
+        gradient_c = gradient_d = 0.0
+        if sigma_c > 0.0:
+            gradient_c = self._derivative(c, d, current, target, sigma_c * 1e-2, 0.0)
+        if sigma_d > 0.0:
+            gradient_d = self._derivative(c, d, current, target, 0.0, sigma_d * 1e-2)
+        if gradient_c is None or gradient_d is None:
+            confidence = 0.0
+        else:
+            spread = math.sqrt(
+                max(
+                    variance
+                    * (
+                        gradient_c * gradient_c * self._p00
+                        + 2.0 * gradient_c * gradient_d * self._p01
+                        + gradient_d * gradient_d * self._p11
+                    ),
+                    0.0,
+                )
+            )
+            confidence = 1.0 / (1.0 + spread / max(seconds, self.STEP_SECONDS))
+        return LocalPrediction(int(round(seconds)), confidence, target, plateau)
+
+    def _derivative(
+        self, c: float, d: float, current: float, target: float, delta_c: float, delta_d: float
+    ) -> Optional[float]:
+        above = self._time_to(c + delta_c, d + delta_d, current, target)
+        below = self._time_to(c - delta_c, d - delta_d, current, target)
+        if above is None or below is None:
+            return None
+        return (above - below) / (2.0 * (delta_c or delta_d))
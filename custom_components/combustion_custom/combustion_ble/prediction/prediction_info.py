@@ -1,5 +1,7 @@
 """Prediction Info."""
 
+import math
+import time
 from typing import Optional
 
 from ..ble_data.prediction_mode import PredictionMode
@@ -7,8 +9,56 @@ from ..ble_data.prediction_state import PredictionState
 from ..ble_data.prediction_type import PredictionType
 
 
+class LinearCountdown:
+    """Milliseconds remaining, moving linearly from an anchor time and evaluated on read.
+
+    `rate` is milliseconds of countdown per millisecond of wall time. The value stops moving
+    `hold_after` seconds after the anchor and never goes below zero.
+    """
+
+    __slots__ = ("start_ms", "rate", "hold_after", "anchor")
+
+    def __init__(
+        self, start_ms: float, rate: float, hold_after: float, anchor: Optional[float] = None
+    ):
+        self.start_ms = start_ms
+        self.rate = rate
+        self.hold_after = hold_after
+        self.anchor = time.monotonic() if anchor is None else anchor
+
+    def milliseconds(self, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        elapsed = min(max(0.0, now - self.anchor), self.hold_after)
+        return max(0.0, self.start_ms - self.rate * elapsed * 1000.0)
+
+    def seconds(self, now: Optional[float] = None) -> int:
+        """Whole seconds remaining, counting down like a timer (4.2 s reads as 5)."""
+        return math.ceil(round(self.milliseconds(now)) / 1000.0)
+
+    def seconds_until_change(self, now: Optional[float] = None) -> Optional[float]:
+        """Wall time until `seconds()` next changes, or None if it no longer will."""
+        now = time.monotonic() if now is None else now
+        if self.rate == 0 or now - self.anchor >= self.hold_after:
+            return None
+        milliseconds = self.milliseconds(now)
+        seconds = self.seconds(now)
+        # A millisecond past the boundary, so the reading has certainly ticked over.
+        if self.rate > 0:
+            if seconds == 0:
+                return None
+            delta_ms = milliseconds - (seconds - 1) * 1000.0 + 1.0
+        else:
+            delta_ms = seconds * 1000.0 - milliseconds + 1.0
+        wait = delta_ms / abs(self.rate) / 1000.0
+        return min(wait, self.anchor + self.hold_after - now)
+
+
 class PredictionInfo:
-    """Prediction Info."""
+    """Prediction Info.
+
+    While the prediction is linearized, `seconds_remaining` is read from a LinearCountdown, so
+    the same instance stays current between status updates.
+    """
 
     def __init__(
         self,
@@ -19,6 +69,7 @@ class PredictionInfo:
         estimated_core_temperature: float,
         seconds_remaining: Optional[int] = None,
         percent_through_cook: int = 0,
+        countdown: Optional[LinearCountdown] = None,
     ):
         """Initialize."""
         self.prediction_state = prediction_state
@@ -26,8 +77,20 @@ class PredictionInfo:
         self.prediction_type = prediction_type
         self.prediction_set_point_temperature = prediction_set_point_temperature
         self.estimated_core_temperature = estimated_core_temperature
-        self.seconds_remaining = seconds_remaining
+        self._seconds_remaining = seconds_remaining
         self.percent_through_cook = percent_through_cook
+        self.countdown = countdown
+
+    @property
+    def seconds_remaining(self) -> Optional[int]:
+        if self.countdown is not None:
+            return self.countdown.seconds()
+        return self._seconds_remaining
+
+    @seconds_remaining.setter
+    def seconds_remaining(self, value: Optional[int]) -> None:
+        self._seconds_remaining = value
+        self.countdown = None
 
     def __str__(self) -> str:
         return f"Mode[{self.prediction_mode.to_string()}] Type[{self.prediction_type.to_string()}] Set Point [{round(self.prediction_set_point_temperature, 1)}] Percent Complete [{self.percent_through_cook}]"
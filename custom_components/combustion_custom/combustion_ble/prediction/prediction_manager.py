@@ -1,10 +1,11 @@
 import asyncio
 from collections.abc import Callable
+import time
 from typing import Optional
 
 from ..ble_data.prediction_state import PredictionState
 from ..ble_data.prediction_status import PredictionStatus
-from ..prediction.prediction_info import PredictionInfo
+from ..prediction.prediction_info import LinearCountdown, PredictionInfo
 
 
 class PredictionManager:
@@ -20,12 +21,15 @@ class PredictionManager:
         self.previous_prediction_info: Optional[PredictionInfo] = None
         self.previous_sequence_number: Optional[int] = None
         self.linearization_target_seconds: int = 0
-        self.linearization_timer_update_value: int = 0
-        self.current_linearization_ms: int = 0
+        # Set while predicting under LOW_RESOLUTION_CUTOFF_SECONDS; read by PredictionInfo.
+        self.countdown: Optional[LinearCountdown] = None
         self.running_linearization = False
         self.stale_timer_task: Optional[asyncio.Task] = None
+        # Republishes the countdown when its whole second changes.
         self.linearization_timer_task: Optional[asyncio.Task] = None
         self.listeners: list[Callable[[PredictionInfo], None]] = []
+        # While non-zero the countdown is republished every LINEARIZATION_UPDATE_RATE_MS.
+        self.high_rate_listeners = 0
 
     def add_update_listener(self, listener: Callable[[PredictionInfo], None]):
         self.listeners.append(listener)
@@ -69,9 +73,11 @@ class PredictionManager:
             estimated_core_temperature=prediction_status.estimated_core_temperature,
             seconds_remaining=seconds_remaining,
             percent_through_cook=self.percent_through_cook(prediction_status),
+            countdown=self.countdown,
         )
 
     def seconds_remaining(self, prediction_status: PredictionStatus, sequence_number: int):
+        countdown, self.countdown = self.countdown, None
         if prediction_status.prediction_state != PredictionState.PREDICTING:
             return None
 
@@ -112,17 +118,19 @@ class PredictionManager:
                     (prediction_status.prediction_value_seconds - prediction_update_rate_seconds)
                 )
 
-            if not self.running_linearization:
-                self.current_linearization_ms = int(
-                    (float(prediction_status.prediction_value_seconds) * 1000.0)
-                )
-                self.linearization_timer_update_value = int(self.LINEARIZATION_UPDATE_RATE_MS)
+            # Count down from where the previous countdown is now, so that it reaches the
+            # target when the next status is due.
+            now = time.monotonic()
+            if not self.running_linearization or countdown is None:
+                current_ms = float(prediction_status.prediction_value_seconds) * 1000.0
+                rate = 1.0
             else:
-                interval_count = self.PREDICTION_STATUS_RATE_MS / self.LINEARIZATION_UPDATE_RATE_MS
-                self.linearization_timer_update_value = int(
-                    (self.current_linearization_ms - (self.linearization_target_seconds * 1000.0))
-                    / interval_count
-                )
+                current_ms = countdown.milliseconds(now)
+                rate = (
+                    current_ms - self.linearization_target_seconds * 1000.0
+                ) / self.PREDICTION_STATUS_RATE_MS
+
+            self.countdown = LinearCountdown(current_ms, rate, self.PREDICTION_STALE_TIMEOUT, now)
 
             if self.linearization_timer_task is not None:
                 self.linearization_timer_task.cancel()
@@ -130,28 +138,22 @@ class PredictionManager:
             self.linearization_timer_task = asyncio.create_task(self.update_prediction_seconds())
             self.running_linearization = True
 
-            return int(self.current_linearization_ms / 1000.0)
+            return int(current_ms / 1000.0)
 
     async def update_prediction_seconds(self):
-        while self.running_linearization:
-            await asyncio.sleep(self.LINEARIZATION_UPDATE_RATE_MS / 1000)
-            if self.previous_prediction_info is None:
+        """Republish the linearized prediction whenever the displayed second changes.
+
+        The value itself is computed on read, so nothing is recalculated here.
+        """
+        while (countdown := self.countdown) is not None:
+            if self.high_rate_listeners:
+                delay = self.LINEARIZATION_UPDATE_RATE_MS / 1000.0
+            elif (delay := countdown.seconds_until_change()) is None:
                 break
-
-            self.current_linearization_ms -= self.linearization_timer_update_value
-            self.current_linearization_ms = int(max(0.0, self.current_linearization_ms))
-
-            seconds_remaining = int(self.current_linearization_ms / 1000.0)
-            info = PredictionInfo(
-                prediction_state=self.previous_prediction_info.prediction_state,
-                prediction_mode=self.previous_prediction_info.prediction_mode,
-                prediction_type=self.previous_prediction_info.prediction_type,
-                prediction_set_point_temperature=self.previous_prediction_info.prediction_set_point_temperature,
-                estimated_core_temperature=self.previous_prediction_info.estimated_core_temperature,
-                seconds_remaining=seconds_remaining,
-                percent_through_cook=self.previous_prediction_info.percent_through_cook,
-            )
-            self.publish_prediction_info(info)
+            await asyncio.sleep(delay)
+            if self.previous_prediction_info is None or countdown is not self.countdown:
+                break
+            self.publish_prediction_info(self.previous_prediction_info)
 
     def percent_through_cook(self, prediction_status: PredictionStatus):
         start = prediction_status.heat_start_temperature
@@ -172,6 +174,13 @@ class PredictionManager:
         for listener in self.listeners:
             listener(prediction_info)
 
+    def stop(self):
+        """Cancel the stale and linearization timers."""
+        if self.stale_timer_task is not None:
+            self.stale_timer_task.cancel()
+            self.stale_timer_task = None
+        self.clear_linearization_timer()
+
     def clear_linearization_timer(self):
         if self.linearization_timer_task is not None:
             self.linearization_timer_task.cancel()
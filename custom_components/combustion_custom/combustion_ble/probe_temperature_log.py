@@ -1,10 +1,14 @@
 import asyncio
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from .history_pyramid import HistoryPoint, HistoryPyramid
 from .logged_probe_data_count import LoggedProbeDataPoint
 from .uart import SessionInformation
 
+if TYPE_CHECKING:
+    from .log_backfill import LogBatch
+
 
 class ProbeTemperatureLog:
     ACCUMULATOR_STABILIZATION_TIME = 0.2
@@ -16,6 +20,10 @@ class ProbeTemperatureLog:
         self.data_point_accumulator = set[LoggedProbeDataPoint]()
         self.accumulator_timer: Optional[asyncio.Task] = None
         self.start_time: Optional[datetime] = None
+        # Core temperature aggregates for range queries.
+        self.history = HistoryPyramid(session_info.sample_period)
+        # Sequence numbers added since the last long-term statistics import.
+        self._statistics_pending: Optional[tuple[int, int]] = None
 
     @property
     def data_points(self) -> list[LoggedProbeDataPoint]:
@@ -77,6 +85,7 @@ class ProbeTemperatureLog:
             if dp.sequence_num not in self.data_points_dict:
                 assert dp.sequence_num is not None
                 self.data_points_dict[dp.sequence_num] = dp
+                self._add_to_history(dp)
                 added = True
 
         if added:
@@ -98,6 +107,12 @@ class ProbeTemperatureLog:
         else:
             self.accumulator_timer = asyncio.create_task(self.accumulator_timer_task())
 
+    def stop(self):
+        """Cancel a pending flush of the accumulator; its points are dropped."""
+        if self.accumulator_timer:
+            self.accumulator_timer.cancel()
+            self.accumulator_timer = None
+
     async def accumulator_timer_task(self):
         await asyncio.sleep(self.ACCUMULATOR_STABILIZATION_TIME)
         await self.insert_accumulated_data_points()
@@ -109,11 +124,84 @@ class ProbeTemperatureLog:
         ):
             assert data_point.sequence_num is not None
             self.data_points_dict[data_point.sequence_num] = data_point
+            self._add_to_history(data_point)
             if not self.start_time:
                 self.set_start_time(data_point)
         else:
             self.insert_data_point(data_point)
 
+    def insert_batch(self, batch: "LogBatch", serial_number: Optional[int] = None):
+        """Insert the records of a bulk-decoded batch that are not in the log yet, in one go."""
+        points = self.data_points_dict
+        newest = None
+        for row in batch.rows(serial_number):
+            sequence_number = batch.sequence_numbers[row]
+            if sequence_number not in points:
+                points[sequence_number] = data_point = batch.data_point(row)
+                self.history.add(sequence_number, batch.core_temperature(row))
+                self.mark_statistics_pending(sequence_number, sequence_number)
+                if newest is None or sequence_number > newest.sequence_num:
+                    newest = data_point
+        if newest is None:
+            return
+        self.data_points_dict = dict(sorted(points.items()))
+        if not self.start_time:
+            self.set_start_time(newest)
+
+    def _add_to_history(self, data_point: LoggedProbeDataPoint):
+        if data_point.virtual_core is not None and data_point.temperatures is not None:
+            self.history.add(
+                data_point.sequence_num,
+                data_point.virtual_core.temperature_from(data_point.temperatures),
+            )
+            self.mark_statistics_pending(data_point.sequence_num, data_point.sequence_num)
+
+    def mark_statistics_pending(self, first: int, last: int):
+        pending = self._statistics_pending
+        if pending is not None:
+            first, last = min(first, pending[0]), max(last, pending[1])
+        self._statistics_pending = (first, last)
+
+    def take_statistics_pending(self) -> Optional[tuple[int, int]]:
+        """The range of sequence numbers added since the last call, if any."""
+        pending, self._statistics_pending = self._statistics_pending, None
+        return pending
+
+    def sequence_range_between(self, start: datetime, end: datetime) -> Optional[tuple[int, int]]:
+        """First and last sequence numbers logged at or after `start` and before `end`."""
+        if self.start_time is None:
+            return None
+        period = int(self.session_information.sample_period)
+        first_ms = round((start - self.start_time).total_seconds() * 1000)
+        end_ms = round((end - self.start_time).total_seconds() * 1000)
+        return -(-first_ms // period), -(-end_ms // period) - 1
+
+    def sequence_number_at(self, time: datetime) -> Optional[int]:
+        """The sequence number logged at `time`, or None before the start time is known."""
+        if self.start_time is None:
+            return None
+        elapsed_ms = (time - self.start_time).total_seconds() * 1000
+        return int(elapsed_ms // int(self.session_information.sample_period))
+
+    def time_of(self, sequence_number: int) -> Optional[datetime]:
+        if self.start_time is None:
+            return None
+        elapsed_ms = sequence_number * int(self.session_information.sample_period)
+        return self.start_time + timedelta(milliseconds=elapsed_ms)
+
+    def history_in_range(
+        self, start: datetime, end: datetime, resolution: timedelta
+    ) -> list[tuple[datetime, HistoryPoint]]:
+        """Core temperature min/max/mean between `start` and `end`, one point per `resolution`."""
+        first = self.sequence_number_at(start)
+        last = self.sequence_number_at(end)
+        if first is None or last is None:
+            return []
+        return [
+            (self.time_of(point.sequence_number), point)
+            for point in self.history.query(first, last, resolution.total_seconds())
+        ]
+
     def set_start_time(self, data_point: LoggedProbeDataPoint):
         assert data_point.sequence_num is not None
         current_time = datetime.now()
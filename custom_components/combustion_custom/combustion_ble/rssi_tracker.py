@@ -0,0 +1,124 @@
+import heapq
+import itertools
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class RssiTracker(Generic[K]):
+    """Running best-RSSI / top-k aggregate over a set of keys.
+
+    Updates are fed from each device's RSSI Monitorable, so reads never have to look at the
+    full device list. Keys outside the top-k sit in a max-heap of runners-up, so a retained
+    entry that weakens is only swapped out when the strongest runner-up now beats it. Heap
+    entries go stale when their key is updated or removed; they are skipped when they reach
+    the front, and the heap is compacted once stale entries outnumber live ones.
+    """
+
+    DEFAULT_TOP_K = 3
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K) -> None:
+        self.top_k = max(1, top_k)
+        self._rssi: dict[K, int] = {}
+        # Sorted strongest -> weakest, at most top_k entries of (rssi, key)
+        self._top: list[tuple[int, K]] = []
+        # (-rssi, sequence, key) for keys outside the top-k; may hold stale entries
+        self._rest: list[tuple[int, int, K]] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._rssi)
+
+    @property
+    def best(self) -> Optional[tuple[K, int]]:
+        """(key, rssi) with the strongest signal, or None if nothing is tracked."""
+        if not self._top:
+            return None
+        rssi, key = self._top[0]
+        return key, rssi
+
+    @property
+    def best_rssi(self) -> Optional[int]:
+        return self._top[0][0] if self._top else None
+
+    def top(self) -> list[tuple[K, int]]:
+        """Up to top_k (key, rssi) pairs, strongest first."""
+        return [(key, rssi) for rssi, key in self._top]
+
+    def update(self, key: K, rssi: int) -> None:
+        previous = self._rssi.get(key)
+        if previous == rssi:
+            return
+        self._rssi[key] = rssi
+
+        index = self._index_of(key)
+        if index is None:
+            self._insert(key, rssi)
+            return
+        del self._top[index]
+        if rssi < previous:
+            runner_up = self._runner_up()
+            if runner_up is not None and runner_up[1] > rssi:
+                # The weakened entry dropped below the strongest key outside the top-k.
+                heapq.heappop(self._rest)
+                self._insert(*runner_up)
+        self._insert(key, rssi)
+
+    def remove(self, key: K) -> None:
+        if self._rssi.pop(key, None) is None:
+            return
+        index = self._index_of(key)
+        if index is not None:
+            del self._top[index]
+            runner_up = self._runner_up()
+            if runner_up is not None:
+                heapq.heappop(self._rest)
+                self._insert(*runner_up)
+        self._compact_if_stale()
+
+    def clear(self) -> None:
+        self._rssi.clear()
+        self._top.clear()
+        self._rest.clear()
+
+    def _index_of(self, key: K) -> Optional[int]:
+        for index, (_, top_key) in enumerate(self._top):
+            if top_key == key:
+                return index
+        return None
+
+    def _insert(self, key: K, rssi: int) -> None:
+        if len(self._top) >= self.top_k and rssi <= self._top[-1][0]:
+            self._push_rest(key, rssi)
+            return
+        index = 0
+        while index < len(self._top) and self._top[index][0] >= rssi:
+            index += 1
+        self._top.insert(index, (rssi, key))
+        if len(self._top) > self.top_k:
+            weakest_rssi, weakest_key = self._top.pop()
+            self._push_rest(weakest_key, weakest_rssi)
+
+    def _push_rest(self, key: K, rssi: int) -> None:
+        heapq.heappush(self._rest, (-rssi, next(self._sequence), key))
+        self._compact_if_stale()
+
+    def _runner_up(self) -> Optional[tuple[K, int]]:
+        """(key, rssi) at the front of the runners-up heap, dropping stale entries first."""
+        while self._rest:
+            negative_rssi, _, key = self._rest[0]
+            if self._rssi.get(key) == -negative_rssi and self._index_of(key) is None:
+                return key, -negative_rssi
+            heapq.heappop(self._rest)
+        return None
+
+    def _compact_if_stale(self) -> None:
+        if len(self._rest) <= 2 * len(self._rssi) + self.top_k:
+            return
+        retained = {key for _, key in self._top}
+        self._rest = [
+            (-rssi, next(self._sequence), key)
+            for key, rssi in self._rssi.items()
+            if key not in retained
+        ]
+        heapq.heapify(self._rest)
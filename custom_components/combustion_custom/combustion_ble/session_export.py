@@ -0,0 +1,154 @@
+"""Stream a probe session log to CSV or NDJSON."""
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import TYPE_CHECKING, Any, Iterator, Optional, TextIO
+
+if TYPE_CHECKING:
+    from .logged_probe_data_count import LoggedProbeDataPoint
+    from .probe_temperature_log import ProbeTemperatureLog
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+FORMATS = (FORMAT_CSV, FORMAT_NDJSON)
+
+COLUMNS = (
+    "sequence_number",
+    "time",
+    *(f"t{index}" for index in range(1, 9)),
+    "virtual_core",
+    "virtual_surface",
+    "virtual_ambient",
+    "core_temperature",
+    "surface_temperature",
+    "ambient_temperature",
+    "prediction_state",
+    "prediction_mode",
+    "prediction_type",
+    "prediction_set_point_temperature",
+    "prediction_value_seconds",
+    "estimated_core_temperature",
+)
+
+# Rows buffered before each write to the file.
+CHUNK_ROWS = 1000
+
+
+def sequence_range(log: ProbeTemperatureLog) -> Optional[tuple[int, int]]:
+    """Lowest and highest sequence numbers in the log.
+
+    Call this on the event loop: it iterates the log, which the loop may be inserting into.
+    """
+    points = log.data_points_dict
+    if not points:
+        return None
+    return min(points), max(points)
+
+
+def _name(value) -> Optional[str]:
+    return None if value is None else value.name
+
+
+def _row(log: ProbeTemperatureLog, data_point: LoggedProbeDataPoint) -> tuple[Any, ...]:
+    temperatures = data_point.temperatures
+    if temperatures is not None:
+        values = tuple(temperatures.values)
+        sensors = tuple(
+            None if sensor is None else sensor.temperature_from(temperatures)
+            for sensor in (
+                data_point.virtual_core,
+                data_point.virtual_surface,
+                data_point.virtual_ambient,
+            )
+        )
+    else:
+        values = (None,) * 8
+        sensors = (None, None, None)
+    time = log.time_of(data_point.sequence_num)
+    return (
+        data_point.sequence_num,
+        None if time is None else time.astimezone().isoformat(),
+        *values,
+        _name(data_point.virtual_core),
+        _name(data_point.virtual_surface),
+        _name(data_point.virtual_ambient),
+        *sensors,
+        _name(data_point.prediction_state),
+        _name(data_point.prediction_mode),
+        _name(data_point.prediction_type),
+        data_point.prediction_set_point_temperature,
+        data_point.prediction_value_seconds,
+        data_point.estimated_core_temperature,
+    )
+
+
+def iter_rows(log: ProbeTemperatureLog, first: int, last: int) -> Iterator[tuple[Any, ...]]:
+    """One tuple of COLUMNS per record in [first, last], oldest first.
+
+    Records are looked up one sequence number at a time instead of sorting or copying the log,
+    so memory stays constant and the log can keep growing on the loop while this runs in an
+    executor.
+    """
+    for sequence_number in range(first, last + 1):
+        # Re-read the attribute: inserts replace the dict with a re-sorted copy.
+        data_point = log.data_points_dict.get(sequence_number)
+        if data_point is not None:
+            yield _row(log, data_point)
+
+
+def iter_lines(rows: Iterator[tuple[Any, ...]], export_format: str) -> Iterator[str]:
+    """Rows as CSV (with a header) or NDJSON lines."""
+    if export_format == FORMAT_NDJSON:
+        for row in rows:
+            yield json.dumps(dict(zip(COLUMNS, row)), separators=(",", ":")) + "\n"
+        return
+    if export_format != FORMAT_CSV:
+        raise ValueError(f"Unknown export format {export_format!r}")
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(COLUMNS)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def write_session(
+    log: ProbeTemperatureLog,
+    file: TextIO,
+    export_format: str = FORMAT_CSV,
+    first: Optional[int] = None,
+    last: Optional[int] = None,
+) -> int:
+    """Write records [first, last] of `log` to `file` in chunks; returns the records written.
+
+    Without a range the whole log is exported, which iterates it: pass the range from
+    `sequence_range` (taken on the loop) when running in an executor.
+    """
+    if first is None or last is None:
+        bounds = sequence_range(log)
+        if bounds is None:
+            return 0
+        first = bounds[0] if first is None else first
+        last = bounds[1] if last is None else last
+    records = 0
+    chunk: list[str] = []
+    for line in iter_lines(iter_rows(log, first, last), export_format):
+        chunk.append(line)
+        if len(chunk) >= CHUNK_ROWS:
+            file.write("".join(chunk))
+            records += len(chunk)
+            chunk.clear()
+    if chunk:
+        file.write("".join(chunk))
+        records += len(chunk)
+    if export_format == FORMAT_CSV:
+        # The header line is not a record.
+        records -= 1
+    return records
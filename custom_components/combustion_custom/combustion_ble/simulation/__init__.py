@@ -0,0 +1,15 @@
+"""Simulated Combustion devices for load testing without a radio."""
+
+from .simulated_client import SimulatedBleakClient
+from .simulated_fleet import SimulatedFleet
+from .simulated_node import SimulatedNode
+from .simulated_peripheral import SimulatedPeripheral
+from .simulated_probe import SimulatedProbe
+
+__all__ = [
+    "SimulatedBleakClient",
+    "SimulatedFleet",
+    "SimulatedNode",
+    "SimulatedPeripheral",
+    "SimulatedProbe",
+]
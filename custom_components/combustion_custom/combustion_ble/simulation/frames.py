@@ -0,0 +1,61 @@
+"""Encoders for the wire formats the simulator emits."""
+
+from ..uart.meatnet.node_response import NodeResponse
+from ..utilities.crc16ccitt import crc16ccitt
+
+SYNC_BYTES = b"\xca\xfe"
+
+# Raw thermistor values are 13 bits at 0.05 °C per step, offset by -20 °C.
+_TEMPERATURE_MAX_RAW = 0x1FFF
+
+
+def encode_temperatures(values: list[float]) -> bytes:
+    """Pack eight temperatures (T1 first) into the 13-byte little-endian thermistor field."""
+    packed = 0
+    for index, value in enumerate(values[:8]):
+        raw = int(round((value + 20.0) / 0.05))
+        packed |= max(0, min(_TEMPERATURE_MAX_RAW, raw)) << (13 * index)
+    return packed.to_bytes(13, byteorder="little")
+
+
+def _raw_core(core_temperature: float) -> int:
+    return max(0, min(0x7FF, int(round((core_temperature + 20.0) / 0.1))))
+
+
+def encode_prediction_status(core_temperature: float) -> bytes:
+    """Status-layout prediction block: no active prediction, the given estimated core."""
+    raw_core = _raw_core(core_temperature)
+    return bytes([0x00, 0x00, 0x00, 0x00, 0x00, (raw_core & 0x07) << 5, raw_core >> 3])
+
+
+def encode_prediction_log(core_temperature: float) -> bytes:
+    """Log-layout prediction block: no active prediction, the given estimated core."""
+    raw_core = _raw_core(core_temperature)
+    return bytes([0x00, 0x00, 0x00, 0x00, 0x00, (raw_core & 0x3F) << 2, raw_core >> 6])
+
+
+def probe_response(message_type: int, payload: bytes, success: bool = True) -> bytes:
+    body = bytes([message_type, int(success), len(payload)]) + payload
+    return SYNC_BYTES + crc16ccitt(body).to_bytes(2, "little") + body
+
+
+def node_request(message_type: int, request_id: bytes, payload: bytes) -> bytes:
+    body = bytes([message_type]) + request_id + bytes([len(payload)]) + payload
+    return SYNC_BYTES + crc16ccitt(body).to_bytes(2, "little") + body
+
+
+def node_response(
+    message_type: int, request_id: bytes, response_id: int, payload: bytes, success: bool = True
+) -> bytes:
+    body = (
+        bytes([message_type | NodeResponse.RESPONSE_TYPE_FLAG])
+        + request_id
+        + response_id.to_bytes(4, "big")
+        + bytes([int(success), len(payload)])
+        + payload
+    )
+    return SYNC_BYTES + crc16ccitt(body).to_bytes(2, "little") + body
+
+
+def fixed_string(value: str, length: int) -> bytes:
+    return value.encode("utf-8")[:length].ljust(length, b"\x00")
@@ -0,0 +1,115 @@
+"""In-process stand-in for a connected BleakClient."""
+
+from typing import TYPE_CHECKING, Callable, Optional
+
+from bleak import BleakError
+
+from ..const import UART_RX_CHARACTERISTIC
+
+if TYPE_CHECKING:
+    from .simulated_peripheral import SimulatedPeripheral
+
+NotifyCallback = Callable[["SimulatedCharacteristic", bytearray], None]
+
+
+class SimulatedCharacteristic:
+    __slots__ = ("uuid", "handle", "descriptors")
+
+    def __init__(self, uuid: str, handle: int, notify: bool) -> None:
+        self.uuid = uuid
+        self.handle = handle
+        # BleManager only subscribes to characteristics that expose a (CCCD) descriptor.
+        self.descriptors = [object()] if notify else []
+
+
+class SimulatedService:
+    __slots__ = ("uuid", "characteristics")
+
+    def __init__(self, uuid: str, characteristics: list[SimulatedCharacteristic]) -> None:
+        self.uuid = uuid
+        self.characteristics = characteristics
+
+
+class SimulatedBleakClient:
+    """Implements the subset of BleakClient that BleManager uses, backed by a SimulatedPeripheral."""
+
+    def __init__(
+        self,
+        peripheral: "SimulatedPeripheral",
+        disconnected_callback: Optional[Callable[["SimulatedBleakClient"], None]] = None,
+        mtu_size: int = 247,
+        adapter: Optional[str] = None,
+    ) -> None:
+        self.peripheral = peripheral
+        self.adapter = adapter
+        self.mtu_size = mtu_size
+        self._disconnected_callback = disconnected_callback
+        self._connected = False
+        self._notify_callbacks: dict[str, tuple[SimulatedCharacteristic, NotifyCallback]] = {}
+        self.services = [
+            SimulatedService(
+                "simulated",
+                [
+                    SimulatedCharacteristic(uuid, handle, notify)
+                    for handle, (uuid, notify) in enumerate(peripheral.CHARACTERISTICS, start=1)
+                ],
+            )
+        ]
+
+    @property
+    def address(self) -> str:
+        return self.peripheral.address
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def connect(self) -> bool:
+        self._connected = True
+        self.peripheral.attach(self)
+        return True
+
+    async def disconnect(self) -> bool:
+        self._drop()
+        return True
+
+    def _drop(self) -> None:
+        """Tear the link down from either side."""
+        if not self._connected:
+            return
+        self._connected = False
+        self._notify_callbacks.clear()
+        self.peripheral.detach(self)
+        if self._disconnected_callback:
+            self._disconnected_callback(self)
+
+    async def start_notify(self, characteristic: SimulatedCharacteristic, callback: NotifyCallback):
+        self._notify_callbacks[characteristic.uuid] = (characteristic, callback)
+
+    async def stop_notify(self, characteristic: SimulatedCharacteristic):
+        self._notify_callbacks.pop(characteristic.uuid, None)
+
+    async def write_gatt_char(
+        self, characteristic: SimulatedCharacteristic, data: bytes, response: bool = False
+    ) -> None:
+        if not self._connected:
+            raise BleakError("Not connected")
+        if characteristic.uuid == UART_RX_CHARACTERISTIC:
+            self.peripheral.handle_write(self, bytes(data))
+
+    async def read_gatt_char(
+        self, characteristic: SimulatedCharacteristic, use_cached: bool = False
+    ) -> bytearray:
+        if not self._connected:
+            raise BleakError("Not connected")
+        value = self.peripheral.device_information.get(characteristic.uuid)
+        if value is None:
+            raise BleakError(f"Characteristic {characteristic.uuid} is not readable")
+        return bytearray(value.encode("utf-8"))
+
+    def notify(self, uuid: str, data: bytes) -> None:
+        if not self._connected:
+            return
+        if subscription := self._notify_callbacks.get(uuid):
+            characteristic, callback = subscription
+            callback(characteristic, bytearray(data))
@@ -0,0 +1,236 @@
+"""A configurable population of simulated probes, nodes and gauges."""
+
+import asyncio
+import random
+from typing import Callable, Optional, Sequence
+
+from bleak import BleakClient, BleakError
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from ..const import BT_MANUFACTURER_ID
+from ..logger import LOGGER
+from .simulated_client import SimulatedBleakClient
+from .simulated_node import SimulatedNode
+from .simulated_peripheral import SimulatedPeripheral
+from .simulated_probe import SimulatedProbe
+
+# Node models cycled through as nodes are added.
+NODE_MODELS = ("Timer", "Charger")
+
+
+class SimulatedFleet:
+    """Drives a BleManager with simulated MeatNet traffic instead of a radio.
+
+    Advertisements are fed straight into `BleManager.detection_callback` every
+    `advertising_interval`, and `BleManager.client_factory` is pointed at the fleet so
+    connections to simulated addresses get a SimulatedBleakClient. Connections to any other
+    address fall through to the real adapter, so a fleet can run alongside real devices.
+
+    Each probe is repeated by `node_redundancy` nodes (round robin). `time_scale` speeds up
+    the cook so a multi-hour log builds up in minutes.
+
+    With `adapters`, every advertisement is delivered once per adapter with its own RSSI and
+    the adapter name as the source, like several HCI dongles hearing the same fleet, each
+    with `adapter_max_connections` slots.
+    `fail_adapter` makes one go silent and refuse new connections; links already placed on it
+    stay up until the integration moves them.
+    """
+
+    ADDRESS_PREFIX = "C0:FF:EE"
+
+    def __init__(
+        self,
+        ble_manager,
+        probes: int = 50,
+        nodes: int = 10,
+        gauges: int = 0,
+        node_redundancy: int = 2,
+        advertising_interval: float = 0.25,
+        status_interval: float = 1.0,
+        heartbeat_interval: float = 5.0,
+        response_latency: float = 0.02,
+        connect_latency: float = 0.1,
+        time_scale: float = 1.0,
+        adapters: Sequence[str] = (),
+        adapter_max_connections: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.ble_manager = ble_manager
+        self.node_redundancy = node_redundancy
+        self.advertising_interval = advertising_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.connect_latency = connect_latency
+        self.peripheral_options = {
+            "status_interval": status_interval,
+            "response_latency": response_latency,
+            "time_scale": time_scale,
+        }
+        self.rng = random.Random(seed)
+        self.adapters = list(adapters)
+        self.adapter_max_connections = adapter_max_connections
+        self.failed_adapters: set[str] = set()
+        # address -> adapter -> RSSI offset from the peripheral's base RSSI
+        self._adapter_rssi: dict[str, dict[str, int]] = {}
+
+        self.probes: list[SimulatedProbe] = []
+        self.nodes: list[SimulatedNode] = []
+        self.peripherals: dict[str, SimulatedPeripheral] = {}
+        # address -> adapter (None without adapters) -> BLEDevice as seen by that adapter
+        self._ble_devices: dict[str, dict[Optional[str], BLEDevice]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._previous_factory = None
+        self.advertisements_sent = 0
+
+        for _ in range(nodes):
+            self.add_node()
+        for _ in range(gauges):
+            self.add_node(is_gauge=True)
+        for _ in range(probes):
+            self.add_probe()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def _address(self) -> str:
+        suffix = len(self.peripherals).to_bytes(3, "big")
+        return f"{self.ADDRESS_PREFIX}:{suffix.hex(':').upper()}"
+
+    def _register(self, peripheral: SimulatedPeripheral) -> None:
+        self.peripherals[peripheral.address] = peripheral
+        address = peripheral.address
+        if not self.adapters:
+            self._ble_devices[address] = {None: BLEDevice(address, peripheral.name, None)}
+            return
+        self._ble_devices[address] = {
+            adapter: BLEDevice(address, peripheral.name, {"source": adapter})
+            for adapter in self.adapters
+        }
+        self._adapter_rssi[address] = {
+            adapter: self.rng.randint(-15, 15) for adapter in self.adapters
+        }
+
+    def add_probe(self) -> SimulatedProbe:
+        serial_number = 0x5100_0000 | len(self.probes)
+        probe = SimulatedProbe(self._address(), serial_number, self.rng, **self.peripheral_options)
+        self._register(probe)
+        self.probes.append(probe)
+
+        if self.nodes:
+            first = len(self.probes) - 1
+            for offset in range(min(self.node_redundancy, len(self.nodes))):
+                self.nodes[(first + offset) % len(self.nodes)].repeat(probe)
+        return probe
+
+    def add_node(self, is_gauge: bool = False) -> SimulatedNode:
+        index = len(self.nodes)
+        node = SimulatedNode(
+            self._address(),
+            serial_number=f"{'SIMG' if is_gauge else 'SIMN'}{index:06d}",
+            rng=self.rng,
+            model=NODE_MODELS[index % len(NODE_MODELS)],
+            is_gauge=is_gauge,
+            heartbeat_interval=self.heartbeat_interval,
+            **self.peripheral_options,
+        )
+        self._register(node)
+        self.nodes.append(node)
+        return node
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._previous_factory = self.ble_manager.client_factory
+        self.ble_manager.client_factory = self._connect
+        for adapter in self.adapters:
+            self.ble_manager.adapters.add(adapter, self.adapter_max_connections)
+        self._task = asyncio.get_running_loop().create_task(
+            self._advertise_loop(), name="simulated_fleet[advertise]"
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self.ble_manager.client_factory == self._connect:
+            self.ble_manager.client_factory = self._previous_factory
+        for peripheral in self.peripherals.values():
+            peripheral.disconnect_all()
+
+    async def _connect(
+        self, ble_device: BLEDevice, disconnected_callback: Callable[[BleakClient], None]
+    ) -> Optional[SimulatedBleakClient]:
+        peripheral = self.peripherals.get(ble_device.address)
+        if peripheral is None:
+            if self._previous_factory:
+                return await self._previous_factory(ble_device, disconnected_callback)
+            return None
+        adapter = ble_device.details.get("source") if ble_device.details else None
+        await asyncio.sleep(self.connect_latency)
+        if adapter in self.failed_adapters:
+            raise BleakError(f"Adapter {adapter} is not responding")
+        client = SimulatedBleakClient(peripheral, disconnected_callback, adapter=adapter)
+        await client.connect()
+        return client
+
+    async def _advertise_loop(self) -> None:
+        while True:
+            try:
+                self.advertise_once()
+            except Exception:
+                LOGGER.exception("Simulated advertising round failed")
+            await asyncio.sleep(self.advertising_interval)
+
+    def fail_adapter(self, adapter: str) -> None:
+        """Stop delivering advertisements on an adapter and refuse connections through it."""
+        self.failed_adapters.add(adapter)
+
+    def restore_adapter(self, adapter: str) -> None:
+        self.failed_adapters.discard(adapter)
+
+    def advertise_once(self) -> None:
+        """Deliver one advertisement round from every peripheral."""
+        for address, peripheral in self.peripherals.items():
+            for payload in peripheral.advertisements():
+                rssi = peripheral.rssi + self.rng.randint(-4, 4)
+                for adapter, device in self._ble_devices[address].items():
+                    if adapter in self.failed_adapters:
+                        continue
+                    offset = self._adapter_rssi[address][adapter] if adapter is not None else 0
+                    self._deliver(device, peripheral.name, payload, rssi + offset, adapter)
+
+    def _deliver(
+        self, device: BLEDevice, name: str, payload: bytes, rssi: int, adapter: Optional[str]
+    ) -> None:
+        advertisement = AdvertisementData(
+            local_name=name,
+            manufacturer_data={BT_MANUFACTURER_ID: payload},
+            service_data={},
+            service_uuids=[],
+            tx_power=None,
+            rssi=rssi,
+            platform_data=(),
+        )
+        self.advertisements_sent += 1
+        if adapter is None:
+            self.ble_manager.detection_callback(device, advertisement, True)
+        else:
+            self.ble_manager.detection_callback(device, advertisement, True, adapter)
+
+    def stats(self) -> dict:
+        return {
+            "probes": len(self.probes),
+            "nodes": sum(not node.is_gauge for node in self.nodes),
+            "gauges": sum(node.is_gauge for node in self.nodes),
+            "advertisements_sent": self.advertisements_sent,
+            "connected": sum(bool(peripheral.clients) for peripheral in self.peripherals.values()),
+            "peripherals": {
+                address: peripheral.stats() for address, peripheral in self.peripherals.items()
+            },
+        }
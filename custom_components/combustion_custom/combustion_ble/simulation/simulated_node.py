@@ -0,0 +1,231 @@
+"""A simulated MeatNet repeater (Display, Booster or Gauge)."""
+
+import math
+import random
+import time
+
+from ..ble_data.advertising_data import CombustionProductType
+from ..const import (
+    FW_VERSION_CHARACTERISTIC,
+    HW_VERSION_CHARACTERISTIC,
+    MODEL_NUMBER_CHARACTERISTIC,
+    SERIAL_NUMBER_CHARACTERISTIC,
+    UART_RX_CHARACTERISTIC,
+    UART_TX_CHARACTERISTIC,
+)
+from ..uart.meatnet.node_message_type import NodeMessageType
+from .frames import fixed_string, node_request, node_response
+from .simulated_client import SimulatedBleakClient
+from .simulated_peripheral import SimulatedPeripheral
+from .simulated_probe import SimulatedProbe
+
+
+class SimulatedNode(SimulatedPeripheral):
+    """Repeats a set of SimulatedProbes over advertising and UART.
+
+    Advertises each repeated probe with the node product type, forwards probe status as
+    Probe Status requests every `status_interval`, sends a Heartbeat every
+    `heartbeat_interval` and answers the node requests the integration issues on behalf of
+    a probe. A gauge additionally advertises its own Gauge MSD, sends Gauge Status with every
+    status round and serves its log over Read Gauge Logs.
+    """
+
+    CHARACTERISTICS = (
+        (FW_VERSION_CHARACTERISTIC, False),
+        (HW_VERSION_CHARACTERISTIC, False),
+        (SERIAL_NUMBER_CHARACTERISTIC, False),
+        (MODEL_NUMBER_CHARACTERISTIC, False),
+        (UART_RX_CHARACTERISTIC, False),
+        (UART_TX_CHARACTERISTIC, True),
+    )
+    REQUEST_HEADER_LENGTH = 10
+    REQUEST_LENGTH_INDEX = 9
+
+    # Heartbeat connection-detail slots.
+    HEARTBEAT_CONNECTIONS = 4
+    GAUGE_SAMPLE_PERIOD_MS = 5000
+
+    def __init__(
+        self,
+        address: str,
+        serial_number: str,
+        rng: random.Random,
+        model: str = "Timer",
+        is_gauge: bool = False,
+        heartbeat_interval: float = 5.0,
+        **kwargs,
+    ) -> None:
+        super().__init__(
+            address,
+            name="Gauge" if is_gauge else model,
+            serial_number=serial_number,
+            model=f"{'Gauge' if is_gauge else model}:SIM",
+            rng=rng,
+            **kwargs,
+        )
+        self.serial_number = serial_number
+        self.is_gauge = is_gauge
+        self.heartbeat_interval = heartbeat_interval
+        self.probes: dict[int, SimulatedProbe] = {}
+        self.gauge_temperature = rng.uniform(18.0, 26.0)
+        self.gauge_session_id = rng.randint(1, 0xFFFFFFFF)
+        self._next_id = rng.randint(1, 0x7FFFFFFF)
+        self._last_heartbeat = 0.0
+
+    def repeat(self, probe: SimulatedProbe) -> None:
+        self.probes[probe.serial_number] = probe
+
+    def _take_id(self) -> int:
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        return self._next_id
+
+    def gauge_temperature_at(self, elapsed: float) -> float:
+        """Ambient drifting slowly around the starting temperature."""
+        return self.gauge_temperature + 2.0 * math.sin(elapsed / 600.0)
+
+    @staticmethod
+    def _gauge_raw(temperature: float) -> bytes:
+        return (int(round((temperature + 20.0) / 0.1)) & 0x1FFF).to_bytes(2, "little")
+
+    @property
+    def gauge_max_sequence_number(self) -> int:
+        return int(self.elapsed * 1000) // self.GAUGE_SAMPLE_PERIOD_MS
+
+    def gauge_payload(self) -> bytes:
+        temperature = self.gauge_temperature_at(self.elapsed) + self.rng.uniform(-0.1, 0.1)
+        return (
+            bytes([CombustionProductType.GAUGE.value])
+            + fixed_string(self.serial_number, 10)
+            + self._gauge_raw(temperature)
+            # Sensor present; no alarms.
+            + bytes([0x01, 0x00])
+            + bytes(7)
+        )
+
+    def advertisements(self) -> list[bytes]:
+        payloads = [
+            probe.advertising_payload(CombustionProductType.MEAT_NET_NODE)
+            for probe in self.probes.values()
+        ]
+        if self.is_gauge:
+            payloads.append(self.gauge_payload())
+        return payloads
+
+    def probe_status_request(self, probe: SimulatedProbe) -> bytes:
+        payload = probe.serial_number.to_bytes(4, "little") + probe.status_payload() + b"\x00"
+        return node_request(
+            NodeMessageType.PROBE_STATUS.value, self._take_id().to_bytes(4, "big"), payload
+        )
+
+    def gauge_status_request(self) -> bytes:
+        payload = (
+            fixed_string(self.serial_number, 10)
+            + self.gauge_session_id.to_bytes(4, "little")
+            + self.GAUGE_SAMPLE_PERIOD_MS.to_bytes(2, "little")
+            + self._gauge_raw(self.gauge_temperature_at(self.elapsed))
+            # Sensor present.
+            + bytes([0x01])
+            + (0).to_bytes(4, "little")
+            + self.gauge_max_sequence_number.to_bytes(4, "little")
+            # Network information: no hops, the Gauge is speaking for itself.
+            + bytes([0x00])
+            + bytes(4)
+        )
+        return node_request(
+            NodeMessageType.GAUGE_STATUS.value, self._take_id().to_bytes(4, "big"), payload
+        )
+
+    def gauge_log_payload(self, sequence_number: int) -> bytes:
+        elapsed = sequence_number * self.GAUGE_SAMPLE_PERIOD_MS / 1000
+        temperature = self.gauge_temperature_at(elapsed)
+        return (
+            fixed_string(self.serial_number, 10)
+            + sequence_number.to_bytes(4, "little")
+            + self._gauge_raw(temperature)
+            + bytes([0x01])
+        )
+
+    def heartbeat_request(self) -> bytes:
+        mac = bytes.fromhex(self.address.replace(":", ""))[:6].ljust(6, b"\x00")
+        product_type = (
+            CombustionProductType.GAUGE if self.is_gauge else CombustionProductType.MEAT_NET_NODE
+        )
+        payload = fixed_string(self.serial_number, 10) + mac + bytes([product_type.value, 0, 0])
+        probes = list(self.probes.values())[: self.HEARTBEAT_CONNECTIONS]
+        for probe in probes:
+            payload += (
+                probe.serial_number.to_bytes(4, "little").ljust(10, b"\x00")
+                + bytes([CombustionProductType.PROBE.value, 0x01])
+                + probe.rssi.to_bytes(1, "big", signed=True)
+            )
+        payload += bytes(13 * (self.HEARTBEAT_CONNECTIONS - len(probes)))
+        return node_request(
+            NodeMessageType.HEARTBEAT.value, self._take_id().to_bytes(4, "big"), payload
+        )
+
+    def handle_uart(self, data: bytes) -> list[bytes]:
+        message_type = data[4]
+        request_id = data[5:9]
+        payload = data[10:]
+        if message_type == NodeMessageType.READ_GAUGE_LOGS.value:
+            if not self.is_gauge or payload[0:10] != fixed_string(self.serial_number, 10):
+                return []
+            min_sequence = int.from_bytes(payload[10:14], "little")
+            max_sequence = int.from_bytes(payload[14:18], "little")
+            return [
+                node_response(
+                    message_type, request_id, self._take_id(), self.gauge_log_payload(sequence)
+                )
+                for sequence in range(
+                    max(0, min_sequence), min(max_sequence, self.gauge_max_sequence_number) + 1
+                )
+            ]
+
+        probe = self.probes.get(int.from_bytes(payload[0:4], "little"))
+        if probe is None:
+            # Not one of ours; a real node would not answer either.
+            return []
+
+        serial = payload[0:4]
+        if message_type == NodeMessageType.LOG.value:
+            min_sequence = int.from_bytes(payload[4:8], "little")
+            max_sequence = int.from_bytes(payload[8:12], "little")
+            return [
+                node_response(
+                    message_type,
+                    request_id,
+                    self._take_id(),
+                    serial + probe.log_payload(sequence_number),
+                )
+                for sequence_number in probe.log_range(min_sequence, max_sequence)
+            ]
+
+        if message_type == NodeMessageType.SESSION_INFO.value:
+            response = serial + probe.session_info_payload()
+        elif message_type == NodeMessageType.PROBE_FIRMWARE_REVISION.value:
+            response = serial + fixed_string(
+                probe.device_information[FW_VERSION_CHARACTERISTIC], 20
+            )
+        elif message_type == NodeMessageType.PROBE_HARDWARE_REVISION.value:
+            response = serial + fixed_string(
+                probe.device_information[HW_VERSION_CHARACTERISTIC], 16
+            )
+        elif message_type == NodeMessageType.PROBE_MODEL_INFORMATION.value:
+            response = serial + fixed_string(
+                probe.device_information[MODEL_NUMBER_CHARACTERISTIC], 50
+            )
+        else:
+            # SET_PREDICTION and the rest are acknowledged without effect.
+            response = b""
+        return [node_response(message_type, request_id, self._take_id(), response)]
+
+    def emit_periodic(self, client: SimulatedBleakClient) -> None:
+        frames = [self.probe_status_request(probe) for probe in self.probes.values()]
+        if self.is_gauge:
+            frames.append(self.gauge_status_request())
+        now = time.monotonic()
+        if now - self._last_heartbeat >= self.heartbeat_interval:
+            self._last_heartbeat = now
+            frames.append(self.heartbeat_request())
+        if frames:
+            self.send_uart(client, frames)
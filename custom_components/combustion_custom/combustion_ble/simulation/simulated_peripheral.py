@@ -0,0 +1,150 @@
+"""Common behaviour of simulated Combustion peripherals."""
+
+from abc import ABC, abstractmethod
+import asyncio
+import random
+import time
+from typing import Optional
+
+from ..const import (
+    FW_VERSION_CHARACTERISTIC,
+    HW_VERSION_CHARACTERISTIC,
+    MODEL_NUMBER_CHARACTERISTIC,
+    SERIAL_NUMBER_CHARACTERISTIC,
+    UART_TX_CHARACTERISTIC,
+)
+from ..logger import LOGGER
+from .simulated_client import SimulatedBleakClient
+
+
+class SimulatedPeripheral(ABC):
+    """A fake device that answers one or more SimulatedBleakClient connections.
+
+    Subclasses describe their GATT table in `CHARACTERISTICS`, build advertisement payloads and
+    turn UART writes into response frames. Responses and periodic notifications are delivered
+    on the event loop after `response_latency`, so the integration sees the same interleaving
+    it would with a radio.
+    """
+
+    # (uuid, notifies) in discovery order.
+    CHARACTERISTICS: tuple[tuple[str, bool], ...] = ()
+    # Notification payloads are packed up to this many bytes (ATT MTU 247 minus the header).
+    NOTIFY_SIZE = 244
+    # Framing of the requests this peripheral receives.
+    REQUEST_HEADER_LENGTH = 6
+    REQUEST_LENGTH_INDEX = 5
+
+    def __init__(
+        self,
+        address: str,
+        name: str,
+        serial_number: str,
+        model: str,
+        rng: random.Random,
+        status_interval: float = 1.0,
+        response_latency: float = 0.02,
+        time_scale: float = 1.0,
+    ) -> None:
+        self.address = address
+        self.name = name
+        self.rng = rng
+        self.status_interval = status_interval
+        self.response_latency = response_latency
+        self.time_scale = time_scale
+        self.rssi = rng.randint(-85, -50)
+        self.device_information = {
+            FW_VERSION_CHARACTERISTIC: "v1.4.3-sim",
+            HW_VERSION_CHARACTERISTIC: "v1.0.0",
+            SERIAL_NUMBER_CHARACTERISTIC: serial_number,
+            MODEL_NUMBER_CHARACTERISTIC: model,
+        }
+        self.clients: set[SimulatedBleakClient] = set()
+        self.started = time.monotonic()
+        self._notify_task: Optional[asyncio.Task] = None
+
+        self.connections = 0
+        self.requests = 0
+        self.notifications = 0
+
+    @property
+    def elapsed(self) -> float:
+        """Simulated seconds since the device was switched on."""
+        return (time.monotonic() - self.started) * self.time_scale
+
+    @abstractmethod
+    def advertisements(self) -> list[bytes]:
+        """Manufacturer payloads (without the vendor id) to advertise this round."""
+
+    @abstractmethod
+    def handle_uart(self, data: bytes) -> list[bytes]:
+        """Response frames for one UART write."""
+
+    def emit_periodic(self, client: SimulatedBleakClient) -> None:
+        """Send the notifications due every `status_interval`."""
+
+    def attach(self, client: SimulatedBleakClient) -> None:
+        self.clients.add(client)
+        self.connections += 1
+        if self._notify_task is None:
+            self._notify_task = asyncio.get_running_loop().create_task(
+                self._notify_loop(), name=f"simulated_peripheral[{self.address}]"
+            )
+
+    def detach(self, client: SimulatedBleakClient) -> None:
+        self.clients.discard(client)
+        if not self.clients and self._notify_task is not None:
+            self._notify_task.cancel()
+            self._notify_task = None
+
+    def disconnect_all(self) -> None:
+        for client in list(self.clients):
+            client._drop()
+
+    def handle_write(self, client: SimulatedBleakClient, data: bytes) -> None:
+        self.requests += 1
+        frames = []
+        # A write may carry several coalesced frames.
+        offset = 0
+        while len(data) - offset >= self.REQUEST_HEADER_LENGTH:
+            end = offset + self.REQUEST_HEADER_LENGTH + data[offset + self.REQUEST_LENGTH_INDEX]
+            frame = data[offset:end]
+            try:
+                frames.extend(self.handle_uart(frame))
+            except Exception:
+                LOGGER.exception("Simulated %s failed to answer %s", self.address, frame.hex())
+            offset = end
+        if frames:
+            self.send_uart(client, frames)
+
+    def send_uart(self, client: SimulatedBleakClient, frames: list[bytes]) -> None:
+        """Deliver frames on UART TX, packed into as few notifications as the MTU allows."""
+        loop = asyncio.get_running_loop()
+        for chunk in self._pack(frames):
+            self.notifications += 1
+            loop.call_later(self.response_latency, client.notify, UART_TX_CHARACTERISTIC, chunk)
+
+    def _pack(self, frames: list[bytes]) -> list[bytes]:
+        chunks: list[bytes] = []
+        current = b""
+        for frame in frames:
+            if current and len(current) + len(frame) > self.NOTIFY_SIZE:
+                chunks.append(current)
+                current = b""
+            current += frame
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _notify_loop(self) -> None:
+        while self.clients:
+            await asyncio.sleep(self.status_interval)
+            for client in list(self.clients):
+                self.emit_periodic(client)
+
+    def stats(self) -> dict:
+        return {
+            "clients": len(self.clients),
+            "connections": self.connections,
+            "requests": self.requests,
+            "notifications": self.notifications,
+        }
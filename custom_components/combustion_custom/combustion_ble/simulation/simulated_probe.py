@@ -0,0 +1,137 @@
+"""A simulated Predictive Thermometer."""
+
+import math
+import random
+
+from ..ble_data.advertising_data import CombustionProductType
+from ..const import (
+    DEVICE_STATUS_CHARACTERISTIC,
+    FW_VERSION_CHARACTERISTIC,
+    HW_VERSION_CHARACTERISTIC,
+    MODEL_NUMBER_CHARACTERISTIC,
+    SERIAL_NUMBER_CHARACTERISTIC,
+    UART_RX_CHARACTERISTIC,
+    UART_TX_CHARACTERISTIC,
+)
+from ..uart.message_type import MessageType
+from .frames import (
+    encode_prediction_log,
+    encode_prediction_status,
+    encode_temperatures,
+    probe_response,
+)
+from .simulated_client import SimulatedBleakClient
+from .simulated_peripheral import SimulatedPeripheral
+
+
+class SimulatedProbe(SimulatedPeripheral):
+    """A probe in a piece of meat in an oven.
+
+    Each of the eight thermistors follows Newton's law of heating towards the oven temperature;
+    the tip (T1) is slowest and the handle (T8) fastest. The record log advances one sequence
+    number every `sample_period_ms` of simulated time and any part of it can be read back.
+    """
+
+    CHARACTERISTICS = (
+        (FW_VERSION_CHARACTERISTIC, False),
+        (HW_VERSION_CHARACTERISTIC, False),
+        (SERIAL_NUMBER_CHARACTERISTIC, False),
+        (MODEL_NUMBER_CHARACTERISTIC, False),
+        (DEVICE_STATUS_CHARACTERISTIC, True),
+        (UART_RX_CHARACTERISTIC, False),
+        (UART_TX_CHARACTERISTIC, True),
+    )
+
+    SAMPLE_PERIOD_MS = 5000
+
+    def __init__(self, address: str, serial_number: int, rng: random.Random, **kwargs) -> None:
+        super().__init__(
+            address,
+            name="CP",
+            serial_number=f"{serial_number:08X}",
+            model=f"CP02:SIM{serial_number & 0xFFFF:04X}",
+            rng=rng,
+            **kwargs,
+        )
+        self.serial_number = serial_number
+        self.session_id = rng.randint(1, 0xFFFFFFFF)
+        self.start_temperature = rng.uniform(2.0, 8.0)
+        self.oven_temperature = rng.uniform(110.0, 230.0)
+        # Per-sensor time constants, in 1/seconds. T1 sits deep in the meat.
+        core_rate = rng.uniform(1 / 7200, 1 / 2400)
+        self.heating_rates = [core_rate * (1 + index * index * 0.8) for index in range(8)]
+
+    def temperatures_at(self, elapsed: float) -> list[float]:
+        return [
+            self.oven_temperature
+            - (self.oven_temperature - self.start_temperature) * math.exp(-rate * elapsed)
+            for rate in self.heating_rates
+        ]
+
+    @property
+    def max_sequence_number(self) -> int:
+        return int(self.elapsed * 1000) // self.SAMPLE_PERIOD_MS
+
+    def _sample(self, sequence_number: int) -> tuple[bytes, float]:
+        temperatures = self.temperatures_at(sequence_number * self.SAMPLE_PERIOD_MS / 1000)
+        return encode_temperatures(temperatures), min(temperatures[:3])
+
+    def _current(self) -> tuple[bytes, float]:
+        temperatures = self.temperatures_at(self.elapsed)
+        noise = [value + self.rng.uniform(-0.05, 0.05) for value in temperatures]
+        return encode_temperatures(noise), min(noise[:3])
+
+    def advertising_payload(
+        self, product_type: CombustionProductType = CombustionProductType.PROBE, hop: int = 0
+    ) -> bytes:
+        temperatures, _ = self._current()
+        return (
+            bytes([product_type.value])
+            + self.serial_number.to_bytes(4, "little")
+            + temperatures
+            + bytes([0x00, 0x00, hop & 0x03])
+        )
+
+    def advertisements(self) -> list[bytes]:
+        return [self.advertising_payload()]
+
+    def status_payload(self) -> bytes:
+        temperatures, core = self._current()
+        return (
+            (0).to_bytes(4, "little")
+            + self.max_sequence_number.to_bytes(4, "little")
+            + temperatures
+            + bytes([0x00, 0x00])
+            + encode_prediction_status(core)
+        )
+
+    def log_payload(self, sequence_number: int) -> bytes:
+        temperatures, core = self._sample(sequence_number)
+        return sequence_number.to_bytes(4, "little") + temperatures + encode_prediction_log(core)
+
+    def session_info_payload(self) -> bytes:
+        return self.session_id.to_bytes(4, "little") + self.SAMPLE_PERIOD_MS.to_bytes(2, "little")
+
+    def log_range(self, min_sequence: int, max_sequence: int) -> range:
+        return range(max(0, min_sequence), min(max_sequence, self.max_sequence_number) + 1)
+
+    def handle_uart(self, data: bytes) -> list[bytes]:
+        message_type = data[4]
+        payload = data[6:]
+        if message_type == MessageType.SESSION_INFO:
+            return [probe_response(message_type, self.session_info_payload())]
+        if message_type == MessageType.LOG:
+            min_sequence = int.from_bytes(payload[0:4], "little")
+            max_sequence = int.from_bytes(payload[4:8], "little")
+            return [
+                probe_response(message_type, self.log_payload(sequence_number))
+                for sequence_number in self.log_range(min_sequence, max_sequence)
+            ]
+        if message_type == MessageType.READ_OVER_TEMPERATURE:
+            return [probe_response(message_type, b"\x00")]
+        # SET_ID, SET_COLOR and SET_PREDICTION are acknowledged without effect.
+        return [probe_response(message_type, b"")]
+
+    def emit_periodic(self, client: SimulatedBleakClient) -> None:
+        self.notifications += 1
+        client.notify(DEVICE_STATUS_CHARACTERISTIC, self.status_payload())
@@ -1,19 +1,24 @@
 """UART"""
 
-from .log_request import LogRequest
-from .log_response import LogResponse
-from .message_type import MessageType
-from .read_over_temperature import (
-    ReadOverTemperatureRequest,
-    ReadOverTemperatureResponse,
-)
-from .request import Request
-from .response import Response
-from .response_from_data import responses_from_data
-from .session_info import SessionInfoRequest, SessionInfoResponse, SessionInformation
-from .set_color import SetColorRequest, SetColorResponse
-from .set_id import SetIDRequest, SetIDResponse
-from .set_prediction import SetPredictionRequest, SetPredictionResponse
+from typing import TYPE_CHECKING
+
+from ..utilities.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .log_request import LogRequest
+    from .log_response import LogResponse
+    from .message_type import MessageType
+    from .read_over_temperature import (
+        ReadOverTemperatureRequest,
+        ReadOverTemperatureResponse,
+    )
+    from .request import Request
+    from .response import Response
+    from .response_from_data import responses_from_data
+    from .session_info import SessionInfoRequest, SessionInfoResponse, SessionInformation
+    from .set_color import SetColorRequest, SetColorResponse
+    from .set_id import SetIDRequest, SetIDResponse
+    from .set_prediction import SetPredictionRequest, SetPredictionResponse
 
 __all__ = [
     "LogRequest",
@@ -34,3 +39,28 @@ __all__ = [
     "SetPredictionRequest",
     "SetPredictionResponse",
 ]
+
+# Submodules are imported on first use so that importing the package stays cheap.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "LogRequest": ".log_request",
+        "LogResponse": ".log_response",
+        "MessageType": ".message_type",
+        "ReadOverTemperatureRequest": ".read_over_temperature",
+        "ReadOverTemperatureResponse": ".read_over_temperature",
+        "Request": ".request",
+        "Response": ".response",
+        "responses_from_data": ".response_from_data",
+        "SessionInfoRequest": ".session_info",
+        "SessionInfoResponse": ".session_info",
+        "SessionInformation": ".session_info",
+        "SetColorRequest": ".set_color",
+        "SetColorResponse": ".set_color",
+        "SetIDRequest": ".set_id",
+        "SetIDResponse": ".set_id",
+        "SetPredictionRequest": ".set_prediction",
+        "SetPredictionResponse": ".set_prediction",
+    },
+)
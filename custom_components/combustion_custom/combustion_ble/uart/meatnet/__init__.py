@@ -1,35 +1,49 @@
 """MeatNet UART"""
 
-from .node_heartbeat_request import NodeHeartbeatRequest
-from .node_message_type import NodeMessageType
-from .node_probe_status_request import NodeProbeStatusRequest
-from .node_read_firmware_revision_request import NodeReadFirmwareRevisionRequest
-from .node_read_firmware_revision_response import NodeReadFirmwareRevisionResponse
-from .node_read_hardware_revision_request import NodeReadHardwareRevisionRequest
-from .node_read_hardware_revision_response import NodeReadHardwareRevisionResponse
-from .node_read_logs_request import NodeReadLogsRequest
-from .node_read_logs_response import NodeReadLogsResponse
-from .node_read_model_info_request import NodeReadModelInfoRequest
-from .node_read_model_info_response import NodeReadModelInfoResponse
-from .node_read_session_info_request import NodeReadSessionInfoRequest
-from .node_read_session_info_response import NodeReadSessionInfoResponse
-from .node_request import NodeRequest
+from typing import TYPE_CHECKING
+
+from ...utilities.lazy_import import lazy_exports
+
+# These share their submodule's name, which would shadow a lazily exported function. Their
+# message registries load on first use, so importing them here is cheap.
 from .node_request_from_data import node_request_from_data
-from .node_response import NodeResponse
 from .node_response_from_data import node_response_from_data
-from .node_set_prediction_request import (
-    NodeSetPredictionRequest,
-    NodeSetPredictionResponse,
-)
-from .node_sync_thermometer_list_request import NodeSyncThermometerListRequest
-from .node_uart_message import NodeUARTMessage
+
+if TYPE_CHECKING:
+    from .node_gauge_status_request import NodeGaugeStatusRequest
+    from .node_heartbeat_request import NodeHeartbeatRequest
+    from .node_message_type import NodeMessageType
+    from .node_probe_status_request import NodeProbeStatusRequest
+    from .node_read_firmware_revision_request import NodeReadFirmwareRevisionRequest
+    from .node_read_firmware_revision_response import NodeReadFirmwareRevisionResponse
+    from .node_read_gauge_logs_request import NodeReadGaugeLogsRequest
+    from .node_read_gauge_logs_response import NodeReadGaugeLogsResponse
+    from .node_read_hardware_revision_request import NodeReadHardwareRevisionRequest
+    from .node_read_hardware_revision_response import NodeReadHardwareRevisionResponse
+    from .node_read_logs_request import NodeReadLogsRequest
+    from .node_read_logs_response import NodeReadLogsResponse
+    from .node_read_model_info_request import NodeReadModelInfoRequest
+    from .node_read_model_info_response import NodeReadModelInfoResponse
+    from .node_read_session_info_request import NodeReadSessionInfoRequest
+    from .node_read_session_info_response import NodeReadSessionInfoResponse
+    from .node_request import NodeRequest
+    from .node_response import NodeResponse
+    from .node_set_prediction_request import (
+        NodeSetPredictionRequest,
+        NodeSetPredictionResponse,
+    )
+    from .node_sync_thermometer_list_request import NodeSyncThermometerListRequest
+    from .node_uart_message import NodeUARTMessage
 
 __all__ = [
+    "NodeGaugeStatusRequest",
     "NodeHeartbeatRequest",
     "NodeMessageType",
     "NodeProbeStatusRequest",
     "NodeReadFirmwareRevisionRequest",
     "NodeReadFirmwareRevisionResponse",
+    "NodeReadGaugeLogsRequest",
+    "NodeReadGaugeLogsResponse",
     "NodeReadHardwareRevisionRequest",
     "NodeReadHardwareRevisionResponse",
     "NodeReadLogsRequest",
@@ -47,3 +61,33 @@ __all__ = [
     "NodeSyncThermometerListRequest",
     "NodeUARTMessage",
 ]
+
+# Submodules are imported on first use so that importing the package stays cheap.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "NodeGaugeStatusRequest": ".node_gauge_status_request",
+        "NodeHeartbeatRequest": ".node_heartbeat_request",
+        "NodeMessageType": ".node_message_type",
+        "NodeProbeStatusRequest": ".node_probe_status_request",
+        "NodeReadFirmwareRevisionRequest": ".node_read_firmware_revision_request",
+        "NodeReadFirmwareRevisionResponse": ".node_read_firmware_revision_response",
+        "NodeReadGaugeLogsRequest": ".node_read_gauge_logs_request",
+        "NodeReadGaugeLogsResponse": ".node_read_gauge_logs_response",
+        "NodeReadHardwareRevisionRequest": ".node_read_hardware_revision_request",
+        "NodeReadHardwareRevisionResponse": ".node_read_hardware_revision_response",
+        "NodeReadLogsRequest": ".node_read_logs_request",
+        "NodeReadLogsResponse": ".node_read_logs_response",
+        "NodeReadModelInfoRequest": ".node_read_model_info_request",
+        "NodeReadModelInfoResponse": ".node_read_model_info_response",
+        "NodeReadSessionInfoRequest": ".node_read_session_info_request",
+        "NodeReadSessionInfoResponse": ".node_read_session_info_response",
+        "NodeRequest": ".node_request",
+        "NodeResponse": ".node_response",
+        "NodeSetPredictionRequest": ".node_set_prediction_request",
+        "NodeSetPredictionResponse": ".node_set_prediction_request",
+        "NodeSyncThermometerListRequest": ".node_sync_thermometer_list_request",
+        "NodeUARTMessage": ".node_uart_message",
+    },
+)
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from ...ble_data.gauge_advertising_data import GAUGE_SERIAL_LENGTH, gauge_serial_from_raw
+from ...ble_data.gauge_status import GaugeStatus
+from ...ble_data.hop_count import HopCount
+from ...uart.meatnet.node_request import NodeRequest
+
+
+class NodeGaugeStatusRequest(NodeRequest):
+    """Gauge Status (0x60), sent by a Node for itself or a Gauge it repeats.
+
+    Payload: serial (10), session ID (4), sample period (2), raw temperature (2),
+    status flags (1), min sequence (4), max sequence (4), network information (1),
+    high alarm status (2), low alarm status (2).
+    """
+
+    PAYLOAD_LENGTH = 32
+
+    def __init__(self, data: Optional[bytes], request_id, payload_length):
+        if not data:
+            return
+        index = NodeRequest.HEADER_LENGTH
+        self.serial_number = gauge_serial_from_raw(data[index : index + GAUGE_SERIAL_LENGTH])
+        index += GAUGE_SERIAL_LENGTH
+
+        self.gauge_status = GaugeStatus.from_fields(
+            session_id=int.from_bytes(data[index : index + 4], "little"),
+            sample_period=int.from_bytes(data[index + 4 : index + 6], "little"),
+            raw_temperature=int.from_bytes(data[index + 6 : index + 8], "little"),
+            flags=data[index + 8],
+            min_sequence_number=int.from_bytes(data[index + 9 : index + 13], "little"),
+            max_sequence_number=int.from_bytes(data[index + 13 : index + 17], "little"),
+            alarm_high_raw=int.from_bytes(data[index + 18 : index + 20], "little"),
+            alarm_low_raw=int.from_bytes(data[index + 20 : index + 22], "little"),
+        )
+        self.hop_count = HopCount.from_network_info_byte(data[index + 17])
+
+        super().__init__(request_id=request_id, payload_length=payload_length)
+
+    @classmethod
+    def from_raw(cls, data, request_id, payload_length):
+        if payload_length < cls.PAYLOAD_LENGTH:
+            return None
+        return cls(data, request_id, payload_length)
@@ -21,3 +21,6 @@ class NodeMessageType(Enum):
     HEARTBEAT = 0x49
     ASSOCIATE_NODE = 0x4A
     SYNC_THERMOMETER_LIST = 0x4B  # TODO: Implement handling for SYNC_THERMOMETER_LIST
+
+    GAUGE_STATUS = 0x60
+    READ_GAUGE_LOGS = 0x62
@@ -19,7 +19,10 @@ class NodeProbeStatusRequest(NodeRequest):
         self.serial_number = struct.unpack("<I", serial_number_raw)[0]
 
         # Parse Probe Status
-        probe_status_raw = data[sequence_byte_index + 4 : sequence_byte_index + 48]
+        # Bounded by the payload so the following frame is never read as food safe data.
+        probe_status_raw = data[
+            sequence_byte_index + 4 : sequence_byte_index + min(48, payload_length)
+        ]
         self.probe_status = ProbeStatus.from_data(probe_status_raw)
 
         # Extracting Hop Count
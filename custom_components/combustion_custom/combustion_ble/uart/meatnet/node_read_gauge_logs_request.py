@@ -0,0 +1,16 @@
+from ...ble_data.gauge_advertising_data import GAUGE_SERIAL_LENGTH
+from ...uart.meatnet.node_message_type import NodeMessageType
+from ...uart.meatnet.node_request import NodeRequest
+
+
+class NodeReadGaugeLogsRequest(NodeRequest):
+    def __init__(self, serial_number: str, min_sequence: int = 0, max_sequence: int = 0):
+        serial = serial_number.encode("ascii")[:GAUGE_SERIAL_LENGTH].ljust(
+            GAUGE_SERIAL_LENGTH, b"\x00"
+        )
+        min = min_sequence.to_bytes(length=4, byteorder="little")
+        max = max_sequence.to_bytes(length=4, byteorder="little")
+
+        super().__init__(
+            outgoing_payload=serial + min + max, message_type=NodeMessageType.READ_GAUGE_LOGS
+        )
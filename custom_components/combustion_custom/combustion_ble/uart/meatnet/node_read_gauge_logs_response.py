@@ -0,0 +1,34 @@
+from ...ble_data.gauge_advertising_data import (
+    GAUGE_SERIAL_LENGTH,
+    SENSOR_PRESENT_FLAG,
+    gauge_serial_from_raw,
+    gauge_temperature_from_raw,
+)
+from ...uart.meatnet.node_response import NodeResponse
+
+
+class NodeReadGaugeLogsResponse(NodeResponse):
+    """One Gauge log record: serial (10), sequence (4), raw temperature (2), status flags (1)."""
+
+    MINIMUM_PAYLOAD_LENGTH = 17
+    HEADER_LENGTH = NodeResponse.HEADER_LENGTH
+    SERIAL_RANGE = slice(HEADER_LENGTH, HEADER_LENGTH + GAUGE_SERIAL_LENGTH)
+    SEQUENCE_RANGE = slice(HEADER_LENGTH + 10, HEADER_LENGTH + 14)
+    TEMPERATURE_RANGE = slice(HEADER_LENGTH + 14, HEADER_LENGTH + 16)
+    FLAGS_INDEX = HEADER_LENGTH + 16
+
+    def __init__(self, data, success, request_id, response_id, payload_length):
+        self.gauge_serial_number = gauge_serial_from_raw(data[self.SERIAL_RANGE])
+        self.sequence_number = int.from_bytes(data[self.SEQUENCE_RANGE], byteorder="little")
+        self.raw_temperature = int.from_bytes(data[self.TEMPERATURE_RANGE], byteorder="little")
+        self.sensor_present = bool(data[self.FLAGS_INDEX] & SENSOR_PRESENT_FLAG)
+        self.temperature_c = gauge_temperature_from_raw(self.raw_temperature, self.sensor_present)
+
+        super().__init__(success, request_id, response_id, payload_length)
+
+    @classmethod
+    def from_raw(cls, data, success, request_id, response_id, payload_length):
+        if payload_length < cls.MINIMUM_PAYLOAD_LENGTH:
+            return None
+
+        return cls(data, success, request_id, response_id, payload_length)
@@ -41,3 +41,8 @@ class NodeRequest:
 
             # Messaeg type, payload length, payload
             self.data.extend(crc_data)
+
+    @property
+    def dedupe_key(self) -> bytes:
+        """Message type + payload length + payload; excludes the CRC and random request ID."""
+        return bytes(self.data[4:5] + self.data[9:])
@@ -1,15 +1,32 @@
+import functools
 import struct
+from typing import Callable
 
 from ...logger import LOGGER
-from ...uart.meatnet.node_heartbeat_request import NodeHeartbeatRequest
 from ...uart.meatnet.node_message_type import NodeMessageType
-from ...uart.meatnet.node_probe_status_request import NodeProbeStatusRequest
 from ...uart.meatnet.node_request import NodeRequest
-from ...uart.meatnet.node_sync_thermometer_list_request import (
-    NodeSyncThermometerListRequest,
-)
 from ...utilities.crc16ccitt import crc16ccitt
 
+RequestParser = Callable[[bytes, int, int], NodeRequest | None]
+
+
+@functools.cache
+def _request_parsers() -> dict[NodeMessageType, RequestParser]:
+    """Decoders by message type, imported the first time a request arrives."""
+    from ...uart.meatnet.node_gauge_status_request import NodeGaugeStatusRequest
+    from ...uart.meatnet.node_heartbeat_request import NodeHeartbeatRequest
+    from ...uart.meatnet.node_probe_status_request import NodeProbeStatusRequest
+    from ...uart.meatnet.node_sync_thermometer_list_request import (
+        NodeSyncThermometerListRequest,
+    )
+
+    return {
+        NodeMessageType.PROBE_STATUS: NodeProbeStatusRequest.from_raw,
+        NodeMessageType.GAUGE_STATUS: NodeGaugeStatusRequest.from_raw,
+        NodeMessageType.HEARTBEAT: NodeHeartbeatRequest.from_raw,
+        NodeMessageType.SYNC_THERMOMETER_LIST: NodeSyncThermometerListRequest.from_raw,
+    }
+
 
 def node_request_from_data(data: bytes) -> NodeRequest | None:
     if data[:2] != b"\xCA\xFE":
@@ -39,12 +56,9 @@ def node_request_from_data(data: bytes) -> NodeRequest | None:
         LOGGER.debug("Invalid CRC. Expected [%s] but found [%s]", calculated_crc, crc)
         return None
 
-    if message_type == NodeMessageType.PROBE_STATUS:
-        return NodeProbeStatusRequest.from_raw(data, request_id, payload_length)
-    elif message_type == NodeMessageType.HEARTBEAT:
-        return NodeHeartbeatRequest.from_raw(data, request_id, payload_length)
-    elif message_type == NodeMessageType.SYNC_THERMOMETER_LIST:
-        return NodeSyncThermometerListRequest.from_raw(data, request_id, payload_length)
+    parser = _request_parsers().get(message_type)
+    if parser is not None:
+        return parser(data, request_id, payload_length)
     elif (
         message_type == NodeMessageType.SESSION_INFO
         or message_type == NodeMessageType.CONNECTED
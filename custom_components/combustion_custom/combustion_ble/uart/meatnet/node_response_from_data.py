@@ -1,26 +1,52 @@
+import functools
 import struct
+from typing import Callable
 
 from ...logger import LOGGER
 from ...uart.meatnet.node_message_type import NodeMessageType
-from ...uart.meatnet.node_read_firmware_revision_response import (
-    NodeReadFirmwareRevisionResponse,
-)
-from ...uart.meatnet.node_read_hardware_revision_response import (
-    NodeReadHardwareRevisionResponse,
-)
-from ...uart.meatnet.node_read_logs_response import NodeReadLogsResponse
-from ...uart.meatnet.node_read_model_info_response import (
-    NodeReadModelInfoResponse,
-)
-from ...uart.meatnet.node_read_session_info_response import (
-    NodeReadSessionInfoResponse,
-)
 from ...uart.meatnet.node_response import NodeResponse
-from ...uart.meatnet.node_set_prediction_request import (
-    NodeSetPredictionResponse,
-)
 from ...utilities.crc16ccitt import crc16ccitt
 
+ResponseParser = Callable[[bytes, bool, int, int, int], NodeResponse | None]
+
+
+@functools.cache
+def _response_parsers() -> dict[NodeMessageType, ResponseParser]:
+    """Decoders by message type, imported the first time a response arrives."""
+    from ...uart.meatnet.node_read_firmware_revision_response import (
+        NodeReadFirmwareRevisionResponse,
+    )
+    from ...uart.meatnet.node_read_gauge_logs_response import NodeReadGaugeLogsResponse
+    from ...uart.meatnet.node_read_hardware_revision_response import (
+        NodeReadHardwareRevisionResponse,
+    )
+    from ...uart.meatnet.node_read_logs_response import NodeReadLogsResponse
+    from ...uart.meatnet.node_read_model_info_response import (
+        NodeReadModelInfoResponse,
+    )
+    from ...uart.meatnet.node_read_session_info_response import (
+        NodeReadSessionInfoResponse,
+    )
+    from ...uart.meatnet.node_set_prediction_request import (
+        NodeSetPredictionResponse,
+    )
+
+    def set_prediction(data, success, request_id, response_id, payload_length):
+        return NodeSetPredictionResponse(success, request_id, response_id, payload_length)
+
+    # TODO: NodeSetIDResponse (commented out in Swift impl)
+    # TODO: NodeSetColorResponse (commented out in Swift impl)
+    # TODO: NodeReadOverTemperatureResponse (commented out in Swift impl)
+    return {
+        NodeMessageType.LOG: NodeReadLogsResponse.from_raw,
+        NodeMessageType.READ_GAUGE_LOGS: NodeReadGaugeLogsResponse.from_raw,
+        NodeMessageType.SESSION_INFO: NodeReadSessionInfoResponse.from_raw,
+        NodeMessageType.SET_PREDICTION: set_prediction,
+        NodeMessageType.PROBE_FIRMWARE_REVISION: NodeReadFirmwareRevisionResponse.from_raw,
+        NodeMessageType.PROBE_HARDWARE_REVISION: NodeReadHardwareRevisionResponse.from_raw,
+        NodeMessageType.PROBE_MODEL_INFORMATION: NodeReadModelInfoResponse.from_raw,
+    }
+
 
 def node_response_from_data(data: bytes):
     # Sync bytes
@@ -69,33 +95,8 @@ def node_response_from_data(data: bytes):
         LOGGER.debug("Bad number of bytes")
         return None
 
-    if message_type == NodeMessageType.LOG:
-        return NodeReadLogsResponse.from_raw(
-            data, success, request_id, response_id, int(payload_length)
-        )
-    # TODO: NodeSetIDResponse (commented out in Swift impl)
-    # TODO: NodeSetColorResponse (commented out in Swift impl)
-    elif message_type == NodeMessageType.SESSION_INFO:
-        return NodeReadSessionInfoResponse.from_raw(
-            data, success, request_id, response_id, int(payload_length)
-        )
-    elif message_type == NodeMessageType.SET_PREDICTION:
-        return NodeSetPredictionResponse(success, request_id, response_id, int(payload_length))
-    elif message_type == NodeMessageType.PROBE_FIRMWARE_REVISION:
-        return NodeReadFirmwareRevisionResponse.from_raw(
-            data, success, request_id, response_id, int(payload_length)
-        )
-    elif message_type == NodeMessageType.PROBE_HARDWARE_REVISION:
-        return NodeReadHardwareRevisionResponse.from_raw(
-            data, success, request_id, response_id, int(payload_length)
-        )
-    elif message_type == NodeMessageType.PROBE_MODEL_INFORMATION:
-        return NodeReadModelInfoResponse.from_raw(
-            data, success, request_id, response_id, int(payload_length)
-        )
-    # TODO: NodeReadOverTemperatureResponse (commented out in Swift impl)
-    else:
-        #LOGGER.debug("Unhandled node response type: [%s]", message_type)
-        pass
+    parser = _response_parsers().get(message_type)
+    if parser is not None:
+        return parser(data, success, request_id, response_id, int(payload_length))
 
     return NodeResponse(success, request_id, response_id, payload_length)
@@ -28,3 +28,8 @@ class Request:
 
         # Append message type, payload length, and payload
         self.data.extend(crc_data)
+
+    @property
+    def dedupe_key(self) -> bytes:
+        """Identical requests encode to identical bytes, so the frame itself is the key."""
+        return bytes(self.data)
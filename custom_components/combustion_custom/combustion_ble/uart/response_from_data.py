@@ -1,18 +1,37 @@
-from typing import Optional
+import functools
+from typing import Callable, Optional
 
 from ..logger import LOGGER
-from .log_response import LogResponse
 from .message_type import MessageType
-from .read_over_temperature import ReadOverTemperatureResponse
 from .response import Response
-from .session_info import SessionInfoResponse
-from .set_color import SetColorResponse
-from .set_id import SetIDResponse
-from .set_prediction import SetPredictionResponse
 from ..utilities.crc16ccitt import crc16ccitt
 
 HEADER_LENGTH = 7
 
+ResponseParser = Callable[[bytes, bool, int], Optional[Response]]
+
+
+@functools.cache
+def _response_parsers() -> dict[int, ResponseParser]:
+    """Decoders by message type, imported the first time a response arrives."""
+    from .log_response import LogResponse
+    from .read_over_temperature import ReadOverTemperatureResponse
+    from .session_info import SessionInfoResponse
+    from .set_color import SetColorResponse
+    from .set_id import SetIDResponse
+    from .set_prediction import SetPredictionResponse
+
+    return {
+        MessageType.LOG: LogResponse.from_raw,
+        MessageType.SET_ID: lambda data, success, length: SetIDResponse(success, length),
+        MessageType.SET_COLOR: lambda data, success, length: SetColorResponse(success, length),
+        MessageType.SESSION_INFO: SessionInfoResponse.from_raw,
+        MessageType.SET_PREDICTION: (
+            lambda data, success, length: SetPredictionResponse(success, length)
+        ),
+        MessageType.READ_OVER_TEMPERATURE: ReadOverTemperatureResponse,
+    }
+
 
 def responses_from_data(data) -> list[Response]:
     responses = []
@@ -63,19 +82,9 @@ def response_from_data(data) -> Optional[Response]:
         return None
 
     # Process based on message_type
-    if message_type == MessageType.LOG:
-        return LogResponse.from_raw(data, success, int(payload_length))
-    elif message_type == MessageType.SET_ID:
-        return SetIDResponse(success, int(payload_length))
-    elif message_type == MessageType.SET_COLOR:
-        return SetColorResponse(success, int(payload_length))
-    elif message_type == MessageType.SESSION_INFO:
-        return SessionInfoResponse.from_raw(data, success, int(payload_length))
-    elif message_type == MessageType.SET_PREDICTION:
-        return SetPredictionResponse(success, int(payload_length))
-    elif message_type == MessageType.READ_OVER_TEMPERATURE:
-        return ReadOverTemperatureResponse(data, success, int(payload_length))
-    else:
-        LOGGER.debug("Ignoring response of type", message_type)
+    parser = _response_parsers().get(message_type)
+    if parser is not None:
+        return parser(data, success, int(payload_length))
+    LOGGER.debug("Ignoring response of type %s", message_type)
 
     return None
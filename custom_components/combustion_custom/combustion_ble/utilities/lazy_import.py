@@ -0,0 +1,27 @@
+"""Package re-exports that import their module on first access (PEP 562)."""
+
+import importlib
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, namespace: dict[str, Any], exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """`__getattr__` and `__dir__` for a package re-exporting `exports` (name -> submodule).
+
+    The submodule is imported the first time one of its names is looked up, and the value is
+    cached in the package's `namespace` (its globals) so later lookups are plain reads.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,164 @@
+"""Serialized, coalescing UART write queue for a single BLE link."""
+
+import asyncio
+from collections import deque
+import time
+from typing import Optional
+
+from bleak import BleakClient, BleakError, BleakGATTCharacteristic
+
+from .logger import LOGGER
+
+# ATT_MTU minus the 3-byte ATT header for a Write Command.
+ATT_HEADER_SIZE = 3
+DEFAULT_ATT_MTU = 23
+
+
+class _PendingWrite:
+    __slots__ = ("data", "key", "queued_at")
+
+    def __init__(self, data: bytes, key: Optional[bytes], queued_at: float) -> None:
+        self.data = data
+        self.key = key
+        self.queued_at = queued_at
+
+
+class LinkWriteQueue:
+    """Write queue for the UART RX characteristic of one connection.
+
+    Requests are written one at a time, in order. Consecutive small frames are packed into a
+    single Write Command up to the negotiated MTU (the peer parses the UART stream frame by
+    frame, as we do for notifications). A request identical to one still waiting in the queue is
+    dropped instead of being sent twice.
+    """
+
+    COALESCE_WRITES = True
+    MAX_DEPTH = 256
+    LATENCY_ALPHA = 0.2
+
+    def __init__(self, identifier: str, client: BleakClient, characteristic: BleakGATTCharacteristic):
+        self.identifier = identifier
+        self.client = client
+        self.characteristic = characteristic
+        self._pending: deque[_PendingWrite] = deque()
+        self._pending_keys: set[bytes] = set()
+        self._drain_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.frames_queued = 0
+        self.frames_sent = 0
+        self.writes = 0
+        self.bytes_sent = 0
+        self.duplicates_dropped = 0
+        self.overflow_dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.last_write_latency_ms = 0.0
+        self.avg_write_latency_ms = 0.0
+        self.max_write_latency_ms = 0.0
+        self.avg_queue_wait_ms = 0.0
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    @property
+    def max_write_size(self) -> int:
+        mtu = getattr(self.client, "mtu_size", None) or DEFAULT_ATT_MTU
+        return max(DEFAULT_ATT_MTU, mtu) - ATT_HEADER_SIZE
+
+    def enqueue(self, data: bytes, key: Optional[bytes] = None) -> bool:
+        """Queue a frame. Returns False if it was dropped as a duplicate or on overflow."""
+        if self._closed:
+            return False
+        if key is not None and key in self._pending_keys:
+            self.duplicates_dropped += 1
+            return False
+        if len(self._pending) >= self.MAX_DEPTH:
+            self.overflow_dropped += 1
+            LOGGER.debug("Write queue for [%s] is full; dropping frame", self.identifier)
+            return False
+
+        self._pending.append(_PendingWrite(bytes(data), key, time.monotonic()))
+        if key is not None:
+            self._pending_keys.add(key)
+        self.frames_queued += 1
+        self.max_depth = max(self.max_depth, len(self._pending))
+
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(
+                self._drain(), name=f"write_queue[{self.identifier}]"
+            )
+        return True
+
+    def close(self) -> None:
+        self._closed = True
+        self._pending.clear()
+        self._pending_keys.clear()
+        if self._drain_task and not self._drain_task.done():
+            self._drain_task.cancel()
+        self._drain_task = None
+
+    def _next_batch(self) -> tuple[bytes, int]:
+        first = self._pop()
+        if not self.COALESCE_WRITES:
+            return first, 1
+
+        limit = self.max_write_size
+        batch = bytearray(first)
+        frames = 1
+        while self._pending and len(batch) + len(self._pending[0].data) <= limit:
+            batch += self._pop()
+            frames += 1
+        return bytes(batch), frames
+
+    def _pop(self) -> bytes:
+        item = self._pending.popleft()
+        if item.key is not None:
+            self._pending_keys.discard(item.key)
+        wait_ms = (time.monotonic() - item.queued_at) * 1000.0
+        self.avg_queue_wait_ms += self.LATENCY_ALPHA * (wait_ms - self.avg_queue_wait_ms)
+        return item.data
+
+    async def _drain(self) -> None:
+        while self._pending and not self._closed:
+            payload, frames = self._next_batch()
+            if not self.client.is_connected:
+                self.errors += 1
+                continue
+
+            started = time.monotonic()
+            try:
+                await self.client.write_gatt_char(self.characteristic, payload, response=False)
+            except (BleakError, TimeoutError, EOFError) as ex:
+                # A failed write must not end the drain; later frames still go out.
+                self.errors += 1
+                LOGGER.error("Error sending request to [%s]: %s", self.identifier, ex)
+                continue
+
+            latency_ms = (time.monotonic() - started) * 1000.0
+            self.writes += 1
+            self.frames_sent += frames
+            self.bytes_sent += len(payload)
+            self.last_write_latency_ms = latency_ms
+            self.max_write_latency_ms = max(self.max_write_latency_ms, latency_ms)
+            self.avg_write_latency_ms += self.LATENCY_ALPHA * (
+                latency_ms - self.avg_write_latency_ms
+            )
+
+    def stats(self) -> dict[str, float | int]:
+        return {
+            "depth": len(self._pending),
+            "max_depth": self.max_depth,
+            "frames_queued": self.frames_queued,
+            "frames_sent": self.frames_sent,
+            "writes": self.writes,
+            "bytes_sent": self.bytes_sent,
+            "duplicates_dropped": self.duplicates_dropped,
+            "overflow_dropped": self.overflow_dropped,
+            "errors": self.errors,
+            "last_write_latency_ms": round(self.last_write_latency_ms, 2),
+            "avg_write_latency_ms": round(self.avg_write_latency_ms, 2),
+            "max_write_latency_ms": round(self.max_write_latency_ms, 2),
+            "avg_queue_wait_ms": round(self.avg_queue_wait_ms, 2),
+        }
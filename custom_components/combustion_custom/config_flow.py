@@ -7,12 +7,35 @@ from homeassistant import config_entries, core
 import voluptuous as vol
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, CONF_TIMEOUT, TempUnit
+from .const import (
+    DOMAIN,
+    CONF_TIMEOUT,
+    CONF_MAX_CONNECTIONS,
+    CONF_ADVERTISEMENT_BATCH_MS,
+    CONF_LOCAL_PREDICTION_TARGET,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_ADVERTISEMENT_BATCH_MS,
+    DEFAULT_LOCAL_PREDICTION_TARGET,
+    TempUnit,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-CONFIG_SCHEMA = vol.Schema({vol.Required("unit_type", default=TempUnit.CELSIUS): vol.In(TempUnit)})
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Required("unit_type", default=TempUnit.CELSIUS): vol.In(TempUnit),
+        vol.Optional(CONF_MAX_CONNECTIONS, default=DEFAULT_MAX_CONNECTIONS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10)
+        ),
+        vol.Optional(
+            CONF_ADVERTISEMENT_BATCH_MS, default=DEFAULT_ADVERTISEMENT_BATCH_MS
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=250)),
+        vol.Optional(
+            CONF_LOCAL_PREDICTION_TARGET, default=DEFAULT_LOCAL_PREDICTION_TARGET
+        ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+    }
+)
 
 class CombustionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
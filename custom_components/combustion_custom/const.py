@@ -5,7 +5,20 @@ DOMAIN = "combustion"
 EVENT_DISCOVERED = DOMAIN + ".discovered"
 EVENT_REFRESH = DOMAIN + ".refresh"
 
+SERVICE_PROFILE = "profile"
+SERVICE_HISTORY = "history"
+SERVICE_EXPORT = "export"
+
 CONF_TIMEOUT = "timeout"
+CONF_MAX_CONNECTIONS = "max_connections"
+CONF_ADVERTISEMENT_BATCH_MS = "advertisement_batch_ms"
+CONF_LOCAL_PREDICTION_TARGET = "local_prediction_target"
+
+DEFAULT_MAX_CONNECTIONS = 3
+# 0 processes every advertisement as it arrives.
+DEFAULT_ADVERTISEMENT_BATCH_MS = 0
+# Core target (C) for host-side cook-time estimates; 0 leaves them off.
+DEFAULT_LOCAL_PREDICTION_TARGET = 0
 
 
 class TempUnit(Enum):
@@ -0,0 +1,19 @@
+"""Diagnostics support for the Combustion Inc integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant import config_entries, core
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: core.HomeAssistant, config_entry: config_entries.ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    mgr = hass.data[DOMAIN]["mgr"]
+    return {
+        "config": dict(config_entry.data),
+        **mgr.diagnostics(),
+    }
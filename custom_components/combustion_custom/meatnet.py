@@ -1,57 +1,74 @@
-import threading
-import time
-from bleak import BleakScanner
-from .combustion_ble.ble_manager import BluetoothMode
+from typing import Callable, Optional
+from bleak.backends.device import BLEDevice
+from .combustion_ble.ble_manager import BleManager, BluetoothMode
+from .combustion_ble.const import BT_MANUFACTURER_ID
 from .combustion_ble.device_manager import DeviceManager
 from .combustion_ble.devices.device import Device
+from .combustion_ble.metrics import Metrics
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import dispatcher_send
+from homeassistant.components import bluetooth
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 
-from .const import EVENT_DISCOVERED
+from .const import (
+    CONF_ADVERTISEMENT_BATCH_MS,
+    CONF_LOCAL_PREDICTION_TARGET,
+    CONF_MAX_CONNECTIONS,
+    DEFAULT_ADVERTISEMENT_BATCH_MS,
+    DEFAULT_LOCAL_PREDICTION_TARGET,
+    DEFAULT_MAX_CONNECTIONS,
+    DOMAIN,
+    EVENT_DISCOVERED,
+)
+
+DEVICE_INFO_STORAGE_VERSION = 1
+DEVICE_INFO_STORAGE_KEY = f"{DOMAIN}.device_info"
+DEVICE_INFO_SAVE_DELAY = 30
 
 
 class MeatNetManager:
 
     hass: HomeAssistant
-    devices: dict[str, Device] = {}
-    thread: threading.Thread
-    running: False
+    devices: dict[str, Device]
     deviceManager: DeviceManager
-    scanner: BleakScanner
 
-    # Track when a BLE address transitions from generic node -> gauge
-    _device_kind: dict[str, str]
+    _remove_device_listener: Optional[Callable[[], None]]
+    _cancel_bluetooth_callback: Optional[Callable[[], None]]
 
-    def __init__(self, hass: HomeAssistant):
+    def __init__(self, hass: HomeAssistant, config: Optional[dict] = None):
         self.hass = hass
-        self._device_kind = {}
-
-    def worker(self):
-
-        while self.running:
-            time.sleep(0.5)
-
-            devices = self.deviceManager.get_devices()
-            for device in devices:
-                id = device.unique_identifier
-                try:
-                    is_gauge = bool(getattr(device, "gauge_serial", None))
-                    kind = "gauge" if is_gauge else "device"
-
-                    if self.devices.get(id) is None:
-                        dispatcher_send(self.hass, EVENT_DISCOVERED, device)
-                        self.devices[id] = device
-                        self._device_kind[id] = kind
-                        continue
-
-                    # If a MeatNet node later reveals itself to be a Gauge, re-dispatch so
-                    # the HA platform can add Gauge-only entities.
-                    if self._device_kind.get(id) != "gauge" and kind == "gauge":
-                        dispatcher_send(self.hass, EVENT_DISCOVERED, device)
-                        self._device_kind[id] = "gauge"
-                except Exception:
-                    pass
+        self.config = config or {}
+        self.devices = {}
+        self._remove_device_listener = None
+        self._cancel_bluetooth_callback = None
+        self._device_info_store: Store = Store(
+            hass, DEVICE_INFO_STORAGE_VERSION, DEVICE_INFO_STORAGE_KEY
+        )
+
+    @callback
+    def _async_devices_changed(self, added: list[Device], removed: list[Device]) -> None:
+        """DeviceManager listener; runs on the event loop from the BLE detection callback."""
+        for device in added:
+            if device.unique_identifier in self.devices:
+                continue
+            self.devices[device.unique_identifier] = device
+            async_dispatcher_send(self.hass, EVENT_DISCOVERED, device)
+
+        for device in removed:
+            self.devices.pop(device.unique_identifier, None)
+
+    @callback
+    def _async_device_kind_changed(self, device: Device) -> None:
+        # If a MeatNet node later reveals itself to be a Gauge, re-dispatch so
+        # the HA platform can add Gauge-only entities.
+        if device.unique_identifier in self.devices:
+            async_dispatcher_send(self.hass, EVENT_DISCOVERED, device)
+
+    @callback
+    def _async_resolve_ble_device(self, address: str) -> Optional[BLEDevice]:
+        """Let HA pick the best connectable path (local adapter or remote proxy) for a connection."""
+        return bluetooth.async_ble_device_from_address(self.hass, address, connectable=True)
 
     async def async_start(self) -> None:
 
@@ -61,23 +78,83 @@ class MeatNetManager:
             self.deviceManager = DeviceManager()
 
         self.deviceManager.enable_meatnet()
-        detection_callback = await self.deviceManager.init_bluetooth(mode=BluetoothMode.PASSIVE)
+        self.deviceManager.set_max_connections(
+            int(self.config.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS))
+        )
+        self.deviceManager.set_local_prediction_target(
+            float(self.config.get(CONF_LOCAL_PREDICTION_TARGET, DEFAULT_LOCAL_PREDICTION_TARGET))
+        )
+        self._remove_device_listener = self.deviceManager.add_device_listener(
+            self._async_devices_changed, self._async_device_kind_changed
+        )
+        # A shared DeviceManager survives config entry reloads; announce what it already knows.
+        self._async_devices_changed(self.deviceManager.get_devices(), [])
 
-        self.scanner = BleakScanner(detection_callback=detection_callback)
-        await self.scanner.start()
-
-        self.thread = threading.Thread(target=self.worker)
-        self.running = True
-        self.thread.start()
+        detection_callback = await self.deviceManager.init_bluetooth(mode=BluetoothMode.PASSIVE)
+        batch_ms = int(self.config.get(CONF_ADVERTISEMENT_BATCH_MS, DEFAULT_ADVERTISEMENT_BATCH_MS))
+        self.deviceManager.set_advertisement_batching(batch_ms / 1000.0)
+        BleManager.shared.ble_device_resolver = self._async_resolve_ble_device
+
+        # Device Information survives restarts so known devices skip the DIS reads on connect.
+        device_info_cache = BleManager.shared.device_info_cache
+        device_info_cache.load(await self._device_info_store.async_load() or {})
+        device_info_cache.on_change = lambda: self._device_info_store.async_delay_save(
+            device_info_cache.as_dict, DEVICE_INFO_SAVE_DELAY
+        )
+
+        @callback
+        def _async_advertisement(
+            service_info: bluetooth.BluetoothServiceInfoBleak, change: bluetooth.BluetoothChange
+        ) -> None:
+            detection_callback(
+                service_info.device,
+                service_info.advertisement,
+                service_info.connectable,
+                service_info.source,
+            )
+
+        # Advertisements come from HA's shared scanners (local adapters and remote proxies),
+        # already filtered to our manufacturer id upstream.
+        self._cancel_bluetooth_callback = bluetooth.async_register_callback(
+            self.hass,
+            _async_advertisement,
+            bluetooth.BluetoothCallbackMatcher(
+                manufacturer_id=BT_MANUFACTURER_ID, connectable=False
+            ),
+            bluetooth.BluetoothScanningMode.PASSIVE,
+        )
+
+    def diagnostics(self) -> dict:
+        """Pipeline metrics and connection state for the diagnostics download."""
+        ble_manager = BleManager.shared
+        device_info_cache = ble_manager.device_info_cache
+        return {
+            "metrics": Metrics.shared.snapshot(),
+            "connection_pool": ble_manager.connection_pool.stats(),
+            "links": ble_manager.link_stats(),
+            "adapters": ble_manager.adapters.stats(),
+            "connect_health": self.deviceManager.connection_manager.connection_diagnostics(),
+            "device_info_cache": {
+                "hits": device_info_cache.hits,
+                "misses": device_info_cache.misses,
+            },
+            "devices": len(self.devices),
+        }
 
     async def async_stop(self) -> None:
 
         try:
-            self.running = False
+            if self._cancel_bluetooth_callback:
+                self._cancel_bluetooth_callback()
+                self._cancel_bluetooth_callback = None
+            if self._remove_device_listener:
+                self._remove_device_listener()
+                self._remove_device_listener = None
+            BleManager.shared.ble_device_resolver = None
+            device_info_cache = BleManager.shared.device_info_cache
+            device_info_cache.on_change = None
+            await self._device_info_store.async_save(device_info_cache.as_dict())
             await self.deviceManager.async_stop()
-            await self.scanner.stop()
-            self.thread.join(2)
             self.devices.clear()
-            self._device_kind.clear()
         except:
             pass
@@ -0,0 +1,127 @@
+"""Time-bounded CPU profiling of the integration's code paths."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from datetime import datetime
+import json
+import os
+import pstats
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+INTEGRATION_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Path fragments (relative to the integration directory) -> subsystem. First match wins.
+SUBSYSTEMS = (
+    ("combustion_ble/ble_manager.py", "radio"),
+    ("combustion_ble/link_session.py", "radio"),
+    ("combustion_ble/write_queue.py", "radio"),
+    ("combustion_ble/connection_", "connections"),
+    ("combustion_ble/connect_health.py", "connections"),
+    ("combustion_ble/ble_data/", "decode"),
+    ("combustion_ble/uart/", "uart"),
+    ("combustion_ble/utilities/crc16ccitt.py", "uart"),
+    ("combustion_ble/prediction/", "prediction"),
+    ("combustion_ble/devices/", "devices"),
+    ("combustion_ble/probe_temperature_log.py", "devices"),
+    ("combustion_ble/", "device_manager"),
+    ("sensor.py", "entities"),
+)
+
+TOP_FUNCTIONS = 50
+
+
+def subsystem_for(filename: str) -> str:
+    relative = os.path.relpath(filename, INTEGRATION_DIR).replace(os.sep, "/")
+    for fragment, subsystem in SUBSYSTEMS:
+        if relative.startswith(fragment):
+            return subsystem
+    return "integration"
+
+
+class PipelineProfiler:
+    """Runs cProfile on the event loop thread for a fixed window.
+
+    Nothing is installed until `async_profile` is called, so there is no overhead while idle.
+    The profiler sees the whole loop thread; the report keeps only functions defined in this
+    integration, with per-function and per-subsystem self/cumulative time.
+    """
+
+    MAX_DURATION_SECONDS = 600
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def async_profile(self, duration: float) -> dict[str, Any]:
+        if self._running:
+            raise RuntimeError("A profiling run is already in progress")
+        duration = max(1.0, min(float(duration), self.MAX_DURATION_SECONDS))
+
+        profile = cProfile.Profile()
+        # Raises ValueError (Python 3.12+) when another profiler is already active.
+        profile.enable()
+        self._running = True
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profile.disable()
+            self._running = False
+
+        report = self.build_report(pstats.Stats(profile), duration)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = self.hass.config.path(f"combustion_profile_{stamp}")
+        report["files"] = {"report": f"{base}.json", "pstats": f"{base}.prof"}
+        await self.hass.async_add_executor_job(self._write, profile, report, base)
+        return report
+
+    @staticmethod
+    def build_report(stats: pstats.Stats, duration: float) -> dict[str, Any]:
+        functions = []
+        subsystems: dict[str, dict[str, float | int]] = {}
+        for (filename, lineno, funcname), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            if not filename.startswith(INTEGRATION_DIR):
+                continue
+            subsystem = subsystem_for(filename)
+            totals = subsystems.setdefault(subsystem, {"calls": 0, "self_seconds": 0.0})
+            totals["calls"] += ncalls
+            totals["self_seconds"] += tottime
+            functions.append(
+                {
+                    "function": f"{os.path.relpath(filename, INTEGRATION_DIR)}:{lineno}({funcname})",
+                    "subsystem": subsystem,
+                    "calls": ncalls,
+                    "self_seconds": round(tottime, 6),
+                    "cumulative_seconds": round(cumtime, 6),
+                }
+            )
+
+        functions.sort(key=lambda row: row["self_seconds"], reverse=True)
+        total_self = sum(totals["self_seconds"] for totals in subsystems.values())
+        return {
+            "duration_seconds": duration,
+            "integration_self_seconds": round(total_self, 6),
+            "loop_share": round(total_self / duration, 4),
+            "subsystems": {
+                name: {
+                    "calls": totals["calls"],
+                    "self_seconds": round(totals["self_seconds"], 6),
+                }
+                for name, totals in sorted(
+                    subsystems.items(), key=lambda item: item[1]["self_seconds"], reverse=True
+                )
+            },
+            "functions": functions[:TOP_FUNCTIONS],
+        }
+
+    @staticmethod
+    def _write(profile: cProfile.Profile, report: dict[str, Any], base: str) -> None:
+        profile.dump_stats(f"{base}.prof")
+        with open(f"{base}.json", "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
@@ -0,0 +1,80 @@
+"""Write logged probe history to Home Assistant long-term statistics."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from homeassistant.core import HomeAssistant
+
+from .combustion_ble.long_term_statistics import hourly_statistics
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .combustion_ble.devices.probe import Probe
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def statistic_id(probe: Probe) -> str:
+    return f"{DOMAIN}:probe_{probe.serial_number_string.lower()}_core_temperature"
+
+
+class StatisticsImporter:
+    """Imports hourly core temperature statistics for every probe's current session.
+
+    Each run takes the records added to a session log since the previous run (live and
+    backfilled alike), aggregates the finished hours they touch from the log's history
+    pyramid and hands them to the recorder in one external statistics import per probe.
+    Re-importing an hour replaces it, so hours filled in by a later backfill are corrected.
+    """
+
+    INTERVAL = timedelta(minutes=5)
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+
+    async def async_run(self, now: Optional[datetime] = None) -> None:
+        mgr = self.hass.data.get(DOMAIN, {}).get("mgr")
+        if mgr is None or "recorder" not in self.hass.config.components:
+            return
+        # The recorder is optional; only import it once it is known to be loaded.
+        from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+        from homeassistant.const import UnitOfTemperature
+
+        for probe in mgr.deviceManager.get_probes():
+            log = probe.temperature_log
+            if log is None or (pending := log.take_statistics_pending()) is None:
+                continue
+            statistics, unfinished = hourly_statistics(log, *pending)
+            if unfinished is not None:
+                log.mark_statistics_pending(unfinished, pending[1])
+            if not statistics:
+                continue
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"Probe {probe.serial_number_string} core temperature",
+                source=DOMAIN,
+                statistic_id=statistic_id(probe),
+                unit_of_measurement=UnitOfTemperature.CELSIUS,
+            )
+            async_add_external_statistics(
+                self.hass,
+                metadata,
+                [
+                    StatisticData(
+                        start=statistic.start,
+                        mean=statistic.mean,
+                        min=statistic.minimum,
+                        max=statistic.maximum,
+                    )
+                    for statistic in statistics
+                ],
+            )
+            _LOGGER.debug(
+                "Imported %d hours of statistics for probe %s",
+                len(statistics),
+                probe.serial_number_string,
+            )
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import Optional
+from typing import Any, Callable, Optional
 import logging
 from datetime import datetime
 
 from .combustion_ble.devices.device import Device
 from .combustion_ble.devices.probe import Probe
 from .combustion_ble.devices.meat_net_node import MeatNetNode
+from .combustion_ble.metrics import DECODE_ADVERTISING, Metrics
 from homeassistant import config_entries, core
 from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity import Entity, EntityCategory
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from .const import DOMAIN, EVENT_DISCOVERED, TempUnit, EVENT_REFRESH
 
@@ -44,6 +45,11 @@ SENSOR_TYPES = {
     "prediction_through": ["Prediction % Done", "%", "", "prediction_through"],
     "prediction_value": ["Prediction Remaining", "s", "duration", "prediction_value"],
     "prediction_core": ["Prediction Core Temp", "temp", "temperature", "prediction_core"],
+    "local_prediction_value": ["Estimated Remaining", "s", "duration", "local_prediction_value"],
+    "local_prediction_confidence": ["Estimated Remaining Confidence", "%", "", "local_prediction_confidence"],
+    "food_safe_state": ["Food Safe State", None, SensorDeviceClass.ENUM, "food_safe_state", ["NOT_SAFE", "SAFE", "SAFETY_IMPOSSIBLE"]],
+    "food_safe_log_reduction": ["Food Safe Log Reduction", None, "", "food_safe_log_reduction"],
+    "food_safe_seconds_above": ["Food Safe Time Above Threshold", "s", "duration", "food_safe_seconds_above"],
 
     "hop_count": ["Hop Count", "hops", "", "hop_count"],
 
@@ -95,6 +101,34 @@ NODE_SENSOR_TYPES = {
 }
 
 
+# Pipeline metrics, one set per integration. [ name, unit_of_measurement, state_class, state_id ]
+METRIC_SENSOR_TYPES = {
+    "metric_adverts_rate": ["Advertisements Rate", "1/s", "measurement", "adverts_per_second"],
+    "metric_advert_decode": ["Advertisement Decode Time", "µs", "measurement", "advert_decode_us"],
+    "metric_uart_bytes": ["UART Bytes Received", "B", "total_increasing", "uart_bytes"],
+    "metric_uart_frames": ["UART Frames Received", None, "total_increasing", "uart_frames"],
+    "metric_crc_failures": ["UART CRC Failures", None, "total_increasing", "crc_failures"],
+    "metric_partial_frames": ["UART Partial Frames", None, "total_increasing", "partial_frames"],
+    "metric_dropped_frames": ["UART Dropped Frames", None, "total_increasing", "dropped_frames"],
+    "metric_connect_attempts": ["Connection Attempts", None, "total_increasing", "connect_attempts"],
+    "metric_connect_failures": ["Connection Failures", None, "total_increasing", "connect_failures"],
+    "metric_request_rtt": ["Request Round Trip", "ms", "measurement", "request_rtt_ms"],
+}
+
+METRIC_STATE_GETTERS: dict[str, Callable[[Metrics], Any]] = {
+    "adverts_per_second": lambda metrics: round(metrics.advertisements.rate(), 2),
+    "advert_decode_us": lambda metrics: round(metrics.decode_time[DECODE_ADVERTISING].mean, 1),
+    "uart_bytes": lambda metrics: metrics.uart_bytes.value,
+    "uart_frames": lambda metrics: metrics.uart_frames.value,
+    "crc_failures": lambda metrics: metrics.crc_failures.value,
+    "partial_frames": lambda metrics: metrics.partial_frames.value,
+    "dropped_frames": lambda metrics: metrics.dropped_frames.value,
+    "connect_attempts": lambda metrics: metrics.connection_attempts.value,
+    "connect_failures": lambda metrics: metrics.connection_failures.value,
+    "request_rtt_ms": lambda metrics: round(metrics.request_rtt.mean, 1),
+}
+
+
 def _decode_gauge_alarm_status_to_temperature_c(alarm_status: int | None) -> float | None:
     """Decode the Gauge 'Alarm Status' packed 16-bit field to a threshold temperature in °C.
 
@@ -168,14 +202,184 @@ def format_device_id(device: Device):
     return device_name
 
 
-def convert_temp(temp: float, unit: TempUnit) -> float:
-    if (temp is None):
-        return None
-    if unit == TempUnit.FAHRENHEIT:
-        return (temp * 9 / 5) + 32
+TempConverter = Callable[[Optional[float]], Optional[float]]
+StateGetter = Callable[[Device], Any]
+
+
+def _celsius(temp: float | None) -> float | None:
     return temp
 
 
+def _fahrenheit(temp: float | None) -> float | None:
+    if temp is None:
+        return None
+    return (temp * 9 / 5) + 32
+
+
+def temp_converter(unit: TempUnit) -> TempConverter:
+    """Return the conversion function for a unit, so it is only resolved once per entity."""
+    return _fahrenheit if unit == TempUnit.FAHRENHEIT else _celsius
+
+
+def convert_temp(temp: float, unit: TempUnit) -> float:
+    return temp_converter(unit)(temp)
+
+
+def _probe_thermistor(index: int, convert: TempConverter) -> StateGetter:
+    def getter(device: Probe):
+        temperatures = device.current_temperatures
+        return convert(temperatures.values[index]) if temperatures else None
+
+    return getter
+
+
+def _probe_virtual(field: str, convert: TempConverter) -> StateGetter:
+    def getter(device: Probe):
+        return convert(getattr(device._virtual_temperatures.value, field))
+
+    return getter
+
+
+def _probe_prediction(field: str, convert: TempConverter | None = None) -> StateGetter:
+    def getter(device: Probe):
+        info = device.prediction_info
+        if not info:
+            return None
+        value = getattr(info, field)
+        return convert(value) if convert else value
+
+    return getter
+
+
+def _probe_local_prediction(device: Probe):
+    prediction = device.local_prediction
+    return prediction.seconds_remaining if prediction else None
+
+
+def _probe_local_confidence(device: Probe):
+    prediction = device.local_prediction
+    return round(prediction.confidence * 100) if prediction else None
+
+
+def _probe_food_safe(field: str) -> StateGetter:
+    def getter(device: Probe):
+        status = device.food_safe_status
+        return getattr(status, field) if status else None
+
+    return getter
+
+
+def _probe_food_safe_state(device: Probe):
+    status = device.food_safe_status
+    return status.state.name if status else None
+
+
+def _probe_food_safe_log_reduction(device: Probe):
+    status = device.food_safe_status
+    return round(status.log_reduction, 2) if status else None
+
+
+def _probe_prediction_enum(field: str) -> StateGetter:
+    def getter(device: Probe):
+        info = device.prediction_info
+        return getattr(info, field).name if info else None
+
+    return getter
+
+
+# state_id -> factory(converter) -> getter(device)
+PROBE_STATE_GETTERS: dict[str, Callable[[TempConverter], StateGetter]] = {
+    **{
+        f"t{i + 1}": (lambda convert, i=i: _probe_thermistor(i, convert))
+        for i in range(8)
+    },
+    "instant": lambda convert: lambda device: convert(device._instant_read_celsius),
+    "core": lambda convert: _probe_virtual("core_temperature", convert),
+    "ambient": lambda convert: _probe_virtual("ambient_temperature", convert),
+    "surface": lambda convert: _probe_virtual("surface_temperature", convert),
+    "rssi": lambda convert: lambda device: device.rssi,
+    "battery": lambda convert: lambda device: device.batery_status.name,
+    "prediction_mode": lambda convert: _probe_prediction_enum("prediction_mode"),
+    "prediction_state": lambda convert: _probe_prediction_enum("prediction_state"),
+    "prediction_type": lambda convert: _probe_prediction_enum("prediction_type"),
+    "prediction_setpoint": lambda convert: _probe_prediction("prediction_set_point_temperature", convert),
+    "prediction_through": lambda convert: _probe_prediction("percent_through_cook"),
+    "prediction_value": lambda convert: _probe_prediction("seconds_remaining"),
+    "prediction_core": lambda convert: _probe_prediction("estimated_core_temperature", convert),
+    "local_prediction_value": lambda convert: _probe_local_prediction,
+    "local_prediction_confidence": lambda convert: _probe_local_confidence,
+    "food_safe_state": lambda convert: _probe_food_safe_state,
+    "food_safe_log_reduction": lambda convert: _probe_food_safe_log_reduction,
+    "food_safe_seconds_above": lambda convert: _probe_food_safe("seconds_above_threshold"),
+    # 0 = direct, 1..4 = via MeatNet hops
+    "hop_count": lambda convert: lambda device: getattr(device, "_hops", None),
+}
+
+
+def _node_flag(attr: str, when_true: str, when_false: str) -> StateGetter:
+    def getter(device: MeatNetNode):
+        value = getattr(device, attr, None)
+        return None if value is None else (when_true if value else when_false)
+
+    return getter
+
+
+def _node_alarm_state(attr: str) -> StateGetter:
+    def getter(device: MeatNetNode):
+        return _decode_gauge_alarm_status_to_state(getattr(device, attr, None))
+
+    return getter
+
+
+def _node_alarm_temp(attr: str, convert: TempConverter) -> StateGetter:
+    def getter(device: MeatNetNode):
+        return convert(_decode_gauge_alarm_status_to_temperature_c(getattr(device, attr, None)))
+
+    return getter
+
+
+NODE_STATE_GETTERS: dict[str, Callable[[TempConverter], StateGetter]] = {
+    "rssi": lambda convert: lambda device: device.rssi,
+    "probes_count": lambda convert: lambda device: len(getattr(device, "probes", {}) or {}),
+    "gauge_temp": lambda convert: lambda device: convert(getattr(device, "gauge_temperature_c", None)),
+    "gauge_sensor_present": lambda convert: _node_flag("gauge_sensor_present", "PRESENT", "NOT_PRESENT"),
+    "gauge_low_battery": lambda convert: _node_flag("gauge_low_battery", "LOW", "OK"),
+    "gauge_overheating": lambda convert: _node_flag("gauge_sensor_overheating", "OVERHEATING", "OK"),
+    "gauge_alarm_high_state": lambda convert: _node_alarm_state("gauge_alarm_high_raw"),
+    "gauge_alarm_low_state": lambda convert: _node_alarm_state("gauge_alarm_low_raw"),
+    "gauge_alarm_low_temp": lambda convert: _node_alarm_temp("gauge_alarm_low_raw", convert),
+    "gauge_alarm_high_temp": lambda convert: _node_alarm_temp("gauge_alarm_high_raw", convert),
+}
+
+# Gauge alarm sensors -> the raw Alarm Status attribute their extra attributes decode.
+NODE_ALARM_STATUS_ATTRS = {
+    "gauge_alarm_low_temp": "gauge_alarm_low_raw",
+    "gauge_alarm_low_state": "gauge_alarm_low_raw",
+    "gauge_alarm_high_temp": "gauge_alarm_high_raw",
+    "gauge_alarm_high_state": "gauge_alarm_high_raw",
+}
+
+
+def _none_getter(device: Device):
+    return None
+
+
+def compile_state_getter(
+    getters: dict[str, Callable[[TempConverter], StateGetter]], state_id: str, unit: TempUnit
+) -> StateGetter:
+    """Bind a sensor's state_id and unit conversion into a single callable."""
+    factory = getters.get(state_id)
+    if factory is None:
+        return _none_getter
+    return factory(temp_converter(unit))
+
+
+def unit_of_measurement_for(sensor_type_data: list, unit: TempUnit) -> str | None:
+    if sensor_type_data[1] == "temp":
+        return "°F" if unit == TempUnit.FAHRENHEIT else "°C"
+    return sensor_type_data[1]
+
+
 async def async_setup_entry(
     hass: core.HomeAssistant,
     config_entry: config_entries.ConfigEntry,
@@ -235,6 +439,20 @@ async def async_setup_entry(
 
     config_entry.async_on_unload(async_dispatcher_connect(hass, EVENT_DISCOVERED, event_create_entity))
 
+    metric_sensors = []
+    for sensor_type, type_data in METRIC_SENSOR_TYPES.items():
+        name = f"Combustion {type_data[0]}"
+        if name in _CREATED_UNIQUE_IDS:
+            continue
+        _CREATED_UNIQUE_IDS.add(name)
+        metric_sensors.append(CombustionMetricEntity(Metrics.shared, type_data, name))
+    async_add_entities(metric_sensors)
+
+    # Devices discovered before the platform was set up were dispatched with no receiver.
+    mgr = hass.data[DOMAIN]["mgr"]
+    for device in list(mgr.devices.values()):
+        event_create_entity(device)
+
 
 class CombustionProbeEntity(SensorEntity):
 
@@ -254,6 +472,10 @@ class CombustionProbeEntity(SensorEntity):
         self.should_poll = False
 
         self.unit_type = TempUnit(self.config.get("unit_type", TempUnit.CELSIUS))
+        self._state_getter = compile_state_getter(
+            PROBE_STATE_GETTERS, sensor_type_data[3], self.unit_type
+        )
+        self._unit_of_measurement = unit_of_measurement_for(sensor_type_data, self.unit_type)
 
         _LOGGER.info(f"Creating entity for {self.sensor_name}")
 
@@ -292,10 +514,7 @@ class CombustionProbeEntity(SensorEntity):
 
     @property
     def unit_of_measurement(self) -> str:
-        if self.sensor_type_data[1] == "temp":
-            return ("°F" if self.unit_type == TempUnit.FAHRENHEIT else "°C")
-        else:
-            return self.sensor_type_data[1]
+        return self._unit_of_measurement
 
     @property
     def device_class(self) -> str | None:
@@ -303,55 +522,7 @@ class CombustionProbeEntity(SensorEntity):
 
     @property
     def state(self) -> Optional[str]:
-
-        state_id = self.sensor_type_data[3]
-        if state_id == "t1":
-            return convert_temp(self.device.current_temperatures.values[0], self.unit_type) if self.device.current_temperatures else None
-        elif state_id == "t2":
-            return convert_temp(self.device.current_temperatures.values[1], self.unit_type) if self.device.current_temperatures else None
-        elif state_id == "t3":
-            return convert_temp(self.device.current_temperatures.values[2], self.unit_type) if self.device.current_temperatures else None
-        elif state_id == "t4":
-            return convert_temp(self.device.current_temperatures.values[3], self.unit_type) if self.device.current_temperatures else None
-        elif state_id == "t5":
-            return convert_temp(self.device.current_temperatures.values[4], self.unit_type) if self.device.current_temperatures else None
-        elif state_id == "t6":
-            return convert_temp(self.device.current_temperatures.values[5], self.unit_type) if self.device.current_temperatures else None
-        elif state_id == "t7":
-            return convert_temp(self.device.current_temperatures.values[6], self.unit_type) if self.device.current_temperatures else None
-        elif state_id == "t8":
-            return convert_temp(self.device.current_temperatures.values[7], self.unit_type) if self.device.current_temperatures else None
-        elif state_id == "instant":
-            return convert_temp(self.device._instant_read_celsius, self.unit_type)
-        elif state_id == "core":
-            return convert_temp(self.device._virtual_temperatures.value.core_temperature, self.unit_type)
-        elif state_id == "ambient":
-            return convert_temp(self.device._virtual_temperatures.value.ambient_temperature, self.unit_type)
-        elif state_id == "surface":
-            return convert_temp(self.device._virtual_temperatures.value.surface_temperature, self.unit_type)
-        elif state_id == "rssi":
-            return self.device.rssi
-        elif state_id == "battery":
-            return self.device.batery_status.name
-        elif state_id == "prediction_mode":
-            return self.device.prediction_info.prediction_mode.name if self.device.prediction_info else None
-        elif state_id == "prediction_state":
-            return self.device.prediction_info.prediction_state.name if self.device.prediction_info else None
-        elif state_id == "prediction_type":
-            return self.device.prediction_info.prediction_type.name if self.device.prediction_info else None
-        elif state_id == "prediction_setpoint":
-            return convert_temp(self.device.prediction_info.prediction_set_point_temperature, self.unit_type) if self.device.prediction_info else None
-        elif state_id == "prediction_through":
-            return self.device.prediction_info.percent_through_cook if self.device.prediction_info else None
-        elif state_id == "prediction_value":
-            return self.device.prediction_info.seconds_remaining if self.device.prediction_info else None
-        elif state_id == "prediction_core":
-            return convert_temp(self.device.prediction_info.estimated_core_temperature, self.unit_type) if self.device.prediction_info else None
-        elif state_id == "hop_count":
-            # 0 = direct, 1..4 = via MeatNet hops
-            return getattr(self.device, "_hops", None)
-
-        return None
+        return self._state_getter(self.device)
 
 
 class CombustionNodeEntity(SensorEntity):
@@ -378,6 +549,11 @@ class CombustionNodeEntity(SensorEntity):
         self.sensor_type_data = sensor_type_data
         self.should_poll = False
         self.unit_type = TempUnit(self.config.get("unit_type", TempUnit.CELSIUS))
+        self._state_getter = compile_state_getter(
+            NODE_STATE_GETTERS, sensor_type_data[3], self.unit_type
+        )
+        self._unit_of_measurement = unit_of_measurement_for(sensor_type_data, self.unit_type)
+        self._alarm_status_attr = NODE_ALARM_STATUS_ATTRS.get(sensor_type_data[3])
 
     async def async_added_to_hass(self):
         self.async_on_remove(async_dispatcher_connect(self.hass, EVENT_REFRESH, self.sync))
@@ -410,9 +586,7 @@ class CombustionNodeEntity(SensorEntity):
 
     @property
     def unit_of_measurement(self) -> str:
-        if self.sensor_type_data[1] == "temp":
-            return ("°F" if self.unit_type == TempUnit.FAHRENHEIT else "°C")
-        return self.sensor_type_data[1]
+        return self._unit_of_measurement
 
     @property
     def device_class(self) -> str | None:
@@ -420,40 +594,7 @@ class CombustionNodeEntity(SensorEntity):
 
     @property
     def state(self) -> Optional[str]:
-        state_id = self.sensor_type_data[3]
-        if state_id == "rssi":
-            return self.device.rssi
-        if state_id == "probes_count":
-            return len(getattr(self.device, "probes", {}) or {})
-
-        if state_id == "gauge_temp":
-            temp_c = getattr(self.device, "gauge_temperature_c", None)
-            return convert_temp(temp_c, self.unit_type)
-        if state_id == "gauge_sensor_present":
-            present = getattr(self.device, "gauge_sensor_present", None)
-            return None if present is None else ("PRESENT" if present else "NOT_PRESENT")
-        if state_id == "gauge_low_battery":
-            low = getattr(self.device, "gauge_low_battery", None)
-            return None if low is None else ("LOW" if low else "OK")
-        if state_id == "gauge_overheating":
-            over = getattr(self.device, "gauge_sensor_overheating", None)
-            return None if over is None else ("OVERHEATING" if over else "OK")
-        if state_id == "gauge_alarm_high_state":
-            alarm_status = getattr(self.device, "gauge_alarm_high_raw", None)
-            return _decode_gauge_alarm_status_to_state(alarm_status)
-        if state_id == "gauge_alarm_low_state":
-            alarm_status = getattr(self.device, "gauge_alarm_low_raw", None)
-            return _decode_gauge_alarm_status_to_state(alarm_status)
-        if state_id == "gauge_alarm_low_temp":
-            alarm_status = getattr(self.device, "gauge_alarm_low_raw", None)
-            temp_c = _decode_gauge_alarm_status_to_temperature_c(alarm_status)
-            return convert_temp(temp_c, self.unit_type)
-        if state_id == "gauge_alarm_high_temp":
-            alarm_status = getattr(self.device, "gauge_alarm_high_raw", None)
-            temp_c = _decode_gauge_alarm_status_to_temperature_c(alarm_status)
-            return convert_temp(temp_c, self.unit_type)
-
-        return None
+        return self._state_getter(self.device)
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
@@ -469,26 +610,12 @@ class CombustionNodeEntity(SensorEntity):
 
         # Add best-RSSI metadata for the RSSI sensor
         if self.sensor_type_data[0] == "RSSI":
-            sorted_rssi = sorted(
-                self.device.device_manager.devices.items(), key=lambda x: x[1].rssi, reverse=True
-            )
-            rssi = sorted_rssi[0][1].rssi
-            attribs["best_rssi"] = rssi
+            attribs["best_rssi"] = self.device.device_manager.get_best_rssi()
             attribs["hops"] = getattr(self.device, "_hops", None)
 
         # Add decoded alarm flags for gauge alarm sensors
-        if self.sensor_type_data[3] in (
-            "gauge_alarm_low_temp",
-            "gauge_alarm_high_temp",
-            "gauge_alarm_low_state",
-            "gauge_alarm_high_state",
-        ):
-            alarm_status_attr = (
-                "gauge_alarm_low_raw"
-                if self.sensor_type_data[3] in ("gauge_alarm_low_temp", "gauge_alarm_low_state")
-                else "gauge_alarm_high_raw"
-            )
-            alarm_status = getattr(self.device, alarm_status_attr, None)
+        if self._alarm_status_attr:
+            alarm_status = getattr(self.device, self._alarm_status_attr, None)
             flags = _decode_gauge_alarm_status_flags(alarm_status)
             if flags is not None:
                 attribs["alarm_set"] = flags["set"]
@@ -500,3 +627,46 @@ class CombustionNodeEntity(SensorEntity):
 
     async def async_update(self) -> None:
         return None
+
+
+class CombustionMetricEntity(SensorEntity):
+    """Diagnostic sensor exposing one pipeline metric."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+
+    def __init__(self, metrics: Metrics, sensor_type_data: list, name: str):
+        super().__init__()
+        self.metrics = metrics
+        self.sensor_type_data = sensor_type_data
+        self.sensor_name = name
+        self._state_getter = METRIC_STATE_GETTERS[sensor_type_data[3]]
+        self._attr_state_class = sensor_type_data[2]
+        self._attr_native_unit_of_measurement = sensor_type_data[1]
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(async_dispatcher_connect(self.hass, EVENT_REFRESH, self.sync))
+
+    async def sync(self):
+        self.async_write_ha_state()
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, "meatnet")},
+            "name": "Combustion MeatNet",
+            "manufacturer": "Combustion Inc",
+            "model": "Integration",
+        }
+
+    @property
+    def name(self) -> str:
+        return self.sensor_name
+
+    @property
+    def unique_id(self) -> str:
+        return self.sensor_name
+
+    @property
+    def native_value(self):
+        return self._state_getter(self.metrics)
@@ -0,0 +1 @@
+"""Micro-benchmarks for protocol codecs and state updates."""
@@ -0,0 +1,74 @@
+"""Payload builders shared by the benchmarks."""
+
+from custom_components.combustion_custom.combustion_ble.utilities.crc16ccitt import (
+    crc16ccitt,
+)
+
+VENDOR_ID = b"\x09\xc7"
+# Any 13 bytes decode to eight valid thermistor readings.
+RAW_TEMPERATURES = bytes.fromhex("5a1c2e8f0b7d43a9c1e2670f31")
+
+
+def probe_advertising(serial_number: int = 0x10203040, product_type: int = 0x01) -> bytes:
+    """Full MSD (with vendor id) for a Probe or a Node repeating a Probe."""
+    return (
+        VENDOR_ID
+        + bytes([product_type])
+        + serial_number.to_bytes(4, "little")
+        + RAW_TEMPERATURES
+        + bytes([0x00, 0x00, 0x00])
+    )
+
+
+def gauge_advertising(serial: bytes = b"GAUGE12345") -> bytes:
+    raw_temp = int((21.5 + 20.0) / 0.1)
+    return (
+        VENDOR_ID
+        + b"\x03"
+        + serial
+        + raw_temp.to_bytes(2, "little")
+        + b"\x01\x00"
+        + bytes(8)
+    )
+
+
+def probe_status(sequence: int = 1000) -> bytes:
+    return (
+        (sequence - 100).to_bytes(4, "little")
+        + sequence.to_bytes(4, "little")
+        + RAW_TEMPERATURES
+        + bytes([0x00, 0x00])
+        + bytes(7)
+    )
+
+
+def probe_log_response(sequence: int) -> bytes:
+    """Probe UART Log response frame."""
+    payload = sequence.to_bytes(4, "little") + RAW_TEMPERATURES + bytes(7)
+    body = bytes([0x04, 0x01, len(payload)]) + payload
+    return b"\xca\xfe" + crc16ccitt(body).to_bytes(2, "little") + body
+
+
+def node_probe_status_request(serial_number: int, request_id: int) -> bytes:
+    """MeatNet Probe Status request frame as repeated by a Node."""
+    payload = serial_number.to_bytes(4, "little") + probe_status()[:30] + b"\x01"
+    body = bytes([0x45]) + request_id.to_bytes(4, "big") + bytes([len(payload)]) + payload
+    return b"\xca\xfe" + crc16ccitt(body).to_bytes(2, "little") + body
+
+
+def node_read_logs_response(serial_number: int, sequence: int, request_id: int) -> bytes:
+    payload = (
+        serial_number.to_bytes(4, "little")
+        + sequence.to_bytes(4, "little")
+        + RAW_TEMPERATURES
+        + bytes(7)
+    )
+    body = (
+        bytes([0x04 | 0x80])
+        + request_id.to_bytes(4, "big")
+        + (request_id + 1).to_bytes(4, "big")
+        + bytes([0x01, len(payload)])
+        + payload
+    )
+    return b"\xca\xfe" + crc16ccitt(body).to_bytes(2, "little") + body
+
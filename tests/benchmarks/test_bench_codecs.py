@@ -0,0 +1,72 @@
+"""Benchmarks for advertising, status and UART decoding."""
+
+from custom_components.combustion_custom.combustion_ble.ble_data.advertising_data import (
+    AdvertisingData,
+    CombustionProductType,
+)
+from custom_components.combustion_custom.combustion_ble.ble_data.gauge_advertising_data import (
+    GaugeAdvertisingData,
+)
+from custom_components.combustion_custom.combustion_ble.ble_data.probe_status import (
+    ProbeStatus,
+)
+from custom_components.combustion_custom.combustion_ble.uart import responses_from_data
+from custom_components.combustion_custom.combustion_ble.uart.meatnet import (
+    NodeProbeStatusRequest,
+    NodeReadLogsResponse,
+    NodeUARTMessage,
+)
+from custom_components.combustion_custom.combustion_ble.utilities.crc16ccitt import (
+    crc16ccitt,
+)
+
+from .conftest import (
+    gauge_advertising,
+    node_probe_status_request,
+    node_read_logs_response,
+    probe_advertising,
+    probe_log_response,
+    probe_status,
+)
+
+
+def test_advertising_data_from_data(benchmark):
+    data = probe_advertising()
+    advertising = benchmark(AdvertisingData.from_data, data)
+    assert advertising.type == CombustionProductType.PROBE
+    assert advertising.serial_number == 0x10203040
+
+
+def test_gauge_advertising_data_from_data(benchmark):
+    data = gauge_advertising()
+    advertising = benchmark(GaugeAdvertisingData.from_data, data)
+    assert advertising.serial == "GAUGE12345"
+    assert advertising.sensor_present
+
+
+def test_probe_status_from_data(benchmark):
+    data = probe_status(sequence=1000)
+    status = benchmark(ProbeStatus.from_data, data)
+    assert status.max_sequence_number == 1000
+
+
+def test_responses_from_data_log_burst(benchmark):
+    # A notification packed with back-to-back Log responses, as seen during backfill.
+    data = b"".join(probe_log_response(sequence) for sequence in range(8))
+    responses = benchmark(responses_from_data, data)
+    assert [response.sequence_number for response in responses] == list(range(8))
+
+
+def test_node_uart_message_status_and_logs(benchmark):
+    data = node_probe_status_request(0x10203040, request_id=1) + b"".join(
+        node_read_logs_response(0x10203040, sequence, request_id=10 + sequence)
+        for sequence in range(4)
+    )
+    messages = benchmark(NodeUARTMessage.from_data, data)
+    assert isinstance(messages[0], NodeProbeStatusRequest)
+    assert all(isinstance(message, NodeReadLogsResponse) for message in messages[1:])
+
+
+def test_crc16ccitt(benchmark):
+    data = bytes(range(256)) * 2
+    assert benchmark(crc16ccitt, data) == crc16ccitt(data)
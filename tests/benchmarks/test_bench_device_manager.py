@@ -0,0 +1,26 @@
+"""Benchmarks for DeviceManager advertising updates."""
+
+import pytest
+
+from custom_components.combustion_custom.combustion_ble.ble_data.advertising_data import (
+    AdvertisingData,
+)
+
+from .conftest import probe_advertising
+
+
+@pytest.mark.parametrize("device_count", [10, 100])
+async def test_update_device_with_advertising(benchmark, device_manager, device_count):
+    advertisements = [
+        (AdvertisingData.from_data(probe_advertising(0x1000 + index)), f"AA:BB:CC:00:{index:02X}:00")
+        for index in range(device_count)
+    ]
+
+    def update_all():
+        for advertising, identifier in advertisements:
+            device_manager.update_device_with_advertising(
+                advertising, is_connectable=True, rssi=-60, identifier=identifier
+            )
+
+    benchmark(update_all)
+    assert len(device_manager.get_probes()) == device_count
@@ -0,0 +1,79 @@
+"""Replay simulated cooks through the local cook-time estimate."""
+
+import math
+import random
+
+from custom_components.combustion_custom.combustion_ble.prediction.local_predictor import (
+    LocalPredictor,
+)
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedProbe
+
+TARGET = 63.0
+COOKS = 8
+# One advertisement per second, at the 0.05 C resolution of the wire format.
+ADVERTISING_PERIOD = 1.0
+
+
+def _cook(seed: int) -> tuple[list[float], float]:
+    rng = random.Random(seed)
+    probe = SimulatedProbe("C0:FF:EE:00:00:01", 0x51000000 | seed, rng)
+    rate = probe.heating_rates[0]
+    done = (
+        math.log(
+            (probe.oven_temperature - probe.start_temperature) / (probe.oven_temperature - TARGET)
+        )
+        / rate
+    )
+    samples = []
+    elapsed = 0.0
+    while elapsed < done:
+        core = probe.temperatures_at(elapsed)[0] + rng.uniform(-0.05, 0.05)
+        samples.append(round(core / 0.05) * 0.05)
+        elapsed += ADVERTISING_PERIOD
+    return samples, done
+
+
+COOK_SAMPLES = [_cook(seed) for seed in range(COOKS)]
+
+
+def _replay(samples: list[float], done: float) -> list[tuple[float, float]]:
+    """(relative error, confidence) against the probe's remaining time at 50/75/90% of the cook."""
+    predictor = LocalPredictor()
+    checkpoints = [int(done * fraction / ADVERTISING_PERIOD) for fraction in (0.5, 0.75, 0.9)]
+    results = []
+    for index, core in enumerate(samples):
+        elapsed = index * ADVERTISING_PERIOD
+        predictor.add(core, elapsed)
+        if index in checkpoints:
+            estimate = predictor.estimate(TARGET)
+            remaining = done - elapsed
+            results.append(
+                (abs(estimate.seconds_remaining - remaining) / remaining, estimate.confidence)
+            )
+    return results
+
+
+def test_replay_cooks(benchmark):
+    def replay_all():
+        return [_replay(samples, done) for samples, done in COOK_SAMPLES]
+
+    results = benchmark(replay_all)
+    errors = [error for cook in results for error, _ in cook]
+    assert len(errors) == 3 * COOKS
+    assert max(errors) < 0.1
+    assert sum(errors) / len(errors) < 0.03
+    assert all(confidence > 0.5 for cook in results for _, confidence in cook)
+
+
+def test_add_sample(benchmark):
+    samples, _ = COOK_SAMPLES[0]
+    predictor = LocalPredictor()
+    for index, core in enumerate(samples[:600]):
+        predictor.add(core, float(index))
+    clock = [600.0]
+
+    def add():
+        clock[0] += ADVERTISING_PERIOD
+        predictor.add(60.0, clock[0])
+
+    benchmark(add)
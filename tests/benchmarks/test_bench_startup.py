@@ -0,0 +1,107 @@
+"""Benchmarks for integration import time and setup until the first probe appears."""
+
+import json
+import subprocess
+import sys
+
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from custom_components.combustion_custom.combustion_ble.ble_manager import BleManager
+from custom_components.combustion_custom.combustion_ble.const import BT_MANUFACTURER_ID
+from custom_components.combustion_custom.combustion_ble.device_manager import DeviceManager
+
+from .conftest import probe_advertising
+
+# Home Assistant has these loaded before it imports any integration.
+IMPORT_SCRIPT = """
+import json, sys, time
+import voluptuous
+import homeassistant.config_entries
+import homeassistant.helpers.config_validation
+import homeassistant.helpers.dispatcher
+import homeassistant.helpers.event
+
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+# Only needed once there is a config entry, or a device to connect to.
+DEFERRED_MODULES = (
+    "bleak_retry_connector",
+    "custom_components.combustion_custom.meatnet",
+    "custom_components.combustion_custom.combustion_ble.device_manager",
+    "custom_components.combustion_custom.combustion_ble.ble_manager",
+)
+# Only needed to run a simulated fleet, never by a config entry.
+SIMULATION_MODULES = ("custom_components.combustion_custom.combustion_ble.simulation",)
+
+NODE = BLEDevice("C0:FF:EE:00:01:00", "Timer", None)
+
+
+def _import(module: str) -> dict:
+    """Import `module` in a fresh interpreter; returns the time taken and what was loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_import_integration(benchmark):
+    result = benchmark.pedantic(
+        _import, args=("custom_components.combustion_custom",), rounds=3, iterations=1
+    )
+    benchmark.extra_info["import_seconds"] = result["seconds"]
+    for module in DEFERRED_MODULES:
+        assert module not in result["modules"]
+
+
+def test_import_meatnet_manager(benchmark):
+    result = benchmark.pedantic(
+        _import, args=("custom_components.combustion_custom.meatnet",), rounds=3, iterations=1
+    )
+    benchmark.extra_info["import_seconds"] = result["seconds"]
+    for module in SIMULATION_MODULES:
+        assert module not in result["modules"]
+
+
+def _release(manager: DeviceManager) -> None:
+    # The synchronous part of DeviceManager.async_stop: cancel every timer it started.
+    if manager.timer_task:
+        manager.timer_task.cancel()
+        manager.timer_task = None
+    for probe in manager.get_probes():
+        probe.stop_timers()
+        manager.connection_manager.clear_handlers_for_probe(probe)
+    DeviceManager.shared = None
+    BleManager.shared.delegate = None
+
+
+async def test_setup_until_first_probe(benchmark):
+    advertisement = AdvertisementData(
+        local_name=None,
+        manufacturer_data={BT_MANUFACTURER_ID: probe_advertising(0x51000001)[2:]},
+        service_data={},
+        service_uuids=[],
+        tx_power=None,
+        rssi=-60,
+        platform_data=(),
+    )
+
+    def setup_until_first_probe() -> DeviceManager:
+        manager = DeviceManager()
+        manager.enable_meatnet()
+        # Nothing runs in the background until there is a device to look after.
+        assert manager.timer_task is None
+        BleManager.shared.detection_callback(NODE, advertisement)
+        assert manager.find_probe_by_serial_number(0x51000001) is not None
+        assert manager.timer_task is not None
+        _release(manager)
+        return manager
+
+    benchmark(setup_until_first_probe)
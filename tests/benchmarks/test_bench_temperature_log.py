@@ -0,0 +1,62 @@
+"""Benchmarks for ProbeTemperatureLog at cook-length sizes."""
+
+from custom_components.combustion_custom.combustion_ble.ble_data.probe_temperatures import (
+    ProbeTemperatures,
+)
+from custom_components.combustion_custom.combustion_ble.logged_probe_data_count import (
+    LoggedProbeDataPoint,
+)
+from custom_components.combustion_custom.combustion_ble.probe_temperature_log import (
+    ProbeTemperatureLog,
+)
+from custom_components.combustion_custom.combustion_ble.uart import SessionInformation
+
+from .conftest import RAW_TEMPERATURES
+
+# A 12 hour cook at the default 5 s sample period.
+LOG_SIZE = 12 * 60 * 60 // 5
+TEMPERATURES = ProbeTemperatures.from_raw_data(RAW_TEMPERATURES)
+
+
+def _data_point(sequence: int) -> LoggedProbeDataPoint:
+    return LoggedProbeDataPoint(sequence_num=sequence, temperatures=TEMPERATURES)
+
+
+def _filled_log(size: int, skip: set[int] | None = None) -> ProbeTemperatureLog:
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=5000))
+    skip = skip or set()
+    for sequence in range(size):
+        if sequence not in skip:
+            log.data_points_dict[sequence] = _data_point(sequence)
+    return log
+
+
+def test_append_in_order(benchmark):
+    points = [_data_point(sequence) for sequence in range(LOG_SIZE, LOG_SIZE + 500)]
+
+    def setup():
+        return (_filled_log(LOG_SIZE),), {}
+
+    def append(log: ProbeTemperatureLog):
+        for point in points:
+            log.append_data_point(point)
+        return log
+
+    log = benchmark.pedantic(append, setup=setup, rounds=10)
+    assert len(log.data_points_dict) == LOG_SIZE + len(points)
+
+
+def test_missing_range(benchmark):
+    gap = set(range(LOG_SIZE // 2, LOG_SIZE // 2 + 10))
+    log = _filled_log(LOG_SIZE, skip=gap)
+    assert benchmark(log.missing_range, 0, LOG_SIZE - 1) == (min(gap), max(gap))
+
+
+def test_missing_range_complete(benchmark):
+    log = _filled_log(LOG_SIZE)
+    assert benchmark(log.missing_range, 0, LOG_SIZE - 1) is None
+
+
+def test_logs_in_range(benchmark):
+    log = _filled_log(LOG_SIZE)
+    assert benchmark(log.logs_in_range, (100, LOG_SIZE - 100)) == LOG_SIZE - 199
@@ -1,9 +1,35 @@
 """Fixtures for testing."""
 
+import asyncio
+
 import pytest
 
+from custom_components.combustion_custom.combustion_ble.adapter_pool import AdapterPool
+from custom_components.combustion_custom.combustion_ble.ble_manager import BleManager
+from custom_components.combustion_custom.combustion_ble.device_manager import DeviceManager
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations."""
     return
+
+
+@pytest.fixture(autouse=True)
+def auto_mock_bluetooth(mock_bluetooth):
+    """The integration depends on bluetooth; keep it from touching real adapters."""
+    return
+
+
+@pytest.fixture
+async def device_manager():
+    """A fresh DeviceManager singleton with MeatNet enabled, stopped after the test."""
+    manager = DeviceManager()
+    manager.enable_meatnet()
+    yield manager
+    await manager.async_stop()
+    # Let responses already scheduled on the loop drain.
+    await asyncio.sleep(0.05)
+    DeviceManager.shared = None
+    BleManager.shared.delegate = None
+    BleManager.shared.adapters = AdapterPool()
@@ -0,0 +1,190 @@
+"""Test multi-adapter placement, merging and failover."""
+
+from bleak.backends.device import BLEDevice
+
+from custom_components.combustion_custom.combustion_ble import adapter_pool
+from custom_components.combustion_custom.combustion_ble.adapter_pool import AdapterPool
+from custom_components.combustion_custom.combustion_ble.ble_manager import (
+    BleManager,
+    BleManagerDelegate,
+)
+from custom_components.combustion_custom.combustion_ble.devices.device import Device
+from custom_components.combustion_custom.combustion_ble.devices.meat_net_node import (
+    MeatNetNode,
+)
+
+from .test_simulation import FAST, wait_for
+
+DEVICE = BLEDevice("AA:BB:CC:DD:EE:01", "CP", None)
+
+
+def test_places_on_strongest_adapter_with_free_slot():
+    pool = AdapterPool()
+    pool.add("hci0", max_connections=1, now=0)
+    pool.add("hci1", max_connections=1, now=0)
+    pool.note_advertisement("hci0", "a", -50, DEVICE, b"a", now=1)
+    pool.note_advertisement("hci1", "a", -70, DEVICE, b"a", now=1)
+    pool.note_advertisement("hci0", "b", -55, DEVICE, b"b", now=1)
+    pool.note_advertisement("hci1", "b", -80, DEVICE, b"b", now=1)
+
+    assert pool.place("a", now=2)[0] == "hci0"
+    # hci0 is full, so the weaker adapter takes the next link.
+    assert pool.place("b", now=2)[0] == "hci1"
+    assert pool.capacity == 2
+
+    pool.release("a")
+    assert pool.connections_on("hci0") == []
+
+
+def test_merges_copies_across_adapters():
+    pool = AdapterPool()
+    assert pool.note_advertisement("hci0", "a", -70, DEVICE, b"x", now=1.0)
+    assert not pool.note_advertisement("hci1", "a", -60, DEVICE, b"x", now=1.05)
+    assert pool.best_rssi("a", now=1.1) == -60
+    assert pool.note_advertisement("hci1", "a", -60, DEVICE, b"y", now=1.1)
+
+
+def test_silent_and_failing_adapters_are_unhealthy():
+    pool = AdapterPool()
+    pool.add("hci0", now=0)
+    pool.add("hci1", now=0)
+    pool.note_advertisement("hci0", "a", -50, DEVICE, b"a", now=0)
+    pool.note_advertisement("hci1", "a", -70, DEVICE, b"a", now=0)
+    pool.note_advertisement("hci1", "a", -70, DEVICE, b"b", now=40)
+    assert pool.check_health(now=40) == ["hci0"]
+    assert pool.place("a", now=40)[0] == "hci1"
+
+    for _ in range(AdapterPool.MAX_CONSECUTIVE_FAILURES):
+        pool.place("a", now=40)
+        pool.note_connect_failed("a")
+    assert pool.check_health(now=41) == ["hci1"]
+    assert pool.place("a", now=41) is None
+
+    # Failure quarantine lifts after RECOVERY_SECONDS; silence lifts once hci0 is heard again.
+    later = 41 + AdapterPool.RECOVERY_SECONDS
+    pool.note_advertisement("hci0", "a", -50, DEVICE, b"c", now=later)
+    pool.note_advertisement("hci1", "a", -70, DEVICE, b"c", now=later)
+    assert pool.check_health(now=later) == []
+    assert pool.stats()["hci0"]["healthy"] and pool.stats()["hci1"]["healthy"]
+
+
+def test_external_sources_are_not_health_checked():
+    pool = AdapterPool()
+    pool.add("hci0", now=0)
+    # An external stack forwards each device from whichever scanner it prefers at the time.
+    for now in range(0, 121, 10):
+        preferred = "proxy-a" if now // 40 % 2 == 0 else "proxy-b"
+        pool.note_advertisement(preferred, "a", -60, DEVICE, bytes([now]), now=now)
+        pool.note_advertisement("hci0", "a", -70, DEVICE, bytes([now]), now=now)
+        assert pool.check_health(now=now) == []
+    assert pool.stats()["proxy-a"]["healthy"] and pool.stats()["proxy-b"]["healthy"]
+
+
+class _RecordingDelegate(BleManagerDelegate):
+    def __init__(self, priorities: dict[str, int]) -> None:
+        self.priorities = priorities
+        self.rejected: list[str] = []
+        self.evicted: list[str] = []
+
+    def connection_priority(self, identifier: str) -> int:
+        return self.priorities.get(identifier, 0)
+
+    def did_reject_connect_to(self, identifier: str):
+        self.rejected.append(identifier)
+
+    def did_evict_connection(self, identifier: str):
+        self.evicted.append(identifier)
+
+
+async def test_failed_placement_does_not_evict():
+    manager = BleManager()
+    manager.delegate = delegate = _RecordingDelegate({"victim": 0, "new": 100})
+    manager.connection_pool.resize(1)
+    manager.adapters.add("hci0", max_connections=1, now=0)
+    manager.adapters.note_advertisement("hci0", "victim", -50, DEVICE, b"v")
+    manager.adapters.note_advertisement("hci0", "new", -50, DEVICE, b"n")
+    manager.adapters.place("victim")
+    manager.connection_pool.reserve("victim")
+    manager.connection_pool.mark_connected("victim")
+    manager.ble_devices["new"] = DEVICE
+
+    # The pool would evict the lower priority link, but hci0 has no slot for the new one.
+    await manager.connect("new")
+    assert delegate.rejected == ["new"] and delegate.evicted == []
+    assert "victim" in manager.connection_pool and "new" not in manager.connection_pool
+    assert manager.connection_pool.stats()["evictions"] == 0
+    assert manager.adapters.adapter_for("victim") == "hci0"
+
+
+class _Link:
+    """A connected client with nothing to discover."""
+
+    services = []
+    is_connected = True
+    mtu_size = 23
+
+    async def disconnect(self) -> bool:
+        self.is_connected = False
+        return True
+
+
+async def test_resolver_device_is_kept_as_the_preferred_source_changes(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(adapter_pool.time, "monotonic", lambda: now[0])
+    resolved = BLEDevice(DEVICE.address, "CP", {"path": "resolver"})
+    manager = BleManager()
+    manager.delegate = _RecordingDelegate({})
+    manager.ble_device_resolver = lambda identifier: resolved
+    connected_with = []
+
+    async def client_factory(ble_device, disconnected_callback):
+        connected_with.append(ble_device)
+        return _Link()
+
+    manager.client_factory = client_factory
+    manager.adapters.note_advertisement("proxy-a", DEVICE.address, -50, DEVICE, b"0")
+    await manager.connect(DEVICE.address)
+    # The external stack chose the path; no adapter of ours holds the link.
+    assert connected_with == [resolved]
+    assert manager.adapters.adapter_for(DEVICE.address) is None
+
+    for step in range(1, 13):
+        now[0] = step * 10.0
+        preferred = "proxy-a" if step // 4 % 2 == 0 else "proxy-b"
+        manager.adapters.note_advertisement(preferred, DEVICE.address, -50, DEVICE, bytes([step]))
+        for adapter in manager.adapters.check_health():
+            await manager._fail_over(adapter)
+    assert manager.sessions[DEVICE.address].is_connected
+
+
+async def test_fails_over_to_another_adapter(device_manager, monkeypatch):
+    monkeypatch.setattr(BleManager, "ADAPTER_HEALTH_CHECK_SECONDS", 0.1)
+    fleet = device_manager.start_simulation(
+        probes=2, nodes=2, adapters=["hci0", "hci1"], adapter_max_connections=2, **FAST
+    )
+    adapters = BleManager.shared.adapters
+
+    def nodes():
+        return [d for d in device_manager.devices.values() if isinstance(d, MeatNetNode)]
+
+    assert await wait_for(
+        lambda: len(nodes()) == 2
+        and all(n.connection_state == Device.ConnectionState.CONNECTED for n in nodes())
+    )
+    placed = {node.ble_identifier: adapters.adapter_for(node.ble_identifier) for node in nodes()}
+    assert set(placed.values()) <= {"hci0", "hci1"}
+    assert adapters.merged > 0
+
+    failed = next(iter(placed.values()))
+    adapters.STALE_SECONDS = 0.3
+    fleet.fail_adapter(failed)
+
+    # The health check notices the silent adapter and moves its links.
+    assert await wait_for(
+        lambda: all(
+            n.connection_state == Device.ConnectionState.CONNECTED
+            and adapters.adapter_for(n.ble_identifier) not in (None, failed)
+            for n in nodes()
+        )
+    )
+    assert adapters.stats()[failed]["failovers"] == 1
@@ -0,0 +1,56 @@
+"""Test micro-batched advertisement processing."""
+
+import asyncio
+import random
+
+from bleak.backends.device import BLEDevice
+
+from custom_components.combustion_custom.combustion_ble.advertisement_batcher import (
+    AdvertisementBatcher,
+)
+from custom_components.combustion_custom.combustion_ble.ble_manager import BleManager
+from custom_components.combustion_custom.combustion_ble.metrics import Metrics
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedProbe
+
+from .test_repeated_advertising import deliver
+
+
+async def test_keeps_latest_per_key_and_bounds_the_buffer():
+    metrics = Metrics()
+    batches = []
+    batcher = AdvertisementBatcher(batches.append, 0.01, max_pending=3, metrics=metrics)
+
+    batcher.add("a", 1)
+    batcher.add("a", 2)
+    batcher.add("b", 1)
+    assert batches == []
+    await asyncio.sleep(0.05)
+    assert batches == [[2, 1]]
+    assert metrics.advertisements_coalesced.value == 1
+
+    # Hitting max_pending distinct keys flushes without waiting for the window.
+    for key in "xyz":
+        batcher.add(key, key)
+    assert batches[-1] == ["x", "y", "z"]
+    assert metrics.advertisement_batch_overflows.value == 1
+    assert metrics.advertisement_batch_size.count == 2
+
+
+async def test_batches_detection_callback(device_manager):
+    rng = random.Random(1)
+    probes = [SimulatedProbe(f"C0:FF:EE:00:00:0{i}", 0x51000000 | i, rng) for i in range(2)]
+    devices = [BLEDevice(probe.address, probe.name, None) for probe in probes]
+    coalesced = device_manager.metrics.advertisements_coalesced.value
+    device_manager.set_advertisement_batching(0.05)
+
+    for _ in range(3):
+        for probe, device in zip(probes, devices):
+            deliver(device, probe.advertising_payload())
+    assert device_manager.get_probes() == []
+
+    await asyncio.sleep(0.1)
+    assert len(device_manager.get_probes()) == 2
+    assert device_manager.metrics.advertisements_coalesced.value - coalesced == 4
+
+    await BleManager.shared.stop_bluetooth()
+    assert BleManager.shared.advertisement_batcher is None
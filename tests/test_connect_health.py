@@ -0,0 +1,116 @@
+"""Test connect backoff and circuit breaking."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.combustion_custom.combustion_ble import connect_health
+from custom_components.combustion_custom.combustion_ble.connect_health import ConnectHealth
+from custom_components.combustion_custom.combustion_ble.connection_manager import (
+    ConnectionManager,
+)
+
+
+class _FixedRandom:
+    """Stands in for the `random` module, always drawing the same point of the range."""
+
+    def __init__(self, position: float) -> None:
+        self.position = position
+        self.ranges: list[tuple[float, float]] = []
+
+    def uniform(self, low: float, high: float) -> float:
+        self.ranges.append((low, high))
+        return low + (high - low) * self.position
+
+
+@pytest.fixture
+def fixed_random(monkeypatch):
+    fixed = _FixedRandom(0.5)
+    monkeypatch.setattr(connect_health, "random", fixed)
+    return fixed
+
+
+@pytest.mark.parametrize(
+    ("failures", "backoff"), [(1, 5.0), (2, 10.0), (3, 20.0), (6, 160.0), (7, 300.0), (20, 300.0)]
+)
+def test_backoff_doubles_up_to_the_cap(fixed_random, failures, backoff):
+    assert ConnectHealth.backoff_seconds(failures) == backoff
+
+
+@pytest.mark.parametrize(("position", "factor"), [(0.0, 0.75), (1.0, 1.25)])
+def test_jitter_bounds(monkeypatch, position, factor):
+    fixed = _FixedRandom(position)
+    monkeypatch.setattr(connect_health, "random", fixed)
+    assert ConnectHealth.backoff_seconds(2) == pytest.approx(10.0 * factor)
+    assert ConnectHealth.backoff_seconds(30) == pytest.approx(300.0 * factor)
+    assert fixed.ranges == [(0.75, 1.25)] * 2
+
+
+def test_backoff_blocks_until_it_expires(fixed_random):
+    health = ConnectHealth()
+    assert health.allows_attempt(now=0)
+    assert health.note_failure(now=0) == 5.0
+    assert not health.allows_attempt(now=4.9)
+    assert health.allows_attempt(now=5.0)
+
+    # A rejection backs off like a first failure without counting as one.
+    assert health.note_rejected(now=10) == 5.0
+    assert health.consecutive_failures == 1 and not health.allows_attempt(now=14)
+
+    health.note_success(now=20)
+    assert health.consecutive_failures == 0 and health.allows_attempt(now=20)
+
+
+def test_circuit_opens_then_half_opens(fixed_random):
+    health = ConnectHealth()
+    now = 0.0
+    for _ in range(ConnectHealth.CIRCUIT_BREAKER_THRESHOLD - 1):
+        now += health.note_failure(now=now)
+        assert not health.circuit_open and health.allows_attempt(now=now)
+    health.note_failure(now=now)
+    assert health.circuit_open
+
+    opened = now
+    # Backoff alone would allow this; the open circuit does not.
+    assert not health.allows_attempt(now=opened + ConnectHealth.MAX_BACKOFF_SECONDS * 2)
+    assert not health.allows_attempt(now=opened + ConnectHealth.CIRCUIT_RESET_SECONDS - 1)
+    half_open = opened + ConnectHealth.CIRCUIT_RESET_SECONDS
+    assert health.allows_attempt(now=half_open)
+    assert not health.circuit_open
+    # The half-open attempt failing re-opens the circuit at once.
+    health.note_failure(now=half_open)
+    assert health.circuit_open and not health.allows_attempt(now=half_open + 60)
+
+
+def _open(manager: ConnectionManager, device) -> ConnectHealth:
+    for _ in range(ConnectHealth.CIRCUIT_BREAKER_THRESHOLD):
+        manager.note_connect_failed(device)
+    health = manager._connect_health[device.serial_number_string]
+    assert health.circuit_open
+    return health
+
+
+def test_connectable_flag_flipping_back_resets(fixed_random):
+    manager = ConnectionManager(None)
+    device = SimpleNamespace(serial_number_string="10203040", is_connectable=True)
+    health = _open(manager, device)
+    manager.note_advertising(device)
+    assert health.circuit_open
+    device.is_connectable = False
+    manager.note_advertising(device)
+    assert health.circuit_open
+    device.is_connectable = True
+    manager.note_advertising(device)
+    assert not health.circuit_open and manager._connect_allowed(device)
+    # One more failure re-opens it.
+    manager.note_connect_failed(device)
+    assert health.circuit_open
+
+
+def test_returning_from_stale_resets(fixed_random):
+    manager = ConnectionManager(None)
+    device = SimpleNamespace(serial_number_string="10203040", is_connectable=True)
+    health = _open(manager, device)
+    manager.note_advertising(device, was_stale=True)
+    assert not health.circuit_open and manager._connect_allowed(device)
+    assert manager.connection_diagnostics()["10203040"]["backoff_remaining"] == 0.0
@@ -0,0 +1,75 @@
+"""Test connection slot accounting, priorities and eviction."""
+
+from custom_components.combustion_custom.combustion_ble import connection_pool
+from custom_components.combustion_custom.combustion_ble.connection_pool import (
+    ConnectionPool,
+    ConnectionPriority,
+)
+
+PRIORITIES = {
+    "redundant": ConnectionPriority.REDUNDANT_PROBE,
+    "probe": ConnectionPriority.PROBE,
+    "probe2": ConnectionPriority.PROBE,
+    "node": ConnectionPriority.NODE + 2,
+    "node2": ConnectionPriority.NODE,
+}
+
+
+def _pool(max_slots: int, *connected: str) -> ConnectionPool:
+    pool = ConnectionPool(max_slots, priority=PRIORITIES.__getitem__)
+    for identifier in connected:
+        assert pool.reserve(identifier) == (True, None)
+        pool.mark_connected(identifier)
+    return pool
+
+
+def test_evicts_the_lowest_priority_link():
+    pool = _pool(3, "node2", "probe", "redundant")
+    assert pool.reserve("node") == (True, "redundant")
+    assert "redundant" not in pool and "node" in pool
+    # A busy link of equal priority, or any higher one, keeps its slot.
+    pool.mark_connected("node")
+    assert pool.reserve("probe2") == (False, None)
+
+    stats = pool.stats()
+    assert (stats["in_use"], stats["connected"], stats["pending"]) == (3, 3, 0)
+    assert (stats["acquisitions"], stats["evictions"], stats["rejections"]) == (4, 1, 1)
+    assert stats["utilization"] == 1.0 and stats["peak_in_use"] == 3
+
+
+def test_equal_priority_only_evicts_idle_links(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(connection_pool.time, "monotonic", lambda: now[0])
+    pool = _pool(2, "probe", "node")
+    assert pool.reserve("probe2") == (False, None)
+
+    now[0] += ConnectionPool.IDLE_TIMEOUT_SECONDS + 1
+    pool.touch("node")
+    assert pool.reserve("probe2") == (True, "probe")
+
+
+def test_no_victim_while_connects_are_pending():
+    pool = ConnectionPool(2, priority=PRIORITIES.__getitem__)
+    assert pool.reserve("redundant") == (True, None)
+    assert pool.reserve("probe") == (True, None)
+    assert pool.reserve("node") == (False, None)
+    # Reserving a held slot again is a no-op.
+    assert pool.reserve("probe") == (True, None)
+    assert pool.stats()["pending"] == 2
+
+
+def test_resize_below_current_use():
+    pool = _pool(3, "node", "node2", "redundant")
+    pool.resize(1)
+    # Existing links are kept until released; new ones only get in by evicting.
+    assert pool.in_use == 3 and pool.utilization == 3.0
+    assert pool.reserve("probe") == (True, "redundant")
+    assert pool.in_use == 3
+
+    pool.release("node2")
+    pool.release("probe")
+    pool.release("missing")
+    assert pool.in_use == 1
+    assert pool.reserve("probe2") == (False, None)
+    pool.resize(0)
+    assert pool.max_slots == 1
@@ -0,0 +1,66 @@
+"""Test the Device Information Service cache."""
+
+import pytest
+
+from custom_components.combustion_custom.combustion_ble import device_info_cache
+from custom_components.combustion_custom.combustion_ble.device_info_cache import (
+    FIRMWARE_REVISION,
+    SERIAL_NUMBER,
+    DeviceInfoCache,
+)
+
+AGE = DeviceInfoCache.MAX_AGE_SECONDS
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(device_info_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_hit_and_miss(clock):
+    cache = DeviceInfoCache()
+    changes = []
+    cache.on_change = lambda: changes.append(True)
+
+    assert cache.get("a", FIRMWARE_REVISION) is None
+    cache.set("a", FIRMWARE_REVISION, "v1.2.3")
+    assert cache.get("a", FIRMWARE_REVISION) == "v1.2.3"
+    # Other fields and addresses are not filled in by one read.
+    assert cache.get("a", SERIAL_NUMBER) is None
+    assert cache.get("b", FIRMWARE_REVISION) is None
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert changes == [True]
+
+
+def test_expired_values_are_revalidated(clock):
+    cache = DeviceInfoCache()
+    cache.set("a", FIRMWARE_REVISION, "v1.2.3")
+    clock[0] += AGE / 2
+    cache.set("a", SERIAL_NUMBER, "10203040")
+
+    clock[0] += AGE / 2 + 1
+    assert cache.get("a", FIRMWARE_REVISION) is None
+    assert cache.get("a", SERIAL_NUMBER) == "10203040"
+
+    # A re-read returning the same value restarts its age without touching other fields.
+    cache.set("a", FIRMWARE_REVISION, "v1.2.3")
+    clock[0] += AGE / 2
+    assert cache.get("a", FIRMWARE_REVISION) == "v1.2.3"
+    assert cache.get("a", SERIAL_NUMBER) is None
+
+
+def test_snapshot_round_trip(clock):
+    cache = DeviceInfoCache()
+    cache.set("a", FIRMWARE_REVISION, "v1.2.3")
+    restored = DeviceInfoCache()
+    restored.load(cache.as_dict())
+    assert restored.get("a", FIRMWARE_REVISION) == "v1.2.3"
+
+    # Malformed entries are skipped.
+    restored.load({"a": {FIRMWARE_REVISION: "v1.0.0", "updated": clock[0]}, "b": None})
+    assert restored.as_dict() == {}
+    clock[0] += AGE + 1
+    restored.load(cache.as_dict())
+    assert restored.get("a", FIRMWARE_REVISION) is None
@@ -0,0 +1,101 @@
+"""Test the streaming food safety calculator."""
+
+import random
+
+import numpy as np
+import pytest
+
+from custom_components.combustion_custom.combustion_ble.ble_data.food_safe_data import (
+    FoodSafeData,
+    FoodSafeMode,
+    IntegratedProduct,
+    Serving,
+)
+from custom_components.combustion_custom.combustion_ble.ble_data.food_safe_state import (
+    FoodSafeState,
+)
+from custom_components.combustion_custom.combustion_ble.ble_data.probe_status import (
+    ProbeStatus,
+)
+from custom_components.combustion_custom.combustion_ble.food_safety import (
+    FoodSafetyCalculator,
+)
+from custom_components.combustion_custom.combustion_ble.log_backfill import decode_log_frames
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedProbe
+from custom_components.combustion_custom.combustion_ble.simulation.frames import probe_response
+from custom_components.combustion_custom.combustion_ble.uart.message_type import MessageType
+
+# Integrated mode, ground chicken: threshold 62.8 C, z 5.4 C, Tref 60 C, D 229.7 s, 7 logs.
+FOOD_SAFE_RAW = bytes.fromhex("0468f912c00d84e82021")[::-1]
+SAMPLE_PERIOD = 5.0
+
+
+def batch_log_reduction(
+    sequence_numbers: np.ndarray, temperatures: np.ndarray, data: FoodSafeData
+) -> tuple[float, float]:
+    """Whole-log reference: trapezoids over adjacent sequence numbers, vectorized."""
+    order = np.argsort(sequence_numbers)
+    sequence_numbers, temperatures = sequence_numbers[order], temperatures[order]
+    threshold = data.selected_threshold_reference_temperature
+    above = temperatures >= threshold
+    rates = np.where(
+        above, 10.0 ** ((temperatures - data.reference_temperature) / data.z_value), 0.0
+    ) / data.d_value_at_rt
+    adjacent = np.diff(sequence_numbers) == 1
+    log_reduction = np.sum((rates[:-1] + rates[1:])[adjacent]) * SAMPLE_PERIOD / 2
+    seconds_above = np.count_nonzero(adjacent & above[:-1] & above[1:]) * SAMPLE_PERIOD
+    return float(log_reduction), float(seconds_above)
+
+
+def test_decodes_food_safe_data_from_status():
+    status = ProbeStatus.from_data(bytes(8) + bytes(13) + bytes(9) + FOOD_SAFE_RAW)
+    data = status.food_safe_data
+    assert data.food_safe_mode == FoodSafeMode.INTEGRATED
+    assert data.product == IntegratedProduct.CHICKEN_GROUND
+    assert data.serving == Serving.COOKED_AND_CHILLED
+    assert data.d_value_at_rt == pytest.approx(229.7)
+    assert data.target_log_reduction == pytest.approx(7.0)
+    # Older firmware sends no food safe block.
+    assert ProbeStatus.from_data(bytes(30)).food_safe_data is None
+
+
+def test_out_of_order_matches_batch():
+    rng = random.Random(5)
+    probe = SimulatedProbe("C0:FF:EE:00:00:01", 0x51000001, rng)
+    probe.heating_rates[0] = 1 / 3600
+    probe.oven_temperature = 75.0
+    frames = [
+        probe_response(MessageType.LOG, probe.log_payload(sequence)) for sequence in range(3000)
+    ]
+    batch = decode_log_frames(frames, from_node=False)
+    data = FoodSafeData.from_raw(FOOD_SAFE_RAW)
+
+    rows = list(batch.rows())
+    rng.shuffle(rows)
+    # A few records never arrive.
+    missing = set(rows[:20])
+    calculator = FoodSafetyCalculator(data, session_id=1)
+    calculator.add_many(
+        (batch.sequence_numbers[row], batch.core_temperature(row))
+        for row in rows
+        if row not in missing
+    )
+
+    kept = [row for row in range(len(batch)) if row not in missing]
+    log_reduction, seconds_above = batch_log_reduction(
+        np.array([batch.sequence_numbers[row] for row in kept]),
+        np.array([batch.core_temperature(row) for row in kept]),
+        data,
+    )
+    assert log_reduction > data.target_log_reduction
+    assert calculator.log_reduction == pytest.approx(log_reduction, rel=1e-9)
+    assert calculator.seconds_above_threshold == seconds_above
+    status = calculator.status
+    assert status.state == FoodSafeState.SAFE
+    assert status.sequence_number == max(batch.sequence_numbers[row] for row in kept)
+
+    # New parameters re-integrate what has been seen.
+    slower = FoodSafeData.from_raw(FOOD_SAFE_RAW)
+    slower.d_value_at_rt *= 10
+    calculator.food_safe_data = slower
+    assert calculator.log_reduction == pytest.approx(log_reduction / 10, rel=1e-9)
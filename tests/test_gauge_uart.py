@@ -0,0 +1,110 @@
+"""Test Gauge Status and Gauge log streaming over MeatNet UART."""
+
+import random
+
+import pytest
+
+from custom_components.combustion_custom.combustion_ble.ble_data.hop_count import HopCount
+from custom_components.combustion_custom.combustion_ble.devices.meat_net_node import MeatNetNode
+from custom_components.combustion_custom.combustion_ble.gauge_log import GaugeTemperatureLog
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedNode
+from custom_components.combustion_custom.combustion_ble.uart import SessionInformation
+from custom_components.combustion_custom.combustion_ble.uart.meatnet import (
+    NodeGaugeStatusRequest,
+    NodeReadGaugeLogsResponse,
+)
+from custom_components.combustion_custom.combustion_ble.uart.meatnet.node_request_from_data import (
+    node_request_from_data,
+)
+from custom_components.combustion_custom.combustion_ble.uart.meatnet.node_response_from_data import (
+    node_response_from_data,
+)
+
+from .test_simulation import FAST, wait_for
+
+
+def test_decodes_gauge_messages():
+    gauge = SimulatedNode("C0:FF:EE:00:00:01", "SIMG000000", random.Random(1), is_gauge=True)
+    gauge.started -= 3600
+
+    request = node_request_from_data(gauge.gauge_status_request())
+    assert isinstance(request, NodeGaugeStatusRequest)
+    assert request.serial_number == "SIMG000000"
+    assert request.hop_count == HopCount.HOP1
+    status = request.gauge_status
+    assert status.session_information.session_id == gauge.gauge_session_id
+    assert status.session_information.sample_period == gauge.GAUGE_SAMPLE_PERIOD_MS
+    assert status.sensor_present and not status.low_battery
+    assert status.max_sequence_number == gauge.gauge_max_sequence_number
+    expected = gauge.gauge_temperature_at(gauge.elapsed)
+    assert status.temperature_c == pytest.approx(expected, abs=0.1)
+
+    frame = gauge.handle_uart(
+        bytes(4)
+        + bytes([0x62])
+        + bytes(4)
+        + bytes([18])
+        + b"SIMG000000"
+        + (7).to_bytes(4, "little")
+        + (7).to_bytes(4, "little")
+    )[0]
+    response = node_response_from_data(frame)
+    assert isinstance(response, NodeReadGaugeLogsResponse)
+    assert response.gauge_serial_number == "SIMG000000"
+    assert response.sequence_number == 7
+    assert response.temperature_c == pytest.approx(gauge.gauge_temperature_at(35.0), abs=0.1)
+
+
+def test_log_accepts_records_in_any_order():
+    log = GaugeTemperatureLog(SessionInformation(1, 5000))
+    assert log.missing_range(0, 9) == (0, 9)
+    for sequence in (5, 6, 9, 2):
+        assert log.add(sequence, 400 + sequence)
+    assert not log.add(6, 0)
+    assert len(log) == 4 and 2 in log and 3 not in log
+    assert log.missing_range(0, 9) == (0, 8)
+    assert log.missing_range(5, 6) is None
+
+    for sequence in (0, 1, 3, 4, 7, 8):
+        log.add(sequence, 400 + sequence)
+    assert log.missing_range(0, 9) is None
+    assert log.missing_range(0, 12) == (10, 12)
+    assert [sequence for sequence, _ in log.readings()] == list(range(10))
+    assert log.temperature(3) == pytest.approx(403 * 0.1 - 20.0)
+
+
+def test_log_anchored_at_min_sequence_takes_newest_first_backfill():
+    log = GaugeTemperatureLog(SessionInformation(1, 5000), first_sequence=100)
+    assert log.missing_range(100, 1099) == (100, 1099)
+    buffer = log._raw
+    for sequence in range(1099, 99, -1):
+        assert log.add(sequence, 400)
+    log.add(1100, 400)
+    # Only ever extended at the end; nothing was rebuilt in front.
+    assert log._raw is buffer and log.first_sequence == 100
+    assert len(log) == 1001 and log._contiguous == 1001
+    assert log.missing_range(100, 1100) is None
+
+
+async def test_gauge_log_streams_from_simulated_gauge(device_manager):
+    fleet = device_manager.start_simulation(
+        probes=0, nodes=0, gauges=1, **{**FAST, "time_scale": 600.0}
+    )
+    simulated = fleet.nodes[0]
+
+    def gauge():
+        return device_manager.find_gauge_by_serial_number(simulated.serial_number)
+
+    assert await wait_for(lambda: isinstance(gauge(), MeatNetNode) and gauge().gauge_log)
+    assert await wait_for(lambda: len(gauge().gauge_log) > 50)
+
+    node = gauge()
+    log = node.gauge_log
+    assert log.id == simulated.gauge_session_id
+    assert node.gauge_hop_count == HopCount.HOP1
+    # Everything up to the last status the Gauge reported eventually arrives.
+    assert await wait_for(lambda: log.missing_range(0, node.gauge_max_sequence_number - 1) is None)
+    for sequence, temperature in log.readings():
+        elapsed = sequence * simulated.GAUGE_SAMPLE_PERIOD_MS / 1000
+        expected = simulated.gauge_temperature_at(elapsed)
+        assert temperature == pytest.approx(expected, abs=0.1)
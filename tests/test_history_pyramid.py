@@ -0,0 +1,70 @@
+"""Test the multi-resolution history kept alongside probe temperature logs."""
+
+from datetime import timedelta
+import random
+
+import pytest
+
+from custom_components.combustion_custom.combustion_ble.history_pyramid import HistoryPyramid
+from custom_components.combustion_custom.combustion_ble.log_backfill import decode_log_frames
+from custom_components.combustion_custom.combustion_ble.probe_temperature_log import (
+    ProbeTemperatureLog,
+)
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedProbe
+from custom_components.combustion_custom.combustion_ble.simulation.frames import probe_response
+from custom_components.combustion_custom.combustion_ble.uart import SessionInformation
+from custom_components.combustion_custom.combustion_ble.uart.message_type import MessageType
+
+
+def brute_force(values: dict[int, float], first: int, samples: int):
+    covered = [values[s] for s in range(first, first + samples) if s in values]
+    return min(covered), max(covered), sum(covered) / len(covered)
+
+
+@pytest.mark.parametrize("resolution", [0, 20, 60, 120, 300, 900, 1800, 7200])
+def test_query_matches_brute_force(resolution):
+    rng = random.Random(resolution)
+    values = {sequence: rng.uniform(0.0, 100.0) for sequence in range(5000)}
+    # A few records never arrive and the rest arrive out of order.
+    for sequence in rng.sample(sorted(values), 50):
+        del values[sequence]
+    pyramid = HistoryPyramid(5000)
+    order = list(values.items())
+    rng.shuffle(order)
+    for sequence, value in order:
+        assert pyramid.add(sequence, value)
+    assert not pyramid.add(order[0][0], 0.0)
+    assert len(pyramid) == len(values)
+
+    points = pyramid.query(1234, 4321, resolution)
+    assert points[0].sequence_number <= 1234 < points[0].sequence_number + points[0].samples
+    assert points[-1].sequence_number <= 4321 < points[-1].sequence_number + points[-1].samples
+    assert len(points) <= (4321 - 1234) // max(1, resolution // 5) + 2
+    for point in points:
+        assert point.samples * 5 <= max(resolution, 5) * 2
+        assert (point.minimum, point.maximum, point.mean) == pytest.approx(
+            brute_force(values, point.sequence_number, point.samples)
+        )
+
+
+def test_log_maps_time_ranges_to_sequence_numbers():
+    probe = SimulatedProbe("C0:FF:EE:00:00:01", 0x51000001, random.Random(2))
+    frames = [
+        probe_response(MessageType.LOG, probe.log_payload(sequence)) for sequence in range(2000)
+    ]
+    batch = decode_log_frames(frames, from_node=False)
+    log = ProbeTemperatureLog(SessionInformation(1, probe.SAMPLE_PERIOD_MS))
+    log.insert_batch(batch)
+    assert len(log.history) == 2000
+
+    start = log.time_of(600)
+    assert log.sequence_number_at(start + timedelta(seconds=7)) == 601
+    end = start + timedelta(hours=1)
+    points = log.history_in_range(start, end, timedelta(minutes=5))
+    # The end is inclusive, so the bucket starting at `end` is part of the range.
+    assert len(points) == 13
+    time, point = points[0]
+    assert time == start and point.sequence_number == 600 and point.samples == 60
+    core = [batch.core_temperature(row) for row in range(600, 660)]
+    assert point.mean == pytest.approx(sum(core) / len(core))
+    assert point.minimum == min(core) and point.maximum == max(core)
@@ -0,0 +1,74 @@
+"""Test the host-side cook-time estimate."""
+
+import math
+import random
+
+from bleak.backends.device import BLEDevice
+import pytest
+
+from custom_components.combustion_custom.combustion_ble.prediction.local_predictor import (
+    LocalPredictor,
+)
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedProbe
+
+from .test_repeated_advertising import deliver
+
+TARGET = 63.0
+
+
+def time_to(probe: SimulatedProbe, target: float, elapsed: float) -> float:
+    """What a probe tracking the simulated curve exactly would predict."""
+    rate = probe.heating_rates[0]
+    start = math.log(
+        (probe.oven_temperature - probe.start_temperature) / (probe.oven_temperature - target)
+    )
+    return start / rate - elapsed
+
+
+def replay(predictor: LocalPredictor, probe: SimulatedProbe, until: float, rng: random.Random):
+    elapsed = 0.0
+    while elapsed <= until:
+        core = probe.temperatures_at(elapsed)[0] + rng.uniform(-0.05, 0.05)
+        predictor.add(round(core / 0.05) * 0.05, elapsed)
+        elapsed += 1.0
+
+
+def test_tracks_heating_curve():
+    rng = random.Random(3)
+    probe = SimulatedProbe("C0:FF:EE:00:00:01", 0x51000001, rng)
+    predictor = LocalPredictor()
+    halfway = time_to(probe, TARGET, 0.0) / 2
+
+    replay(predictor, probe, 60.0, rng)
+    assert predictor.estimate(TARGET) is None
+
+    predictor.reset()
+    replay(predictor, probe, halfway, rng)
+    estimate = predictor.estimate(TARGET)
+    expected = time_to(probe, TARGET, math.floor(halfway))
+    assert estimate.seconds_remaining == pytest.approx(expected, rel=0.05)
+    assert estimate.plateau_temperature == pytest.approx(probe.oven_temperature, rel=0.1)
+    assert 0.5 < estimate.confidence <= 1.0
+    # Above the fitted plateau the core never gets there.
+    assert predictor.estimate(probe.oven_temperature + 20.0) is None
+
+    # A long gap starts over.
+    predictor.add(20.0, halfway + LocalPredictor.RESET_GAP_SECONDS + 1.0)
+    assert predictor.steps == 0
+
+
+async def test_probe_estimate_from_advertising(device_manager):
+    rng = random.Random(1)
+    simulated = SimulatedProbe("C0:FF:EE:00:00:01", 0x51000001, rng)
+    deliver(BLEDevice(simulated.address, simulated.name, None), simulated.advertising_payload())
+    probe = device_manager.get_probes()[0]
+    assert probe.prediction_info is None
+
+    probe._local_predictor.reset()
+    replay(probe._local_predictor, simulated, time_to(simulated, TARGET, 0.0) / 2, rng)
+    assert probe.local_prediction is None
+
+    device_manager.set_local_prediction_target(TARGET)
+    assert probe.local_prediction.target_temperature == TARGET
+    probe.local_prediction_target = 70.0
+    assert probe.local_prediction.target_temperature == 70.0
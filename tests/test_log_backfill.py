@@ -0,0 +1,64 @@
+"""Test bulk log decoding off the event loop."""
+
+import random
+
+
+from custom_components.combustion_custom.combustion_ble.log_backfill import (
+    LogBackfill,
+    decode_log_frames,
+)
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedProbe
+from custom_components.combustion_custom.combustion_ble.simulation.frames import node_response
+from custom_components.combustion_custom.combustion_ble.uart.meatnet.node_message_type import (
+    NodeMessageType,
+)
+from custom_components.combustion_custom.combustion_ble.uart.meatnet.node_read_logs_response import (
+    NodeReadLogsResponse,
+)
+
+from .test_simulation import FAST, wait_for
+
+
+def test_decodes_node_frames_into_columns():
+    probe = SimulatedProbe("C0:FF:EE:00:00:01", 0x51000001, random.Random(1))
+    serial = probe.serial_number.to_bytes(4, "little")
+    frames = [
+        node_response(
+            NodeMessageType.LOG.value, b"\x00" * 4, sequence, serial + probe.log_payload(sequence)
+        )
+        for sequence in range(10)
+    ]
+    corrupted = bytearray(frames[3])
+    corrupted[-1] ^= 0xFF
+    frames[3] = bytes(corrupted)
+
+    batch = decode_log_frames(frames, from_node=True)
+
+    assert list(batch.sequence_numbers) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert batch.crc_failures == 1
+    assert set(batch.serial_numbers) == {probe.serial_number}
+    # Same values as the per-frame decoder.
+    expected = NodeReadLogsResponse.from_raw(frames[5], True, 0, 5, frames[5][14])
+    row = batch.data_point(4)
+    assert row.sequence_num == 5
+    assert row.temperatures.values == expected.temperatures.values
+    assert row.estimated_core_temperature == expected.prediction_log.estimated_core_temperature
+
+
+async def test_backfill_through_node(device_manager, monkeypatch):
+    monkeypatch.setattr(LogBackfill, "BATCH_FRAMES", 64)
+    options = {**FAST, "time_scale": 3000.0}
+    device_manager.start_simulation(probes=1, nodes=1, **options)
+    metrics = device_manager.metrics
+    frames = metrics.log_backfill_frames.value
+
+    def caught_up():
+        probes = device_manager.get_probes()
+        if not probes or not probes[0]._temperature_logs:
+            return False
+        log = probes[0]._temperature_logs[0]
+        return len(log.data_points_dict) >= 500 and log.missing_range(0, 499) is None
+
+    assert await wait_for(caught_up)
+    assert metrics.log_backfill_frames.value - frames >= LogBackfill.BULK_THRESHOLD
+    assert metrics.log_backfill_batch_size.count > 0
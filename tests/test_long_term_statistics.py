@@ -0,0 +1,76 @@
+"""Test hourly statistics built from probe session logs."""
+
+from datetime import timezone
+import random
+
+import pytest
+
+from custom_components.combustion_custom.combustion_ble.log_backfill import decode_log_frames
+from custom_components.combustion_custom.combustion_ble.long_term_statistics import (
+    HOUR,
+    hourly_statistics,
+)
+from custom_components.combustion_custom.combustion_ble.probe_temperature_log import (
+    ProbeTemperatureLog,
+)
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedProbe
+from custom_components.combustion_custom.combustion_ble.simulation.frames import probe_response
+from custom_components.combustion_custom.combustion_ble.uart import SessionInformation
+from custom_components.combustion_custom.combustion_ble.uart.message_type import MessageType
+
+# Three and a half hours of 5 s records.
+RECORDS = 2520
+
+
+def test_aggregate_matches_brute_force():
+    rng = random.Random(9)
+    log = ProbeTemperatureLog(SessionInformation(1, 5000))
+    values = {s: rng.uniform(0.0, 100.0) for s in range(3000) if rng.random() > 0.1}
+    for sequence, value in values.items():
+        log.history.add(sequence, value)
+    for first, last in [(0, 2999), (7, 7), (13, 2011), (359, 1081), (3000, 4000)]:
+        covered = [values[s] for s in range(first, last + 1) if s in values]
+        point = log.history.aggregate(first, last)
+        if not covered:
+            assert point is None
+            continue
+        assert (point.minimum, point.maximum, point.mean) == pytest.approx(
+            (min(covered), max(covered), sum(covered) / len(covered))
+        )
+
+
+def test_finished_hours_only():
+    probe = SimulatedProbe("C0:FF:EE:00:00:01", 0x51000001, random.Random(4))
+    frames = [
+        probe_response(MessageType.LOG, probe.log_payload(sequence)) for sequence in range(RECORDS)
+    ]
+    batch = decode_log_frames(frames, from_node=False)
+    log = ProbeTemperatureLog(SessionInformation(1, probe.SAMPLE_PERIOD_MS))
+    log.insert_batch(batch)
+    # Every inserted record is waiting to be imported, and taking the range clears it.
+    assert log.take_statistics_pending() == (0, RECORDS - 1)
+    assert log.take_statistics_pending() is None
+
+    statistics, unfinished = hourly_statistics(log, 0, RECORDS - 1)
+    assert 3 <= len(statistics) <= 4
+    for statistic in statistics:
+        assert statistic.start.tzinfo == timezone.utc
+        assert statistic.start.minute == statistic.start.second == 0
+        end = statistic.start + HOUR
+        core = [
+            batch.core_temperature(row)
+            for row in range(RECORDS)
+            if statistic.start <= log.time_of(row).astimezone(timezone.utc) < end
+        ]
+        assert statistic.minimum == min(core) and statistic.maximum == max(core)
+        assert statistic.mean == pytest.approx(sum(core) / len(core))
+    # The hour the newest record falls in is left for a later run.
+    newest = log.time_of(RECORDS - 1).astimezone(timezone.utc)
+    assert statistics[-1].start + HOUR <= newest
+    assert log.time_of(unfinished).astimezone(timezone.utc) >= statistics[-1].start + HOUR
+
+    # A later range only re-imports the hours it touches.
+    statistics, unfinished = hourly_statistics(log, 800, 900)
+    assert len(statistics) in (1, 2)
+    assert unfinished is None
+    assert statistics[0].start <= log.time_of(800).astimezone(timezone.utc)
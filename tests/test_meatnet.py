@@ -0,0 +1,73 @@
+"""Test MeatNetManager against Home Assistant's Bluetooth integration."""
+
+import random
+import time
+
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+from homeassistant.components.bluetooth.api import _get_manager
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.combustion_custom.combustion_ble.ble_manager import BleManager
+from custom_components.combustion_custom.combustion_ble.const import BT_MANUFACTURER_ID
+from custom_components.combustion_custom.combustion_ble.device_manager import DeviceManager
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedProbe
+from custom_components.combustion_custom.const import DOMAIN
+
+PROBE = BLEDevice("C0:FF:EE:00:00:01", "CP", None)
+
+
+def _inject(hass, device: BLEDevice, payload: bytes, source: str, connectable: bool) -> None:
+    """Deliver an advertisement the way a scanner does (as HA's own test helpers do)."""
+    advertisement = AdvertisementData(
+        local_name=device.name,
+        manufacturer_data={BT_MANUFACTURER_ID: payload},
+        service_data={},
+        service_uuids=[],
+        tx_power=None,
+        rssi=-60,
+        platform_data=(),
+    )
+    _get_manager(hass).scanner_adv_received(
+        BluetoothServiceInfoBleak(
+            name=device.name,
+            address=device.address,
+            rssi=advertisement.rssi,
+            manufacturer_data=advertisement.manufacturer_data,
+            service_data={},
+            service_uuids=[],
+            source=source,
+            device=device,
+            advertisement=advertisement,
+            connectable=connectable,
+            time=time.monotonic(),
+            tx_power=None,
+        )
+    )
+
+
+async def test_advertisements_from_ha_bluetooth_add_devices(hass):
+    assert await async_setup_component(hass, "bluetooth", {})
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    mgr = hass.data[DOMAIN]["mgr"]
+    try:
+        simulated = SimulatedProbe(PROBE.address, 0x51000001, random.Random(1))
+        _inject(hass, PROBE, simulated.advertising_payload(), "hci0", connectable=True)
+        await hass.async_block_till_done()
+
+        probe = mgr.deviceManager.find_probe_by_serial_number(simulated.serial_number)
+        assert probe is not None
+        assert probe.unique_identifier in mgr.devices
+        # Connections go through whichever HA scanner can reach the device.
+        assert BleManager.shared._resolve_ble_device(PROBE.address) is PROBE
+        assert "hci0" in BleManager.shared.adapters
+    finally:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        DeviceManager.shared = None
+        BleManager.shared.delegate = None
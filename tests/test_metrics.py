@@ -0,0 +1,23 @@
+"""Test pipeline metric rates."""
+
+import pytest
+
+from custom_components.combustion_custom.combustion_ble.metrics import Counter, Metrics
+
+
+def test_rate_is_read_only_over_a_trailing_window():
+    counter = Counter()
+    start = counter._samples[0][0]
+    for second in range(1, 31):
+        # 10 events per second for 20 s, then 2 per second.
+        counter.inc(10 if second <= 20 else 2)
+        counter.sample(start + second)
+        assert counter.rate() == counter.rate()
+    assert counter.rate() == pytest.approx(2.0)
+
+    # Every consumer reads the same value, however often they ask.
+    metrics = Metrics()
+    metrics.note_advertisement("a", 1)
+    metrics.sample_rates(metrics.advertisements._samples[0][0] + 1)
+    rates = {metrics.snapshot()["advertisements"]["per_second"] for _ in range(3)}
+    assert rates == {metrics.advertisements.rate()} == {1.0}
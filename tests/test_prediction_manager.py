@@ -0,0 +1,70 @@
+"""Test the linearized prediction countdown."""
+
+import asyncio
+
+import pytest
+
+from custom_components.combustion_custom.combustion_ble.ble_data.prediction_mode import (
+    PredictionMode,
+)
+from custom_components.combustion_custom.combustion_ble.ble_data.prediction_state import (
+    PredictionState,
+)
+from custom_components.combustion_custom.combustion_ble.ble_data.prediction_status import (
+    PredictionStatus,
+)
+from custom_components.combustion_custom.combustion_ble.ble_data.prediction_type import (
+    PredictionType,
+)
+from custom_components.combustion_custom.combustion_ble.prediction.prediction_info import (
+    LinearCountdown,
+)
+from custom_components.combustion_custom.combustion_ble.prediction.prediction_manager import (
+    PredictionManager,
+)
+
+
+def status(seconds: float) -> PredictionStatus:
+    return PredictionStatus(
+        PredictionState.PREDICTING,
+        PredictionMode.TIME_TO_REMOVAL,
+        PredictionType.REMOVAL,
+        63.0,
+        5.0,
+        seconds,
+        55.0,
+    )
+
+
+def test_countdown_is_closed_form():
+    countdown = LinearCountdown(4500.0, 1.0, hold_after=15.0, anchor=100.0)
+    assert countdown.seconds(now=100.0) == 5
+    assert countdown.seconds(now=101.0) == 4
+    assert countdown.seconds_until_change(now=101.0) == pytest.approx(0.501)
+    # Never below zero, and frozen after hold_after.
+    assert countdown.milliseconds(now=200.0) == 0.0
+    assert countdown.seconds_until_change(now=116.0) is None
+
+    rising = LinearCountdown(4500.0, -0.5, hold_after=15.0, anchor=0.0)
+    assert rising.seconds(now=2.0) == 6
+    assert rising.seconds_until_change(now=0.0) == pytest.approx(1.002)
+
+
+async def test_publishes_once_per_second_unless_asked_for_more():
+    manager = PredictionManager()
+    published = []
+    manager.add_update_listener(lambda info: published.append(info.seconds_remaining))
+
+    await manager.update_prediction_status(status(120), sequence_number=10)
+    info = manager.previous_prediction_info
+    assert published == [120]
+    await asyncio.sleep(1.1)
+    # One republish when 120 ticked over to 119, not one per 200 ms.
+    assert published == [120, 119]
+    assert info.seconds_remaining == 119
+
+    manager.high_rate_listeners += 1
+    await manager.update_prediction_status(status(115), sequence_number=11)
+    await asyncio.sleep(0.5)
+    assert len(published) >= 4
+    manager.stop()
@@ -0,0 +1,29 @@
+"""Test the on-demand profiling service."""
+
+import cProfile
+
+import pytest
+from homeassistant.setup import async_setup_component
+
+from custom_components.combustion_custom.const import DOMAIN, SERVICE_PROFILE
+
+
+async def test_profile_recovers_when_enable_fails(hass, monkeypatch, tmp_path):
+    hass.config.config_dir = str(tmp_path)
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    def enable(self):
+        raise ValueError("Another profiling tool is already active")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(cProfile.Profile, "enable", enable)
+        with pytest.raises(ValueError):
+            await hass.services.async_call(
+                DOMAIN, SERVICE_PROFILE, {"duration": 1}, blocking=True, return_response=True
+            )
+
+    report = await hass.services.async_call(
+        DOMAIN, SERVICE_PROFILE, {"duration": 1}, blocking=True, return_response=True
+    )
+    assert report["duration_seconds"] == 1.0
+    assert (tmp_path / report["files"]["report"]).exists()
@@ -0,0 +1,66 @@
+"""Test that node copies of probe advertisements are filtered before decoding."""
+
+import random
+
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from custom_components.combustion_custom.combustion_ble.ble_data.advertising_data import (
+    CombustionProductType,
+)
+from custom_components.combustion_custom.combustion_ble.ble_data.hop_count import HopCount
+from custom_components.combustion_custom.combustion_ble.ble_data.probe_status import (
+    ProbeStatus,
+)
+from custom_components.combustion_custom.combustion_ble.ble_manager import BleManager
+from custom_components.combustion_custom.combustion_ble.const import BT_MANUFACTURER_ID
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedProbe
+
+NODES = [BLEDevice(f"C0:FF:EE:00:01:{index:02X}", "Timer", None) for index in range(3)]
+
+
+def deliver(node: BLEDevice, payload: bytes, rssi: int = -60) -> None:
+    BleManager.shared.detection_callback(
+        node,
+        AdvertisementData(
+            local_name=node.name,
+            manufacturer_data={BT_MANUFACTURER_ID: payload},
+            service_data={},
+            service_uuids=[],
+            tx_power=None,
+            rssi=rssi,
+            platform_data=(),
+        ),
+    )
+
+
+async def test_drops_copies_the_probe_would_reject(device_manager):
+    simulated = SimulatedProbe("C0:FF:EE:00:00:01", 0x51000001, random.Random(1))
+    dropped = device_manager.metrics.repeated_advertisements_dropped
+    node_product = CombustionProductType.MEAT_NET_NODE
+
+    # Unknown nodes and probes are always decoded.
+    for node in NODES:
+        deliver(node, simulated.advertising_payload(node_product, hop=1))
+    assert dropped.value == 0
+    probe = device_manager.find_probe_by_serial_number(simulated.serial_number)
+    assert probe is not None
+
+    # A status over one hop locks normal mode to that hop count.
+    status = ProbeStatus.from_data(simulated.status_payload())
+    device_manager.update_device_with_node_status(probe.serial_number, status, HopCount.HOP1)
+
+    temperatures = probe.current_temperatures
+    for node in NODES:
+        deliver(node, simulated.advertising_payload(node_product, hop=2), rssi=-40)
+    assert dropped.value == len(NODES)
+    assert probe.current_temperatures is temperatures
+    assert probe._hop_count == HopCount.HOP3
+    for node in NODES:
+        meatnet_node = device_manager.devices[node.address]
+        assert meatnet_node.has_connection_to_probe(probe.serial_number)
+        assert meatnet_node.rssi == -40
+
+    # Copies at the locked hop count are still decoded.
+    deliver(NODES[0], simulated.advertising_payload(node_product, hop=0))
+    assert dropped.value == len(NODES)
@@ -0,0 +1,52 @@
+"""Test the incremental best-RSSI / top-k aggregate."""
+
+import random
+
+from custom_components.combustion_custom.combustion_ble import rssi_tracker
+from custom_components.combustion_custom.combustion_ble.rssi_tracker import RssiTracker
+
+
+def _expected(values: dict[str, int], top_k: int) -> list[int]:
+    return sorted(values.values(), reverse=True)[:top_k]
+
+
+def test_matches_a_full_sort_under_jitter_and_removal():
+    rng = random.Random(7)
+    tracker = RssiTracker(top_k=3)
+    values: dict[str, int] = {}
+    for step in range(5000):
+        key = f"device{rng.randrange(40)}"
+        if step % 50 == 49:
+            tracker.remove(key)
+            values.pop(key, None)
+        else:
+            rssi = values.get(key, rng.randint(-90, -40)) + rng.randint(-3, 3)
+            tracker.update(key, rssi)
+            values[key] = rssi
+
+        top = tracker.top()
+        assert [rssi for _, rssi in top] == _expected(values, 3)
+        assert all(values[key] == rssi for key, rssi in top)
+        assert len(tracker._rest) <= 2 * len(values) + 3
+    assert tracker.best_rssi == max(values.values())
+
+
+def test_weakening_a_retained_entry_does_not_scan_every_key(monkeypatch):
+    tracker = RssiTracker(top_k=2)
+    for index in range(100):
+        tracker.update(f"device{index}", -100 + index // 2)
+
+    def scan(*args, **kwargs):
+        raise AssertionError("full scan")
+
+    monkeypatch.setattr(rssi_tracker.heapq, "nlargest", scan)
+    tracker.update("device99", -52)
+    tracker.update("device99", -51)
+    assert tracker.top() == [("device98", -51), ("device99", -51)]
+    # Below the strongest runner-up (-52), so it swaps places with it.
+    tracker.update("device99", -60)
+    assert [rssi for _, rssi in tracker.top()] == [-51, -52]
+    assert ("device99", -60) not in tracker.top()
+
+    tracker.remove("device98")
+    assert [rssi for _, rssi in tracker.top()] == [-52, -52]
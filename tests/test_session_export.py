@@ -0,0 +1,94 @@
+"""Test streaming a probe session to CSV and NDJSON."""
+
+import csv
+import io
+import json
+import random
+import tracemalloc
+
+from custom_components.combustion_custom.combustion_ble.log_backfill import decode_log_frames
+from custom_components.combustion_custom.combustion_ble.probe_temperature_log import (
+    ProbeTemperatureLog,
+)
+from custom_components.combustion_custom.combustion_ble.session_export import (
+    COLUMNS,
+    FORMAT_CSV,
+    FORMAT_NDJSON,
+    sequence_range,
+    write_session,
+)
+from custom_components.combustion_custom.combustion_ble.simulation import SimulatedProbe
+from custom_components.combustion_custom.combustion_ble.simulation.frames import probe_response
+from custom_components.combustion_custom.combustion_ble.uart import SessionInformation
+from custom_components.combustion_custom.combustion_ble.uart.message_type import MessageType
+
+
+def _log(records: int) -> tuple[ProbeTemperatureLog, object]:
+    probe = SimulatedProbe("C0:FF:EE:00:00:01", 0x51000001, random.Random(3))
+    frames = [
+        probe_response(MessageType.LOG, probe.log_payload(sequence))
+        for sequence in range(records)
+    ]
+    batch = decode_log_frames(frames, from_node=False)
+    log = ProbeTemperatureLog(SessionInformation(1, probe.SAMPLE_PERIOD_MS))
+    log.insert_batch(batch)
+    return log, batch
+
+
+class _CountingFile:
+    """Discards what is written, keeping only totals."""
+
+    def __init__(self):
+        self.writes = 0
+        self.characters = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        self.characters += len(text)
+        return len(text)
+
+
+def test_csv_and_ndjson_match_the_log():
+    log, batch = _log(500)
+    # A gap in the middle is skipped, not filled.
+    for sequence in range(100, 110):
+        del log.data_points_dict[sequence]
+
+    csv_file = io.StringIO()
+    assert write_session(log, csv_file, FORMAT_CSV) == 490
+    rows = list(csv.DictReader(io.StringIO(csv_file.getvalue())))
+    assert tuple(rows[0]) == COLUMNS
+    assert len(rows) == 490
+    assert rows[100]["sequence_number"] == "110"
+    assert float(rows[0]["t1"]) == batch.temperatures[0]
+    assert float(rows[0]["core_temperature"]) == batch.core_temperature(0)
+
+    ndjson_file = io.StringIO()
+    assert write_session(log, ndjson_file, FORMAT_NDJSON, 200, 299) == 100
+    records = [json.loads(line) for line in ndjson_file.getvalue().splitlines()]
+    assert [record["sequence_number"] for record in records] == list(range(200, 300))
+    assert records[0]["core_temperature"] == batch.core_temperature(200)
+    assert records[0]["time"] == log.time_of(200).astimezone().isoformat()
+    assert records[0]["virtual_core"] == batch.data_point(200).virtual_core.name
+
+
+def _export_peak(records: int) -> tuple[int, _CountingFile]:
+    log, _ = _log(records)
+    first, last = sequence_range(log)
+    file = _CountingFile()
+    tracemalloc.start()
+    try:
+        assert write_session(log, file, FORMAT_NDJSON, first, last) == records
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, file
+
+
+def test_memory_does_not_grow_with_the_log():
+    small_peak, _ = _export_peak(5000)
+    peak, file = _export_peak(20000)
+    assert file.writes == 20
+    # Four times the records, the same single chunk of lines held at a time.
+    assert peak < small_peak * 1.5
+    assert peak < file.characters / 5
@@ -0,0 +1,67 @@
+"""Test the simulated fleet against the real DeviceManager pipeline."""
+
+import asyncio
+
+
+from custom_components.combustion_custom.combustion_ble.ble_manager import BleManager
+from custom_components.combustion_custom.combustion_ble.devices.device import Device
+from custom_components.combustion_custom.combustion_ble.devices.meat_net_node import (
+    MeatNetNode,
+)
+
+FAST = {
+    "advertising_interval": 0.05,
+    "status_interval": 0.1,
+    "heartbeat_interval": 0.2,
+    "response_latency": 0.0,
+    "connect_latency": 0.0,
+    "time_scale": 60.0,
+    "seed": 1,
+}
+
+
+async def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+        await asyncio.sleep(0.05)
+    return True
+
+
+async def test_fleet_is_discovered_through_nodes(device_manager):
+    fleet = device_manager.start_simulation(probes=4, nodes=2, gauges=1, **FAST)
+
+    def nodes():
+        return [d for d in device_manager.devices.values() if isinstance(d, MeatNetNode)]
+
+    assert await wait_for(lambda: len(device_manager.get_probes()) == 4 and len(nodes()) == 3)
+    assert await wait_for(
+        lambda: all(n.connection_state == Device.ConnectionState.CONNECTED for n in nodes())
+    )
+    assert await wait_for(lambda: any(n.is_gauge for n in nodes()))
+
+    # Status, session info and logs arrive over the node links.
+    assert await wait_for(
+        lambda: all(
+            probe._session_information is not None and probe._max_sequence_number
+            for probe in device_manager.get_probes()
+        )
+    )
+    assert fleet.stats()["connected"] >= 3
+    assert device_manager.metrics.crc_failures.value == 0
+
+
+async def test_add_simulated_probe(device_manager):
+    simulated = device_manager.add_simulated_probe()
+    assert device_manager.simulated_fleet is not None
+
+    assert await wait_for(
+        lambda: (probe := device_manager.find_probe_by_serial_number(simulated.serial_number))
+        and probe.connection_state == Device.ConnectionState.CONNECTED
+        and probe.firmware_version == "v1.4.3-sim"
+    )
+
+    await device_manager.stop_simulation()
+    assert BleManager.shared.client_factory is None
+    assert not simulated.clients
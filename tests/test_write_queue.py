@@ -0,0 +1,128 @@
+"""Test serialized, coalescing UART writes."""
+
+import asyncio
+
+from bleak import BleakError
+import pytest
+
+from custom_components.combustion_custom.combustion_ble.uart.meatnet.node_read_logs_request import (
+    NodeReadLogsRequest,
+)
+from custom_components.combustion_custom.combustion_ble.uart.session_info import (
+    SessionInfoRequest,
+)
+from custom_components.combustion_custom.combustion_ble.write_queue import LinkWriteQueue
+
+
+class _RecordingClient:
+    """Records every Write Command and how many were in flight at once."""
+
+    def __init__(self, mtu_size: int = 23) -> None:
+        self.mtu_size = mtu_size
+        self.is_connected = True
+        self.writes: list[bytes] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def write_gatt_char(self, characteristic, data: bytes, response: bool) -> None:
+        assert response is False
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.writes.append(bytes(data))
+        self.in_flight -= 1
+
+
+class _FailingClient(_RecordingClient):
+    """Fails the first write with `error`."""
+
+    def __init__(self, error: Exception) -> None:
+        super().__init__()
+        self.error = error
+
+    async def write_gatt_char(self, characteristic, data: bytes, response: bool) -> None:
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        await super().write_gatt_char(characteristic, data, response)
+
+
+async def _drained(queue: LinkWriteQueue) -> None:
+    while queue._drain_task is not None and not queue._drain_task.done():
+        await queue._drain_task
+
+
+def _frame(index: int, size: int) -> bytes:
+    return bytes([index]) * size
+
+
+async def test_writes_one_at_a_time_in_order():
+    client = _RecordingClient()
+    queue = LinkWriteQueue("a", client, None)
+    # Frames too large to share a write go out one per write.
+    frames = [_frame(index, 12) for index in range(5)]
+    for frame in frames:
+        assert queue.enqueue(frame)
+        await asyncio.sleep(0)
+    await _drained(queue)
+    assert client.writes == frames
+    assert client.max_in_flight == 1
+    assert queue.stats()["writes"] == 5
+
+
+async def test_coalesces_up_to_mtu_minus_header():
+    client = _RecordingClient(mtu_size=23)
+    queue = LinkWriteQueue("a", client, None)
+    frames = [_frame(index, 6) for index in range(5)]
+    for frame in frames:
+        queue.enqueue(frame)
+    await _drained(queue)
+    # 20 byte writes: three 6 byte frames fit, the fourth would not.
+    assert client.writes == [b"".join(frames[:3]), b"".join(frames[3:])]
+    assert queue.frames_sent == 5 and queue.writes == 2
+
+    client = _RecordingClient(mtu_size=247)
+    queue = LinkWriteQueue("a", client, None)
+    for frame in frames:
+        queue.enqueue(frame)
+    await _drained(queue)
+    assert client.writes == [b"".join(frames)]
+    assert len(client.writes[0]) <= 247 - 3
+
+
+async def test_drops_requests_already_waiting():
+    client = _RecordingClient()
+    queue = LinkWriteQueue("a", client, None)
+
+    first = NodeReadLogsRequest(0x10203040, 0, 10)
+    again = NodeReadLogsRequest(0x10203040, 0, 10)
+    other = NodeReadLogsRequest(0x10203040, 11, 20)
+    # Node requests carry a random request ID, so only the header type and payload are compared.
+    assert first.data != again.data and first.dedupe_key == again.dedupe_key
+    assert first.dedupe_key == bytes(first.data[4:5] + first.data[9:])
+    assert queue.enqueue(first.data, key=first.dedupe_key)
+    assert not queue.enqueue(again.data, key=again.dedupe_key)
+    assert queue.enqueue(other.data, key=other.dedupe_key)
+
+    session_info = SessionInfoRequest()
+    assert queue.enqueue(session_info.data, key=session_info.dedupe_key)
+    assert not queue.enqueue(SessionInfoRequest().data, key=session_info.dedupe_key)
+    assert queue.duplicates_dropped == 2
+
+    await _drained(queue)
+    assert b"".join(client.writes) == bytes(first.data + other.data + session_info.data)
+    # Once sent, the same request may be queued again.
+    assert queue.enqueue(again.data, key=again.dedupe_key)
+    queue.close()
+
+
+@pytest.mark.parametrize("error", [BleakError("gone"), TimeoutError(), EOFError()])
+async def test_keeps_draining_after_a_failed_write(error):
+    client = _FailingClient(error)
+    queue = LinkWriteQueue("a", client, None)
+    frames = [_frame(index, 12) for index in range(3)]
+    for frame in frames:
+        queue.enqueue(frame)
+    await _drained(queue)
+    assert client.writes == frames[1:]
+    assert queue.errors == 1 and queue.stats()["depth"] == 0